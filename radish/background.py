@@ -11,6 +11,8 @@ class Background(Scenario):
     Represents a Background
     """
 
+    __slots__ = ()
+
     def __init__(self, keyword, sentence, path, line, parent):
         super().__init__(None, keyword, sentence, path, line, parent)
 
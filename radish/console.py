@@ -0,0 +1,146 @@
+"""
+This module provides the sinks for the console output of a run
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from threading import Lock, Timer
+
+
+def is_terminal(stream):
+    """
+    Returns whether the given stream writes to a terminal
+
+    :param stream: the stream to check
+    """
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class ConsoleSink:
+    """
+    Represents a buffered stream for the console output of a run
+
+    The written text is collected and written to the wrapped stream at once
+    as soon as the buffer is full or the flush interval has passed since the
+    text was buffered, even if nothing else is written in the meantime.
+    The output for a terminal is flushed after every line to keep it interactive.
+
+    The wrapped stream can be any text stream, e.g. the console or a file.
+    """
+
+    #: Holds the default amount of characters which are buffered until the buffer is flushed
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+    #: Holds the default amount of seconds after which buffered text is flushed
+    DEFAULT_FLUSH_INTERVAL = 0.5
+
+    def __init__(self, stream, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.line_buffering = is_terminal(stream)
+        self._buffer = []
+        self._buffered = 0
+        self._timer = None
+        self._lock = Lock()
+        self._pid = os.getpid()
+
+    def write(self, text):
+        """
+        Writes the given text to the buffer
+
+        :param str text: the text to write
+        """
+        with self._lock:
+            self._adopt_fork()
+            self._buffer.append(text)
+            self._buffered += len(text)
+            if self._buffered >= self.buffer_size or (self.line_buffering and "\n" in text):
+                self._flush()
+            elif self._timer is None:
+                # flush the buffered text after the interval even if a step runs for a long time
+                self._timer = Timer(self.flush_interval, self._flush_buffered)
+                self._timer.daemon = True
+                self._timer.start()
+        return len(text)
+
+    def flush(self):
+        """
+        Writes the buffered text to the wrapped stream
+        """
+        with self._lock:
+            self._adopt_fork()
+            self._flush()
+
+    def isatty(self):
+        return self.line_buffering
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+        self.stream.flush()
+
+    def _flush_buffered(self):
+        """
+        Flushes the buffered text once the flush interval has passed
+        """
+        with self._lock:
+            if self._pid == os.getpid() and self._buffer:
+                self._flush()
+
+    def _adopt_fork(self):
+        """
+        Drops the buffered text of the parent process in a forked worker process
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._buffer = []
+            self._buffered = 0
+            # the timer thread of the parent process does not exist in the forked process
+            self._timer = None
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class NullSink:
+    """
+    Represents a stream which discards the console output of a run
+    """
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+@contextmanager
+def redirect_console(sink):
+    """
+    Writes all console output to the given sink while the context is active
+
+    The sink is flushed when the context is left.
+
+    :param sink: the sink to write the console output to, e.g. a ConsoleSink or a NullSink
+    """
+    original_stdout = sys.stdout
+    sys.stdout = sink
+    try:
+        yield sink
+    finally:
+        try:
+            sink.flush()
+        finally:
+            sys.stdout = original_stdout
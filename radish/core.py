@@ -2,6 +2,8 @@
 Providing radish core functionality.
 """
 
+import multiprocessing
+import os
 from collections import OrderedDict
 from threading import Lock
 
@@ -32,15 +34,43 @@ class Configuration:
             setattr(self, config_key, value)
 
 
+def _parse_in_worker(task):
+    """
+    Parses the given feature file in a worker process
+
+    :param tuple task: the feature file, its feature id, the tag expression and the parse cache or None
+
+    :returns: all parsed features and the feature of the feature file or None if the parsing failed
+    :rtype: tuple
+    """
+    featurefile, featureid, tag_expr, parse_cache = task
+    core = Core(parse_cache=parse_cache)
+    try:
+        if parse_cache is None:
+            feature = core.parse_feature(featurefile, tag_expr, featureid=featureid)
+        else:
+            feature = core.parse_cached_feature(featurefile, tag_expr, featureid=featureid)
+    except Exception:
+        # the feature file is parsed again in the main process to raise the error there
+        return None
+    return core.features, feature
+
+
 # FIXME: rename
 class Core:
     """
     Provide some core functionalities like parsing and storing of the feature files
     """
 
-    def __init__(self):
+    def __init__(self, parse_cache=None, parse_workers=None):
         self.features = []
+        self._parse_cache = parse_cache
+        self._parse_workers = parse_workers
         self._features_to_run = OrderedDict()
+        #: Holds the parsed precondition features by feature file, tag expression and inherited tags
+        self._precondition_features = {}
+        #: Holds the feature files which are currently parsed to detect cycling preconditions
+        self._parsing_featurefiles = set()
         self._feature_id_lock = Lock()
         self._feature_id = 0
         self._scenario_id_lock = Lock()
@@ -74,9 +104,23 @@ class Core:
     def parse_features(self, feature_files, tag_expr):
         """
         Parses the given feature files
+
+        If multiple parse workers are set the feature files are parsed in worker processes.
+        The features and their ids are the same as if they were parsed one after another.
         """
-        for featurefile in feature_files:
-            feature = self.parse_feature(featurefile, tag_expr, featureid=self.next_feature_id)
+        featureids = [self.next_feature_id for _ in feature_files]
+        if self._parse_workers and self._parse_workers > 1 and len(feature_files) > 1:
+            parsed_features = self.parse_features_in_workers(feature_files, featureids, tag_expr)
+        else:
+            parsed_features = [None] * len(feature_files)
+
+        for featurefile, featureid, parsed in zip(feature_files, featureids, parsed_features):
+            if parsed is not None:
+                feature = self._add_parsed_features(*parsed, featureid=featureid)
+            elif self._parse_cache is None:
+                feature = self.parse_feature(featurefile, tag_expr, featureid=featureid)
+            else:
+                feature = self.parse_cached_feature(featurefile, tag_expr, featureid=featureid)
 
             if feature is not None:
                 for scenario in feature.scenarios:
@@ -84,6 +128,58 @@ class Core:
 
                 self._features_to_run[featurefile] = feature
 
+    def parse_features_in_workers(self, feature_files, featureids, tag_expr):
+        """
+        Parses the given feature files in worker processes
+
+        Every worker parses a feature file together with its precondition features.
+
+        :returns: all parsed features and the feature of every feature file
+                  or None for the feature files which could not be parsed
+        :rtype: list
+        """
+        tasks = [
+            (featurefile, featureid, tag_expr, self._parse_cache)
+            for featurefile, featureid in zip(feature_files, featureids)
+        ]
+        # the workers inherit the preloaded language or load it once when they are started
+        FeatureParser.preload_language()
+        with multiprocessing.Pool(self._parse_workers, initializer=FeatureParser.preload_language) as pool:
+            return pool.map(_parse_in_worker, tasks)
+
+    def parse_cached_feature(self, featurefile, tag_expr, featureid=0):
+        """
+        Loads the given feature file from the parse cache
+        If it's not cached it's parsed and stored in the cache
+
+        :returns: the parsed feature
+        :rtype: Feature
+        """
+        cached = self._parse_cache.load(featurefile, tag_expr)
+        if cached is None:
+            parsed_features = len(self.features)
+            feature = self.parse_feature(featurefile, tag_expr, featureid=featureid)
+            self._parse_cache.store(featurefile, tag_expr, self.features[parsed_features:], feature)
+            return feature
+
+        return self._add_parsed_features(*cached, featureid=featureid)
+
+    def _add_parsed_features(self, features, feature, featureid):
+        """
+        Adds the features which were parsed elsewhere
+
+        :param list features: all parsed features
+        :param Feature feature: the feature of the parsed feature file or None
+        :param int featureid: the id for the feature
+
+        :returns: the feature of the parsed feature file
+        :rtype: Feature
+        """
+        self.features.extend(features)
+        if feature is not None:
+            feature.id = featureid
+        return feature
+
     def parse_feature(self, featurefile, tag_expr, inherited_tags=None, featureid=0):
         """
         Parses the given feature file
@@ -92,11 +188,48 @@ class Core:
         :returns: the parsed feature
         :rtype: Feature
         """
-        featureparser = FeatureParser(self, featurefile, featureid, tag_expr, inherited_tags=inherited_tags)
-        feature = featureparser.parse()
+        feature = self._parse_featurefile(featurefile, tag_expr, inherited_tags, featureid)
 
         if feature is None:
             return None
 
         self.features.append(feature)
         return feature
+
+    def parse_precondition_feature(self, featurefile, tag_expr, inherited_tags):
+        """
+        Parses the given feature file to import precondition scenarios from it
+        The feature file is only parsed once for the same tag expression and inherited tags.
+        The precondition features are not added to the parsed features because
+        their scenarios are only run as part of the scenarios using them.
+
+        :returns: the parsed feature
+        :rtype: Feature
+        """
+        # the inherited tags are only used to evaluate the tag expression
+        key = (
+            os.path.abspath(featurefile),
+            str(tag_expr) if tag_expr else None,
+            tuple((t.name, t.arg) for t in inherited_tags) if tag_expr else None,
+        )
+        if key not in self._precondition_features:
+            self._precondition_features[key] = self._parse_featurefile(featurefile, tag_expr, inherited_tags)
+        return self._precondition_features[key]
+
+    def _parse_featurefile(self, featurefile, tag_expr, inherited_tags, featureid=0):
+        """
+        Parses the given feature file and keeps track of the feature files which are currently parsed
+        """
+        featureparser = FeatureParser(self, featurefile, featureid, tag_expr, inherited_tags=inherited_tags)
+        path = os.path.abspath(featurefile)
+        self._parsing_featurefiles.add(path)
+        try:
+            return featureparser.parse()
+        finally:
+            self._parsing_featurefiles.discard(path)
+
+    def is_parsing(self, featurefile):
+        """
+        Returns whether the given feature file is currently parsed
+        """
+        return os.path.abspath(featurefile) in self._parsing_featurefiles
@@ -16,6 +16,8 @@ class CustomTypeRegistry(metaclass=Singleton):
 
     def __init__(self):
         self.custom_types = {}
+        #: Incremented with every registered custom type
+        self.version = 0
 
     def register(self, name, func):
         """
@@ -25,6 +27,7 @@ class CustomTypeRegistry(metaclass=Singleton):
             raise RadishError("Cannot register custom type with name {} because it already exists".format(name))
 
         self.custom_types[name] = func
+        self.version += 1
 
 
 def custom_type(name, pattern):
@@ -10,6 +10,8 @@ class ExampleScenario(Scenario):
     Represents one example scenario from a ScenarioOutline
     """
 
+    __slots__ = ("example",)
+
     def __init__(self, id, keyword, sentence, path, line, parent, example, background=None):
         super().__init__(id, keyword, sentence, path, line, parent, parent.tags, background=background)
         self.example = example
@@ -8,6 +8,10 @@ from .utils import Singleton
 class ExtensionRegistry(metaclass=Singleton):
     """
     Registers all extensions
+
+    An extension which uses the steps of the scenarios of Scenario Outlines
+    and Loops after they have run sets ``KEEP_SCENARIO_STEPS`` to ``True``.
+    Otherwise, the steps are released once the results are recorded.
     """
 
     DEFAULT_LOAD_PRIORITY = 1000
@@ -43,6 +47,13 @@ class ExtensionRegistry(metaclass=Singleton):
             except AttributeError:
                 pass
 
+    def keep_scenario_steps(self):
+        """
+        Returns whether any loaded extension uses the steps of the
+        scenarios of Scenario Outlines and Loops after they have run
+        """
+        return any(getattr(ext, "KEEP_SCENARIO_STEPS", False) for ext in self.loaded_extensions)
+
     def get_options(self):
         """
         Returns all options registered by plugins
@@ -3,7 +3,6 @@ This module provides a hook which generates a BDD XML result file at the end of
 """
 
 import re
-from datetime import timedelta
 from getpass import getuser
 from os import getlogin
 from socket import gethostname
@@ -12,8 +11,7 @@ from radish import utils
 from radish.exceptions import RadishError
 from radish.extensionregistry import extension
 from radish.hookregistry import after
-from radish.scenarioloop import ScenarioLoop
-from radish.scenariooutline import ScenarioOutline
+from radish.resultaggregator import ResultAggregator
 from radish.stepmodel import Step
 from radish.terrain import world
 
@@ -27,6 +25,7 @@ class BDDXMLWriter:
     OPTIONS = [("--bdd-xml=<bddxml>", "write BDD XML result file after run")]
     LOAD_IF = staticmethod(lambda config: config.bdd_xml)
     LOAD_PRIORITY = 60
+    KEEP_SCENARIO_STEPS = True
 
     def __init__(self):
         try:
@@ -39,9 +38,11 @@ class BDDXMLWriter:
 
         after.all(self.generate_bdd_xml)
 
-    def _get_element_from_model(self, what, model):
+    def _get_element_from_model(self, what, model, state=None):
         """
         Create a etree.Element from a given model
+
+        :param str state: the state of the model if it is already known
         """
         from lxml import etree
 
@@ -52,7 +53,7 @@ class BDDXMLWriter:
             what,
             sentence=model.sentence,
             id=str(model.id),
-            result=model.state,
+            result=model.state if state is None else state,
             starttime=utils.format_utc_to_local_tz(model.starttime),
             endtime=utils.format_utc_to_local_tz(model.endtime),
             duration=duration,
@@ -75,10 +76,7 @@ class BDDXMLWriter:
         if not features:
             raise RadishError("No features given to generate BDD xml file")
 
-        duration = timedelta()
-        for feature in features:
-            if feature.state in [Step.State.PASSED, Step.State.FAILED]:
-                duration += feature.duration
+        results = ResultAggregator().get_run_result(features)
 
         try:
             user = getuser()
@@ -95,15 +93,12 @@ class BDDXMLWriter:
             "testrun",
             starttime=utils.format_utc_to_local_tz(features[0].starttime),
             endtime=utils.format_utc_to_local_tz(features[-1].endtime),
-            duration=str(duration.total_seconds()),
+            duration=str(results.duration.total_seconds()),
             agent="{}@{}".format(user, gethostname()),
         )
 
-        for feature in features:
-            if not feature.has_to_run(world.config.scenarios):
-                continue
-
-            feature_element = self._get_element_from_model("feature", feature)
+        for feature, feature_result in results.feature_results:
+            feature_element = self._get_element_from_model("feature", feature, feature_result.state)
 
             description_element = etree.Element("description")
             description_element.text = etree.CDATA("\n".join(feature.description))
@@ -117,10 +112,8 @@ class BDDXMLWriter:
 
             scenarios_element = etree.Element("scenarios")
 
-            for scenario in (s for s in feature.all_scenarios if not isinstance(s, (ScenarioOutline, ScenarioLoop))):
-                if not scenario.has_to_run(world.config.scenarios):
-                    continue
-                scenario_element = self._get_element_from_model("scenario", scenario)
+            for scenario, scenario_result in feature_result.scenario_results:
+                scenario_element = self._get_element_from_model("scenario", scenario, scenario_result.state)
 
                 scenario_tags_element = etree.Element("tags")
                 scenario_element.append(scenario_tags_element)
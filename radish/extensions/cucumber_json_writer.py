@@ -1,13 +1,13 @@
 """
-This module provides a hook which generates a cucumber json result file at the end of the run.
+This module provides a hook which writes a cucumber json result file while the features run.
 """
 
 import json
-from datetime import datetime, timedelta, timezone
+import os
 
 from radish.exceptions import RadishError
 from radish.extensionregistry import extension
-from radish.hookregistry import after
+from radish.hookregistry import after, before
 from radish.scenarioloop import ScenarioLoop
 from radish.scenariooutline import ScenarioOutline
 from radish.stepmodel import Step
@@ -18,95 +18,169 @@ from radish.terrain import world
 class CucumberJSONWriter:
     """
     cucumber json Writer radish extension
+
+    The json object of a feature is written to the result file as soon as the
+    feature has run. Thus, the writer does not hold the results of all features
+    in memory and the result file contains all features run so far if the run
+    is aborted. Features which ran in worker processes are written at the end of the run.
     """
 
     OPTIONS = [("--cucumber-json=<ccjson>", "write cucumber json result file after run")]
     LOAD_IF = staticmethod(lambda config: config.cucumber_json)
     LOAD_PRIORITY = 60
+    KEEP_SCENARIO_STEPS = True
+
+    #: Holds the indentation of the json objects of the features in the result file
+    INDENT = 4
 
     def __init__(self):
-        after.all(self.generate_ccjson)
+        self._stream = None
+        self._pid = None
+        self._written_features = set()
+        self._encoder = json.JSONEncoder(indent=self.INDENT, sort_keys=True)
+
+        before.all(self.open_ccjson)
+        after.each_feature(self.write_feature)
+        after.all(self.close_ccjson)
+
+    def open_ccjson(self, features, marker):
+        """
+        Opens the cucumber json result file and starts the list of features
+        """
+        self._stream = open(world.config.cucumber_json, "w+")
+        self._pid = os.getpid()
+        self._written_features = set()
+        self._stream.write("[")
+        self._stream.flush()
 
-    def generate_ccjson(self, features, marker):
+    def write_feature(self, feature):
         """
-        Generates the cucumber json
+        Writes the json object of the given feature to the cucumber json result file
+        """
+        # worker processes inherit the file of the main process but must not write to it
+        if self._stream is None or self._pid != os.getpid():
+            return
+
+        if not feature.has_to_run(world.config.scenarios) or feature.id in self._written_features:
+            return
+
+        self._write_feature_json(self._stream, self._get_feature_json(feature), not self._written_features)
+        self._written_features.add(feature.id)
+        self._stream.flush()
+
+        # the embeddings are not needed anymore once they are written
+        for scenario in feature.all_scenarios:
+            for step in scenario.all_steps:
+                step.embeddings = None
+
+    def close_ccjson(self, features, marker):
+        """
+        Writes the features which are not written yet and finishes the cucumber json result file
+        """
+        if self._stream is None:
+            return
+
+        try:
+            if not features:
+                raise RadishError("No features given to generate cucumber json file")
+
+            for feature in features:
+                self.write_feature(feature)
+            self._stream.write("\n]" if self._written_features else "]")
+        finally:
+            self._stream.close()
+            self._stream = None
+
+    def generate_ccjson(self, features, stream):
         """
+        Writes the cucumber json for the given features at once to the given stream
+
+        The result file of the run is written by the hooks while the features run,
+        thus, the cucumber json is written to a stream given by the caller.
 
+        :param list features: the features to write the cucumber json for
+        :param stream: the text stream to write the cucumber json to
+        """
         if not features:
             raise RadishError("No features given to generate cucumber json file")
 
-        duration = timedelta()
-        for feature in features:
-            if feature.state in [Step.State.PASSED, Step.State.FAILED]:
-                # feature file run started
-                if feature.starttime is not None:
-                    # feature file run not finished
-                    if feature.endtime is None:
-                        duration += feature.starttime - datetime.now(timezone.utc)
-                    # feature file run finished
-                    else:
-                        duration += feature.duration
-
-        ccjson = []
+        stream.write("[")
+        first = True
         for feature in features:
             if not feature.has_to_run(world.config.scenarios):
                 continue
-            feature_description = "\n".join(feature.description)
-            feature_json = {
-                "uri": feature.path,
-                "type": "feature",
-                "keyword": feature.keyword,
-                "id": str(feature.id),
-                "name": feature.sentence,
-                "line": feature.line,
-                "description": feature_description,
+            self._write_feature_json(stream, self._get_feature_json(feature), first)
+            first = False
+        stream.write("]" if first else "\n]")
+
+    def _write_feature_json(self, stream, feature_json, first):
+        """
+        Writes the given json object of a feature as item of the list of features
+
+        The json object is encoded incrementally and indented like
+        in a list dumped with ``json.dumps(features, indent=4, sort_keys=True)``.
+        """
+        indent = "\n" + " " * self.INDENT
+        stream.write(indent if first else "," + indent)
+        for chunk in self._encoder.iterencode(feature_json):
+            stream.write(chunk.replace("\n", indent))
+
+    def _get_feature_json(self, feature):
+        """
+        Returns the json object for the given feature
+        """
+        feature_description = "\n".join(feature.description)
+        feature_json = {
+            "uri": feature.path,
+            "type": "feature",
+            "keyword": feature.keyword,
+            "id": str(feature.id),
+            "name": feature.sentence,
+            "line": feature.line,
+            "description": feature_description,
+            "tags": [],
+            "elements": [],
+        }
+        for i, j in enumerate(feature.tags):
+            feature_json["tags"].append({"name": "@" + j.name, "line": feature.line - len(feature.tags) + i})
+        for scenario in (s for s in feature.all_scenarios if not isinstance(s, (ScenarioOutline, ScenarioLoop))):
+            if not scenario.has_to_run(world.config.scenarios):
+                continue
+            scenario_json = {
+                "keyword": scenario.keyword,
+                "type": "scenario",
+                "id": str(scenario.id),
+                "name": scenario.sentence,
+                "line": scenario.line,
+                "description": "",
+                "steps": [],
                 "tags": [],
-                "elements": [],
             }
-            for i, j in enumerate(feature.tags):
-                feature_json["tags"].append({"name": "@" + j.name, "line": feature.line - len(feature.tags) + i})
-            for scenario in (s for s in feature.all_scenarios if not isinstance(s, (ScenarioOutline, ScenarioLoop))):
-                if not scenario.has_to_run(world.config.scenarios):
-                    continue
-                scenario_json = {
-                    "keyword": scenario.keyword,
-                    "type": "scenario",
-                    "id": str(scenario.id),
-                    "name": scenario.sentence,
-                    "line": scenario.line,
-                    "description": "",
-                    "steps": [],
-                    "tags": [],
+            start_line_no = scenario.line - len(scenario.tags)
+            for i, tag in enumerate(scenario.tags):
+                scenario_json["tags"].append({"name": "@" + tag.name, "line": start_line_no + i})
+            for step in scenario.all_steps:
+                duration = int(step.duration.total_seconds() * 1e9 if step.starttime and step.endtime else 0.0)
+                step_json = {
+                    "keyword": step.sentence.split()[0],
+                    "name": step.sentence,
+                    "line": step.line,
+                    "result": {
+                        "status": step.state,
+                        "duration": duration,
+                        "starttime": str(step.starttime if step.starttime else 0.0),
+                        "endtime": str(step.endtime if step.endtime else 0.0),
+                    },
                 }
-                start_line_no = scenario.line - len(scenario.tags)
-                for i, tag in enumerate(scenario.tags):
-                    scenario_json["tags"].append({"name": "@" + tag.name, "line": start_line_no + i})
-                for step in scenario.all_steps:
-                    duration = int(step.duration.total_seconds() * 1e9 if step.starttime and step.endtime else 0.0)
-                    step_json = {
-                        "keyword": step.sentence.split()[0],
-                        "name": step.sentence,
-                        "line": step.line,
-                        "result": {
-                            "status": step.state,
-                            "duration": duration,
-                            "starttime": str(step.starttime if step.starttime else 0.0),
-                            "endtime": str(step.endtime if step.endtime else 0.0),
-                        },
-                    }
-                    if step.state is Step.State.FAILED:
-                        step_json["result"]["error_message"] = step.failure.reason
-                    if step.state is Step.State.UNTESTED:
-                        if step.starttime is None:
-                            step_json["result"]["status"] = "pending"
-                        else:
-                            step_json["result"]["status"] = "skipped"
-                    if step.embeddings:
-                        step_json["embeddings"] = step.embeddings
-                    scenario_json["steps"].append(step_json)
-                feature_json["elements"].append(scenario_json)
-            ccjson.append(feature_json)
-
-        with open(world.config.cucumber_json, "w+") as f:
-            content = json.dumps(ccjson, indent=4, sort_keys=True)
-            f.write(content)
+                if step.state is Step.State.FAILED:
+                    step_json["result"]["error_message"] = step.failure.reason
+                if step.state is Step.State.UNTESTED:
+                    if step.starttime is None:
+                        step_json["result"]["status"] = "pending"
+                    else:
+                        step_json["result"]["status"] = "skipped"
+                if step.embeddings:
+                    step_json["embeddings"] = step.embeddings
+                scenario_json["steps"].append(step_json)
+            feature_json["elements"].append(scenario_json)
+        return feature_json
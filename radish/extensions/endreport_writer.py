@@ -2,15 +2,12 @@
 This radish extension module provide the functionality to write the end report
 """
 
-from datetime import timedelta
-
 import colorful
 import humanize
 
 from radish.extensionregistry import extension
 from radish.hookregistry import after
-from radish.scenarioloop import ScenarioLoop
-from radish.scenariooutline import ScenarioOutline
+from radish.resultaggregator import ResultAggregator
 from radish.stepmodel import Step
 from radish.stepregistry import StepRegistry
 from radish.terrain import world
@@ -36,60 +33,10 @@ class EndreportWriter:
 
         :param list features: all features
         """
-        stats = {
-            "features": {
-                "amount": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "untested": 0,
-                "pending": 0,
-            },
-            "scenarios": {
-                "amount": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "untested": 0,
-                "pending": 0,
-            },
-            "steps": {
-                "amount": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "untested": 0,
-                "pending": 0,
-            },
-        }
-        pending_steps = []
-        duration = timedelta()
-        for feature in features:
-            if not feature.has_to_run(world.config.scenarios):
-                continue
-            stats["features"]["amount"] += 1
-            stats["features"][feature.state] += 1
-
-            if feature.state in [Step.State.PASSED, Step.State.FAILED]:
-                duration += feature.duration
-
-            for scenario in feature.all_scenarios:
-                if not scenario.has_to_run(world.config.scenarios):
-                    continue
-
-                if isinstance(scenario, ScenarioOutline):  # skip ScenarioOutlines
-                    continue
-                if isinstance(scenario, ScenarioLoop):  # skip ScenarioLoop
-                    continue
-
-                stats["scenarios"]["amount"] += 1
-                stats["scenarios"][scenario.state] += 1
-                for step in scenario.steps:
-                    stats["steps"]["amount"] += 1
-                    stats["steps"][step.state] += 1
-
-                    if step.state == Step.State.PENDING:
-                        pending_steps.append(step)
+        results = ResultAggregator().get_run_result(features)
+        stats = {"features": results.features, "scenarios": results.scenarios, "steps": results.steps}
+        pending_steps = results.pending_steps
+        duration = results.duration
 
         colored_closing_paren = colorful.bold_white(")")
         colored_comma = colorful.bold_white(", ")
@@ -161,14 +108,10 @@ class EndreportWriter:
                 )
 
                 has_passed_scenarios = False
-                for feature in features:
-                    passed_scenarios = list(
-                        filter(
-                            lambda s: s.state == Step.State.PASSED,
-                            feature.all_scenarios,
-                        )
-                    )
-                    for scenario in passed_scenarios:
+                for feature, feature_result in results.feature_results:
+                    for scenario, scenario_result in feature_result.scenario_results:
+                        if scenario_result.state is not Step.State.PASSED:
+                            continue
                         output += colorful.red("\n - {}: {}".format(feature.path, scenario.sentence))
                         has_passed_scenarios = True
 
@@ -8,6 +8,7 @@ import colorful as cf
 
 from radish.extensionregistry import extension
 from radish.hookregistry import after, before
+from radish.resultaggregator import ResultAggregator
 from radish.scenarioloop import ScenarioLoop
 from radish.scenariooutline import ScenarioOutline
 from radish.stepmodel import Step
@@ -58,7 +59,7 @@ class DotOutputFormatter:
         if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
             return
 
-        sys.stdout.write(str(self.STATE_SYMBOLS[scenario.state]))
+        sys.stdout.write(str(self.STATE_SYMBOLS[ResultAggregator().get_scenario_result(scenario).state]))
 
     def dot_formatter_after_each_step(self, step):
         if step.state == Step.State.FAILED:
@@ -4,9 +4,12 @@ This radish extension provides the functionality to write the feature file run t
 
 import os
 import re
+import sys
+from contextvars import ContextVar
 
 import colorful
 
+from radish.console import is_terminal
 from radish.extensionregistry import extension
 from radish.feature import Feature
 from radish.hookregistry import after, before
@@ -46,11 +49,39 @@ class ConsoleWriter:
         after.each_scenario(self.console_writer_after_each_scenario)
         after.each_step(self.console_writer_after_each_step)
 
-        self.last_precondition = None
-        self.last_background = None
+        # the last written precondition and background are tracked per context
+        # because scenarios can run in parallel threads or asyncio tasks
+        self._last_precondition = ContextVar("last_precondition", default=None)
+        self._last_background = ContextVar("last_background", default=None)
 
         self._placeholder_regex = re.compile(r"(<[\w-]+>)", flags=re.UNICODE)
 
+        # the steps and examples are only written before they run and
+        # overwritten afterwards if the output is written to a terminal
+        self._redraw = is_terminal(sys.stdout)
+
+    @property
+    def last_precondition(self):
+        """
+        Returns the precondition of the last step written in the current context
+        """
+        return self._last_precondition.get()
+
+    @last_precondition.setter
+    def last_precondition(self, precondition):
+        self._last_precondition.set(precondition)
+
+    @property
+    def last_background(self):
+        """
+        Returns the background of the last step written in the current context
+        """
+        return self._last_background.get()
+
+    @last_background.setter
+    def last_background(self, background):
+        self._last_background.set(background)
+
     def get_color_func(self, state):
         """
         Returns the color func to use
@@ -69,7 +100,12 @@ class ConsoleWriter:
         Returns the line jump ANSI sequence
         """
         line_jump_seq = ""
-        if not world.config.no_ansi and not world.config.no_line_jump and not world.config.write_steps_once:
+        if (
+            self._redraw
+            and not world.config.no_ansi
+            and not world.config.no_line_jump
+            and not world.config.write_steps_once
+        ):
             line_jump_seq = "\r\033[A\033[K"
         return line_jump_seq
 
@@ -138,10 +174,10 @@ class ConsoleWriter:
         """
         output = "\n"
         if isinstance(scenario.parent, ScenarioOutline):
-            if world.config.write_steps_once:
+            if world.config.write_steps_once or not self._redraw:
                 return
 
-            id_prefix = self.get_id_sentence_prefix(scenario, colorful.bold_yellow, len(scenario.parent.scenarios))
+            id_prefix = self.get_id_sentence_prefix(scenario, colorful.bold_yellow, scenario.parent.amount_of_scenarios)
             colored_pipe = colorful.bold_white("|")
             output = "        {0}{1} {2} {1}".format(
                 id_prefix,
@@ -154,10 +190,10 @@ class ConsoleWriter:
                 ),
             )
         elif isinstance(scenario.parent, ScenarioLoop):
-            if world.config.write_steps_once:
+            if world.config.write_steps_once or not self._redraw:
                 return
 
-            id_prefix = self.get_id_sentence_prefix(scenario, colorful.bold_yellow, len(scenario.parent.scenarios))
+            id_prefix = self.get_id_sentence_prefix(scenario, colorful.bold_yellow, scenario.parent.amount_of_scenarios)
             colored_pipe = colorful.bold_white("|")
             output = "        {0}{1} {2: <18} {1}".format(
                 id_prefix, colored_pipe, colorful.bold_yellow(str(scenario.iteration))
@@ -222,9 +258,12 @@ class ConsoleWriter:
 
         self.last_precondition = step.as_precondition
         self.last_background = step.as_background
-        output += self._get_step_before_output(step)
-
-        write(output)
+        if self._redraw:
+            output += self._get_step_before_output(step)
+            write(output)
+        elif output:
+            # the header already ends with a line break
+            sys.stdout.write(str(output))
 
     def _get_step_before_output(self, step, color_func=None):
         if color_func is None:
@@ -347,7 +386,7 @@ class ConsoleWriter:
             output += "\n    {}:\n".format(colorful.bold_white(scenario.example_keyword))
             output += colorful.bold_white(
                 "        {}| {} |".format(
-                    self.get_id_padding(len(scenario.scenarios), offset=2),
+                    self.get_id_padding(scenario.amount_of_scenarios, offset=2),
                     " | ".join(
                         "{1: <{0}}".format(scenario.get_column_width(i), x)
                         for i, x in enumerate(scenario.examples_header)
@@ -364,7 +403,7 @@ class ConsoleWriter:
             color_func = self.get_color_func(scenario.state)
             output += "{0}        {1}{2} {3} {2}".format(
                 self.get_line_jump_seq(),
-                self.get_id_sentence_prefix(scenario, colorful.bold_cyan, len(scenario.parent.scenarios)),
+                self.get_id_sentence_prefix(scenario, colorful.bold_cyan, scenario.parent.amount_of_scenarios),
                 colored_pipe,
                 (" {} ")
                 .format(colored_pipe)
@@ -378,13 +417,13 @@ class ConsoleWriter:
                 failed_step = scenario.failed_step
                 if world.config.with_traceback:
                     output += "\n          {}{}".format(
-                        self.get_id_padding(len(scenario.parent.scenarios)),
+                        self.get_id_padding(scenario.parent.amount_of_scenarios),
                         "\n          ".join(
                             [str(colorful.red(li)) for li in failed_step.failure.traceback.split("\n")[:-2]]
                         ),
                     )
                 output += "\n          {}{}: {}".format(
-                    self.get_id_padding(len(scenario.parent.scenarios)),
+                    self.get_id_padding(scenario.parent.amount_of_scenarios),
                     colorful.bold_red(failed_step.failure.name),
                     colorful.red(failed_step.failure.reason),
                 )
@@ -393,7 +432,7 @@ class ConsoleWriter:
             color_func = self.get_color_func(scenario.state)
             output += "{0}        {1}{2} {3: <18} {2}".format(
                 self.get_line_jump_seq(),
-                self.get_id_sentence_prefix(scenario, colorful.bold_cyan, len(scenario.parent.scenarios)),
+                self.get_id_sentence_prefix(scenario, colorful.bold_cyan, scenario.parent.amount_of_scenarios),
                 colored_pipe,
                 color_func(str(scenario.iteration)),
             )
@@ -402,13 +441,13 @@ class ConsoleWriter:
                 failed_step = scenario.failed_step
                 if world.config.with_traceback:
                     output += "\n          {}{}".format(
-                        self.get_id_padding(len(scenario.parent.scenarios)),
+                        self.get_id_padding(scenario.parent.amount_of_scenarios),
                         "\n          ".join(
                             [str(colorful.red(li)) for li in failed_step.failure.traceback.split("\n")[:-2]]
                         ),
                     )
                 output += "\n          {}{}: {}".format(
-                    self.get_id_padding(len(scenario.parent.scenarios)),
+                    self.get_id_padding(scenario.parent.amount_of_scenarios),
                     colorful.bold_red(failed_step.failure.name),
                     colorful.red(failed_step.failure.reason),
                 )
@@ -1,16 +1,17 @@
 """
-This module provides a hook which generates a JUnit XML result file at the end of the run.
+This module provides a hook which generates a JUnit XML result file while the features run.
 """
 
+import os
 import re
+import shutil
+import tempfile
 from datetime import timedelta
 
-from radish import utils
 from radish.exceptions import RadishError
 from radish.extensionregistry import extension
-from radish.hookregistry import after
-from radish.scenarioloop import ScenarioLoop
-from radish.scenariooutline import ScenarioOutline
+from radish.hookregistry import after, before
+from radish.resultaggregator import ResultAggregator
 from radish.stepmodel import Step
 from radish.terrain import world
 
@@ -19,6 +20,13 @@ from radish.terrain import world
 class JUnitXMLWriter:
     """
     JUnit XML Writer radish extension
+
+    The testsuite of a feature is serialized as soon as the feature has run.
+    Thus, the writer does not hold the element tree of all features in memory.
+    The serialized testsuites are collected in a temporary file and written to the
+    JUnit XML file at the end of the run because the testsuites element holds the
+    duration of all features. Features which ran in worker processes are
+    serialized at the end of the run.
     """
 
     OPTIONS = [
@@ -27,6 +35,10 @@ class JUnitXMLWriter:
     ]
     LOAD_IF = staticmethod(lambda config: config.junit_xml)
     LOAD_PRIORITY = 60
+    KEEP_SCENARIO_STEPS = True
+
+    #: Holds the indentation of the elements in the JUnit XML file
+    INDENT = "  "
 
     def __init__(self):
         try:
@@ -34,28 +46,14 @@ class JUnitXMLWriter:
         except ImportError:
             raise RadishError('if you want to use the JUnit XML writer you have to "pip install radish-bdd lxml"')
 
-        after.all(self.generate_junit_xml)
-
-    def _get_element_from_model(self, what, model):
-        """
-        Create a etree.Element from a given model
-        """
-        from lxml import etree
+        self._spool = None
+        self._pid = None
+        self._written_features = set()
+        self._duration = timedelta()
 
-        # round duration to 3 decimal points, to avoid it being printed in
-        # scientific notation (According to the junit people 3 is enough)
-        # https://issues.jenkins-ci.org/browse/JENKINS-52152
-        duration = "%.3f" % model.duration.total_seconds() if model.starttime and model.endtime else ""
-        return etree.Element(
-            what,
-            sentence=model.sentence,
-            id=str(model.id),
-            result=model.state,
-            starttime=utils.format_utc_to_local_tz(model.starttime),
-            endtime=utils.format_utc_to_local_tz(model.endtime),
-            duration=duration,
-            testfile=model.path,
-        )
+        before.all(self.open_junit_xml)
+        after.each_feature(self.write_feature)
+        after.all(self.close_junit_xml)
 
     def _strip_ansi(self, text):
         """
@@ -64,123 +62,153 @@ class JUnitXMLWriter:
         pattern = re.compile(r"(\\033\[\d+(?:;\d+)*m)")
         return pattern.sub("", text)
 
-    def _write_xml_to_disk(self, content):
+    def open_junit_xml(self, features, marker):
         """
-        Persist JUnit XML string to file
+        Opens the temporary file the testsuites are written to while the features run
         """
-        with open(world.config.junit_xml, "w+") as f:
-            try:
-                if not isinstance(content, str):
-                    content = content.decode("utf-8")
-            except Exception:
-                pass
-            finally:
-                f.write(content)
+        self._spool = tempfile.TemporaryFile()
+        self._pid = os.getpid()
+        self._written_features = set()
+        self._duration = timedelta()
 
-    def generate_junit_xml(self, features, marker):
+    def write_feature(self, feature):
         """
-        Generates the JUnit XML
+        Writes the testsuite of the given feature to the temporary file
         """
-        from lxml import etree
+        # worker processes inherit the file of the main process but must not write to it
+        if self._spool is None or self._pid != os.getpid():
+            return
 
-        if not features:
-            raise RadishError("No features given to generate JUnit XML file")
+        if not feature.has_to_run(world.config.scenarios) or feature.id in self._written_features:
+            return
 
-        duration = timedelta()
-        for feature in features:
-            if feature.state in [Step.State.PASSED, Step.State.FAILED]:
-                duration += feature.duration
+        feature_result = ResultAggregator().get_feature_result(feature)
+        self._write_testsuite(self._spool, self._get_testsuite_element(feature, feature_result))
+        self._written_features.add(feature.id)
+        self._duration += self._get_feature_duration(feature_result)
 
-        testsuites_element = etree.Element("testsuites", time="%.3f" % duration.total_seconds())
+    def close_junit_xml(self, features, marker):
+        """
+        Writes the features which are not written yet and the JUnit XML file
+        """
+        if self._spool is None:
+            return
 
-        for feature in features:
-            if not feature.has_to_run(world.config.scenarios):
-                continue
+        try:
+            if not features:
+                raise RadishError("No features given to generate JUnit XML file")
+
+            for feature in features:
+                self.write_feature(feature)
+            with open(world.config.junit_xml, "wb") as f:
+                self._write_testsuites(f, self._spool, self._duration)
+        finally:
+            self._spool.close()
+            self._spool = None
+
+    @staticmethod
+    def _get_feature_duration(feature_result):
+        """
+        Returns the duration of the given feature result which counts for the duration of all testsuites
+        """
+        if feature_result.state in [Step.State.PASSED, Step.State.FAILED] and feature_result.duration is not None:
+            return feature_result.duration
+        return timedelta()
 
-            testsuite_states = {"failures": 0, "errors": 0, "skipped": 0, "tests": 0}
+    @staticmethod
+    def _write_testsuite(stream, testsuite_element):
+        """
+        Writes the given testsuite element indented as child of the testsuites element
+        """
+        from lxml import etree
 
-            for scenario in (s for s in feature.all_scenarios if not isinstance(s, (ScenarioOutline, ScenarioLoop))):
-                if not scenario.has_to_run(world.config.scenarios):
-                    continue
+        etree.indent(testsuite_element, space=JUnitXMLWriter.INDENT, level=1)
+        stream.write(JUnitXMLWriter.INDENT.encode("utf-8"))
+        stream.write(etree.tostring(testsuite_element, encoding="utf-8", with_tail=False))
+        stream.write(b"\n")
 
-                testsuite_states["tests"] += 1
-                if scenario.state in [
-                    Step.State.UNTESTED,
-                    Step.State.PENDING,
-                    Step.State.SKIPPED,
-                ]:
-                    testsuite_states["skipped"] += 1
-                if scenario.state is Step.State.FAILED:
-                    testsuite_states["failures"] += 1
+    @staticmethod
+    def _write_testsuites(stream, testsuites, duration):
+        """
+        Writes the JUnit XML with the already written testsuites to the given stream
+
+        :param stream: the binary stream to write the JUnit XML to
+        :param testsuites: the binary stream with the written testsuite elements
+        :param timedelta duration: the duration of all testsuites
+        """
+        from lxml import etree
 
-            if feature.starttime and feature.endtime:
-                feature_duration = feature.duration.total_seconds()
+        with etree.xmlfile(stream, encoding="utf-8") as xf:
+            xf.write_declaration()
+            with xf.element("testsuites", time="%.3f" % duration.total_seconds()):
+                xf.write("\n")
+                # the testsuites are already serialized and thus copied as they are
+                xf.flush()
+                testsuites.seek(0)
+                shutil.copyfileobj(testsuites, stream)
+        stream.write(b"\n")
+
+    def _get_testsuite_element(self, feature, feature_result):
+        """
+        Create the testsuite element with the testcases for the given feature
+
+        :param Feature feature: the feature
+        :param FeatureResult feature_result: the aggregated result of the feature
+        """
+        from lxml import etree
+
+        scenarios = feature_result.scenarios
+        skipped = scenarios[Step.State.UNTESTED] + scenarios[Step.State.PENDING] + scenarios[Step.State.SKIPPED]
+        feature_duration = feature_result.duration.total_seconds() if feature_result.duration is not None else 0
+        testsuite_element = etree.Element(
+            "testsuite",
+            name=feature.sentence,
+            failures=str(scenarios[Step.State.FAILED]),
+            errors="0",
+            skipped=str(skipped),
+            tests=str(scenarios["amount"]),
+            time=f"{feature_duration:.3f}",
+        )
+
+        for scenario, scenario_result in feature_result.scenario_results:
+            if scenario_result.duration is not None:
+                testcase_duration = scenario_result.duration.total_seconds()
             else:
-                feature_duration = 0
-            testsuite_element = etree.Element(
-                "testsuite",
-                name=feature.sentence,
-                failures=str(testsuite_states["failures"]),
-                errors=str(testsuite_states["errors"]),
-                skipped=str(testsuite_states["skipped"]),
-                tests=str(testsuite_states["tests"]),
-                time=f"{feature_duration:.3f}",
+                testcase_duration = 0
+            testcase_element = etree.SubElement(
+                testsuite_element,
+                "testcase",
+                classname=feature.sentence,
+                name=scenario.sentence,
+                time=f"{testcase_duration:.3f}",
             )
 
-            for scenario in (s for s in feature.all_scenarios if not isinstance(s, (ScenarioOutline, ScenarioLoop))):
-                if not scenario.has_to_run(world.config.scenarios):
-                    continue
-
-                if scenario.starttime and scenario.endtime:
-                    testcase_duration = scenario.duration.total_seconds()
-                else:
-                    testcase_duration = 0
-                testcase_element = etree.Element(
-                    "testcase",
-                    classname=feature.sentence,
-                    name=scenario.sentence,
-                    time=f"{testcase_duration:.3f}",
-                )
-
-                if world.config.junit_relaxed:
-                    properties_element = etree.Element("properties")
-                    for tag in scenario.all_tags:
-                        value = str(tag.arg) if tag.arg else ""
-                        property_element = etree.Element(
-                            "property",
-                            name=str(tag.name),
-                            value=value,
+            if world.config.junit_relaxed:
+                properties_element = etree.SubElement(testcase_element, "properties")
+                for tag in scenario.all_tags:
+                    value = str(tag.arg) if tag.arg else ""
+                    etree.SubElement(properties_element, "property", name=str(tag.name), value=value)
+
+            if scenario_result.state in [
+                Step.State.UNTESTED,
+                Step.State.PENDING,
+                Step.State.SKIPPED,
+            ]:
+                etree.SubElement(testcase_element, "skipped")
+
+            if scenario_result.state is Step.State.FAILED:
+                steps_sentence = []
+                for step in scenario.all_steps:
+                    steps_sentence.append(step.sentence)
+                    if step.state is Step.State.FAILED:
+                        failure_element = etree.SubElement(
+                            testcase_element, "failure", type=step.failure.name, message=step.sentence
                         )
-                        properties_element.append(property_element)
-
-                    testcase_element.append(properties_element)
-
-                if scenario.state in [
-                    Step.State.UNTESTED,
-                    Step.State.PENDING,
-                    Step.State.SKIPPED,
-                ]:
-                    skipped_element = etree.Element("skipped")
-                    testcase_element.append(skipped_element)
-
-                if scenario.state is Step.State.FAILED:
-                    steps_sentence = []
-                    for step in scenario.all_steps:
-                        steps_sentence.append(step.sentence)
-                        if step.state is Step.State.FAILED:
-                            failure_element = etree.Element("failure", type=step.failure.name, message=step.sentence)
-                            failure_element.text = etree.CDATA(
-                                "%s\n\n%s"
-                                % (
-                                    "\n".join(steps_sentence),
-                                    self._strip_ansi(step.failure.traceback),
-                                )
+                        failure_element.text = etree.CDATA(
+                            "%s\n\n%s"
+                            % (
+                                "\n".join(steps_sentence),
+                                self._strip_ansi(step.failure.traceback),
                             )
-                            testcase_element.append(failure_element)
-
-                testsuite_element.append(testcase_element)
-
-            testsuites_element.append(testsuite_element)
-
-        content = etree.tostring(testsuites_element, pretty_print=True, xml_declaration=True, encoding="utf-8")
-        self._write_xml_to_disk(content)
+                        )
+        return testsuite_element
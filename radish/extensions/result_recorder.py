@@ -0,0 +1,45 @@
+"""
+This module is a REQUIRED extension to record the results of Features and Scenarios for the reporters
+"""
+
+from radish.extensionregistry import extension
+from radish.hookregistry import after, before
+from radish.resultaggregator import ResultAggregator
+
+__REQUIRED__ = True
+
+
+@extension
+class ResultRecorder:
+    """
+    Result Recorder radish plugin
+
+    The results are recorded after the times are recorded
+    and before any reporter uses them.
+    """
+
+    LOAD_IF = staticmethod(lambda config: not config.show)
+    LOAD_PRIORITY = 2
+
+    def __init__(self):
+        before.all(self.result_recorder_before_all)
+        after.each_feature(self.result_recorder_after_each_feature)
+        after.each_scenario(self.result_recorder_after_each_scenario)
+
+    def result_recorder_before_all(self, features, marker):
+        """
+        Resets the results of a previous run
+        """
+        ResultAggregator().reset()
+
+    def result_recorder_after_each_feature(self, feature):
+        """
+        Records the result of the feature
+        """
+        ResultAggregator().record_feature(feature)
+
+    def result_recorder_after_each_scenario(self, scenario):
+        """
+        Records the result of the scenario
+        """
+        ResultAggregator().record_scenario(scenario)
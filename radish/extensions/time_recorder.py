@@ -2,8 +2,6 @@
 This module is a REQUIRED extension to record the time of Features, Scenarios and Steps
 """
 
-from datetime import datetime, timezone
-
 from radish.extensionregistry import extension
 from radish.hookregistry import after, before
 
@@ -14,6 +12,9 @@ __REQUIRED__ = True
 class TimeRecorder:
     """
     Time Recorder radish plugin
+
+    The times are recorded with the performance counter
+    and only converted to datetimes when they are used.
     """
 
     LOAD_IF = staticmethod(lambda config: not config.show)
@@ -31,34 +32,34 @@ class TimeRecorder:
         """
         Sets the starttime of the feature
         """
-        feature.starttime = datetime.now(timezone.utc)
+        feature.record_starttime()
 
     def time_recorder_before_each_scenario(self, scenario):
         """
         Sets the starttime of the scenario
         """
-        scenario.starttime = datetime.now(timezone.utc)
+        scenario.record_starttime()
 
     def time_recorder_before_each_step(self, step):
         """
         Sets the starttime of the step
         """
-        step.starttime = datetime.now(timezone.utc)
+        step.record_starttime()
 
     def time_recorder_after_each_feature(self, feature):
         """
         Sets the endtime of the feature
         """
-        feature.endtime = datetime.now(timezone.utc)
+        feature.record_endtime()
 
     def time_recorder_after_each_scenario(self, scenario):
         """
         Sets the endtime of the scenario
         """
-        scenario.endtime = datetime.now(timezone.utc)
+        scenario.record_endtime()
 
     def time_recorder_after_each_step(self, step):
         """
         Sets the endtime of the step
         """
-        step.endtime = datetime.now(timezone.utc)
+        step.record_endtime()
@@ -14,12 +14,37 @@ class Feature(Model):
     Represent a Feature
     """
 
+    # the __dict__ keeps custom attributes possible, e.g. set by the hooks
+    __slots__ = (
+        "description",
+        "background",
+        "_scenarios",
+        "context",
+        "_state_scenarios",
+        "_state_index",
+        "__dict__",
+    )
+
     def __init__(self, id, keyword, sentence, path, line, tags=None):
         super().__init__(id, keyword, sentence, path, line, None, tags)
         self.description = []
         self.background = None
-        self.scenarios = []
+        self._scenarios = []
         self.context = self.Context()
+        self._state_scenarios = None
+        self._state_index = 0
+
+    @property
+    def scenarios(self):
+        """
+        Returns the scenarios of the feature
+        """
+        return self._scenarios
+
+    @scenarios.setter
+    def scenarios(self, scenarios):
+        self._scenarios = scenarios
+        self.reset_state()
 
     @property
     def all_scenarios(self):
@@ -72,19 +97,43 @@ class Feature(Model):
     @property
     def state(self):
         """
-        Returns the state of the scenario
-        """
-        for scenario in self.all_scenarios:
-            if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):  # skip scenario outlines
-                continue
-
-            if not scenario.has_to_run(world.config.scenarios):
-                continue
+        Returns the state of the feature
 
-            if scenario.state is not Step.State.PASSED:
-                return scenario.state
+        The state is the state of the first scenario to run which has not passed.
+        The scenarios to run and the position of this scenario are cached,
+        thus, the scenarios before it are not checked again until a passed
+        step changes its state or the scenarios are replaced.
+        """
+        scenario_choice = world.config.scenarios
+        cache = self._state_scenarios
+        if cache is None or cache[0] is not scenario_choice:
+            scenarios = [
+                s
+                for s in self.all_scenarios
+                # skip scenario outlines
+                if not isinstance(s, (ScenarioOutline, ScenarioLoop)) and s.has_to_run(scenario_choice)
+            ]
+            cache = self._state_scenarios = (scenario_choice, scenarios)
+            self._state_index = 0
+
+        scenarios = cache[1]
+        index = self._state_index
+        while index < len(scenarios):
+            state = scenarios[index].state
+            if state is not Step.State.PASSED:
+                self._state_index = index
+                return state
+            index += 1
+        self._state_index = index
         return Step.State.PASSED
 
+    def reset_state(self):
+        """
+        Resets the cached scenarios to run and the position of the first scenario which has not passed
+        """
+        self._state_scenarios = None
+        self._state_index = 0
+
     def has_to_run(self, scenario_choice):
         """
         Returns wheiter the feature has to run or not
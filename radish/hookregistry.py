@@ -18,6 +18,8 @@ class HookRegistry(metaclass=Singleton):
 
     def __init__(self):
         self._hooks = {}
+        self._ordered_hooks = {}
+        self._used_slots = set()
         self.reset()
         self.build_hooks()
 
@@ -86,11 +88,14 @@ class HookRegistry(metaclass=Singleton):
         if order is None:
             order = self.DEFAULT_HOOK_ORDER
 
-        # if no tags are specified we always return True
-        if on_tags is None:
-            on_tags = lambda _: True  # noqa: E731
+        hooks = self._hooks[what][when]
+        hooks.append((order, on_tags, func))
 
-        self._hooks[what][when].append((order, on_tags, func))
+        # the hooks are sorted once for both call orders
+        # to not sort them again for every call
+        self._ordered_hooks[(when, what, True)] = tuple(sorted(hooks, key=lambda h: h[0]))
+        self._ordered_hooks[(when, what, False)] = tuple(sorted(hooks, key=lambda h: h[0], reverse=True))
+        self._used_slots.add((when, what))
 
     def reset(self):
         """
@@ -102,6 +107,22 @@ class HookRegistry(metaclass=Singleton):
             "each_scenario": {"before": [], "after": []},
             "each_step": {"before": [], "after": []},
         }
+        self._ordered_hooks = {
+            (when, what, ascending): ()
+            for what, hooks in self._hooks.items()
+            for when in hooks
+            for ascending in (True, False)
+        }
+        self._used_slots = set()
+
+    def has_hooks(self, when, what):
+        """
+        Returns whether any hooks are registered for the given slot
+
+        :param str when: when the hooks are called, either ``before`` or ``after``
+        :param str what: the model the hooks are registered for, e.g. ``each_step``
+        """
+        return (when, what) in self._used_slots
 
     def __has_to_run(self, model, on_tags):
         """
@@ -109,19 +130,17 @@ class HookRegistry(metaclass=Singleton):
         depending on it's tags
         """
         if isinstance(model, list):
-            return any(
-                on_tags([t.name if t.arg is None else "{}({})".format(t.name, t.arg) for t in m.all_tags])
-                for m in model
-            )
+            return any(on_tags(m.rendered_tags) for m in model)
 
-        return on_tags([t.name if t.arg is None else "{}({})".format(t.name, t.arg) for t in model.all_tags])
+        return on_tags(model.rendered_tags)
 
     def call(self, when, what, ascending, model, *args, **kwargs):
         """
         Calls a registered hook
         """
-        for _, on_tags, func in sorted(self._hooks[what][when], key=lambda h: h[0], reverse=not ascending):
-            if not self.__has_to_run(model, on_tags):
+        for _, on_tags, func in self._ordered_hooks[(when, what, ascending)]:
+            # hooks without tags always have to run
+            if on_tags is not None and not self.__has_to_run(model, on_tags):
                 # this hook does not have to run because
                 # it was excluded due to the tags for this model
                 continue
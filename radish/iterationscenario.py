@@ -10,6 +10,8 @@ class IterationScenario(Scenario):
     Represents one iteration from a ScenarioLoop
     """
 
+    __slots__ = ("iteration",)
+
     def __init__(self, id, keyword, sentence, path, line, parent, iteration, background=None):
         super().__init__(id, keyword, sentence, path, line, parent, parent.tags, background=background)
         self.iteration = iteration
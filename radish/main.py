@@ -7,14 +7,16 @@ import colorful
 import tagexpressions
 from docopt import docopt
 
-from . import __VERSION__, utils
+from . import __VERSION__, console, utils
 from .core import Configuration, Core
 from .errororacle import catch_unhandled_exception, error_oracle
-from .exceptions import FeatureFileNotFoundError, ScenarioNotFoundError
+from .exceptions import FeatureFileNotFoundError, RadishError, ScenarioNotFoundError
 from .extensionregistry import ExtensionRegistry
 from .hookregistry import HookRegistry
 from .loader import load_modules
 from .matcher import merge_steps
+from .parallelrunner import AsyncRunner, ProcessPoolRunner, ThreadPoolRunner
+from .parsecache import ParseCache
 from .runner import Runner
 from .stepregistry import StepRegistry
 from .terrain import world
@@ -45,6 +47,20 @@ def show_features(core):
     return 0
 
 
+def get_positive_number(option, value):
+    """
+    Returns the given command line option value as positive number
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise RadishError("The {} option must be a positive number. Given: '{}'".format(option, value))
+    return number
+
+
 def run_features(core):
     """
     Run the parsed features
@@ -73,8 +89,54 @@ def run_features(core):
             if not 0 < s <= amount_of_scenarios:
                 raise ScenarioNotFoundError(s, amount_of_scenarios)
 
-    runner = Runner(HookRegistry(), early_exit=world.config.early_exit)
-    return runner.start(core.features_to_run, marker=world.config.marker)
+    parallel_options = [
+        option
+        for option, value in (
+            ("--workers", world.config.workers),
+            ("--threads", world.config.threads),
+            ("--async-concurrency", world.config.async_concurrency),
+        )
+        if value
+    ]
+    if len(parallel_options) > 1:
+        raise RadishError("The options {} cannot be combined".format(" and ".join(parallel_options)))
+
+    if world.config.distribute_scenarios and not world.config.workers:
+        raise RadishError("The option --distribute-scenarios can only be used together with --workers")
+
+    if parallel_options and world.config.debug_steps:
+        raise RadishError("The steps cannot be debugged when running in parallel")
+
+    # the steps of the scenarios of Scenario Outlines and Loops are released once their results are recorded
+    release_scenario_steps = not ExtensionRegistry().keep_scenario_steps()
+    if world.config.workers:
+        runner = ProcessPoolRunner(
+            HookRegistry(),
+            get_positive_number("--workers", world.config.workers),
+            distribute_scenarios=world.config.distribute_scenarios,
+            early_exit=world.config.early_exit,
+        )
+    elif world.config.threads:
+        runner = ThreadPoolRunner(
+            HookRegistry(),
+            get_positive_number("--threads", world.config.threads),
+            early_exit=world.config.early_exit,
+            release_scenario_steps=release_scenario_steps,
+        )
+    elif world.config.async_concurrency:
+        runner = AsyncRunner(
+            HookRegistry(),
+            get_positive_number("--async-concurrency", world.config.async_concurrency),
+            early_exit=world.config.early_exit,
+            release_scenario_steps=release_scenario_steps,
+        )
+    else:
+        runner = Runner(
+            HookRegistry(), early_exit=world.config.early_exit, release_scenario_steps=release_scenario_steps
+        )
+
+    with console.redirect_console(console.ConsoleSink(sys.stdout)):
+        return runner.start(core.features_to_run, marker=world.config.marker)
 
 
 @error_oracle
@@ -105,6 +167,11 @@ Usage:
            [--shuffle]
            [--tags=<tags>]
            [--wip]
+           [--parse-cache]
+           [--workers=<workers>]
+           [--distribute-scenarios]
+           [--threads=<threads>]
+           [--async-concurrency=<concurrency>]
            [-f=<formatter> | --formatter=<formatter>]
            {0}
     radish (-h | --help)
@@ -127,6 +194,11 @@ Options:
     --shuffle                                   shuffle run order of features and scenarios
     --tags=<feature_tags>                       only run Scenarios with the given tags
     --wip                                       expects all tests to fail instead of succeeding
+    --parse-cache                               cache the parsed feature files in the .radish_cache directory
+    --workers=<workers>                         run the features in the given number of worker processes
+    --distribute-scenarios                      distribute single scenarios instead of features to the --workers
+    --threads=<threads>                         run the scenarios of a feature in the given number of threads
+    --async-concurrency=<concurrency>           run up to the given number of scenarios of a feature concurrently as asyncio tasks
     -f=<formatter> --formatter=<formatter>      the output formatter which should be used. [default: gherkin]
     --expand                                    expand the feature file (all preconditions)
     {1}
@@ -160,7 +232,10 @@ Options:
     # load needed extensions
     extensions.load(world.config)
 
-    core = Core()
+    core = Core(
+        parse_cache=ParseCache() if world.config.parse_cache else None,
+        parse_workers=get_positive_number("--workers", world.config.workers) if world.config.workers else None,
+    )
 
     feature_files = []
     for given_feature in world.config.features:
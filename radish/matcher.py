@@ -3,12 +3,14 @@ This module provides a class to match the feature file steps with the registered
 """
 
 import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from threading import Lock
 
 from parse_type.cfparse import Parser
 
 from .customtyperegistry import CustomTypeRegistry
 from .exceptions import StepDefinitionNotFoundError, StepPatternError
+from .utils import Singleton
 
 StepMatch = namedtuple("StepMatch", ["argument_match", "func"])
 
@@ -36,6 +38,309 @@ class ParseStepArguments:
         return result.fixed, result.named
 
 
+class StepParserCache(metaclass=Singleton):
+    """
+    Cache for the compiled parse_type Parsers of the step patterns
+
+    The Parsers depend on the registered custom types, thus, the
+    cache is invalidated whenever a new custom type is registered.
+    """
+
+    def __init__(self):
+        self._parsers = {}
+        self._custom_types_version = None
+
+    def get(self, pattern, func):
+        """
+        Returns the Parser for the given step pattern
+
+        :param str pattern: the parse step pattern
+        :param function func: the step function registered for the pattern
+        """
+        custom_type_registry = CustomTypeRegistry()
+        if self._custom_types_version != custom_type_registry.version:
+            self._parsers = {}
+            self._custom_types_version = custom_type_registry.version
+
+        parser = self._parsers.get(pattern)
+        if parser is None:
+            try:
+                parser = Parser(pattern, custom_type_registry.custom_types)
+            except ValueError as e:
+                raise StepPatternError(pattern, func.__name__, e)
+            self._parsers[pattern] = parser
+        return parser
+
+    def clear(self):
+        """
+        Clears all cached Parsers
+        """
+        self._parsers = {}
+
+
+class StepPattern:
+    """
+    Represents a registered step pattern together with its step function
+    """
+
+    #: Characters which are always matched literally by a regex pattern
+    REGEX_LITERAL_CHARS = frozenset(" _-,;:'\"/<>=%@&#~`!")
+    #: Characters which quantify the preceding character in a regex pattern
+    REGEX_QUANTIFIERS = frozenset("?*+{")
+
+    def __init__(self, position, pattern, func):
+        self.position = position
+        self.pattern = pattern
+        self.func = func
+
+    @property
+    def literal_prefix(self):
+        """
+        Returns the text every sentence matched by this pattern must contain.
+
+        This is the leading part of the pattern which is matched literally.
+        An empty string is returned if no such part can be determined.
+        """
+        if isinstance(self.pattern, re.Pattern):
+            return self._regex_literal_prefix(self.pattern)
+        return self._parse_literal_prefix(self.pattern)
+
+    @classmethod
+    def _regex_literal_prefix(cls, pattern):
+        """
+        Returns the leading literal text of the given compiled regex
+        """
+        # an alternation or the verbose mode can make the leading text optional or meaningless
+        if pattern.flags & re.VERBOSE or "|" in pattern.pattern:
+            return ""
+
+        source = pattern.pattern[1:] if pattern.pattern.startswith("^") else pattern.pattern
+        prefix = []
+        for char in source:
+            if not char.isalnum() and char not in cls.REGEX_LITERAL_CHARS:
+                if char in cls.REGEX_QUANTIFIERS and prefix:
+                    # the last literal char is quantified and therefore not required
+                    prefix.pop()
+                break
+            prefix.append(char)
+        return "".join(prefix)
+
+    @staticmethod
+    def _parse_literal_prefix(pattern):
+        """
+        Returns the leading literal text of the given parse format
+        """
+        prefix = []
+        index = 0
+        while index < len(pattern):
+            if pattern.startswith("{{", index) or pattern.startswith("}}", index):
+                prefix.append(pattern[index])
+                index += 2
+                continue
+
+            if pattern[index] in "{}":
+                break
+
+            prefix.append(pattern[index])
+            index += 1
+        return "".join(prefix)
+
+    def search(self, sentence):
+        """
+        Searches the given sentence with this pattern
+
+        :param str sentence: the sentence to search
+
+        :returns: the argument match and the length of the matched text or None
+        :rtype: tuple
+        """
+        if isinstance(self.pattern, re.Pattern):
+            match = self.pattern.search(sentence)
+            if not match:
+                return None
+            return RegexStepArguments(match), get_longest_group(match)
+
+        match = self.parser.search(sentence, evaluate_result=False)
+        if not match:
+            return None
+        return ParseStepArguments(match), get_longest_group(match.match)
+
+    @property
+    def parser(self):
+        """
+        Returns the parse_type Parser for this pattern
+        """
+        return StepParserCache().get(self.pattern, self.func)
+
+
+class StepMatchMemo:
+    """
+    Least recently used memo of the step matches by sentence
+
+    The same sentence is matched over and over again for
+    Scenario Outlines, Scenario Loops and Backgrounds.
+    Set ``DEFAULT_MAXSIZE`` to ``0`` to disable the memo.
+    """
+
+    DEFAULT_MAXSIZE = 4096
+
+    #: Returned by get() if no match is memoized for a sentence
+    MISSING = object()
+
+    def __init__(self, maxsize=None):
+        self.maxsize = self.DEFAULT_MAXSIZE if maxsize is None else maxsize
+        self._matches = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._matches)
+
+    def get(self, sentence):
+        """
+        Returns the memoized match for the given sentence or ``MISSING``
+
+        A memoized match can also be ``None`` if the sentence does not match any step.
+        """
+        with self._lock:
+            try:
+                step_match = self._matches[sentence]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+
+            self._matches.move_to_end(sentence)
+            self.hits += 1
+            return step_match
+
+    def put(self, sentence, step_match):
+        """
+        Memoizes the match for the given sentence
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._matches[sentence] = step_match
+            self._matches.move_to_end(sentence)
+            if len(self._matches) > self.maxsize:
+                self._matches.popitem(last=False)
+
+    def clear(self):
+        """
+        Clears all memoized matches and resets the counters
+        """
+        self._matches = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+class StepPatternIndex:
+    """
+    Index of registered step patterns to quickly find the candidates for a sentence
+
+    Every pattern is indexed by the words of its literal prefix in a trie.
+    A sentence can only be matched by a pattern if it contains all of these words
+    in a row. The first word may be the end of a sentence word because patterns
+    are searched within the sentence.
+    Patterns without a usable literal prefix are candidates for every sentence.
+
+    The words are compared in lower case because parse patterns are case insensitive.
+    To keep this exact, only ASCII words are indexed and non-ASCII sentences are
+    matched against all patterns.
+
+    The matches found with this index are memoized in its StepMatchMemo.
+    """
+
+    #: Holds the index for the last used steps
+    _cache = None
+
+    class Node:
+        """
+        Represents a node in the word trie
+        """
+
+        def __init__(self):
+            self.step_patterns = []
+            self.children = {}
+
+    def __init__(self, steps):
+        self.step_patterns = []
+        self.unindexed = []
+        self.root = {}
+        self.memo = StepMatchMemo()
+
+        for position, (pattern, func) in enumerate(steps.items()):
+            step_pattern = StepPattern(position, pattern, func)
+            self.step_patterns.append(step_pattern)
+
+            words = self._get_index_words(step_pattern.literal_prefix)
+            if not words:
+                self.unindexed.append(step_pattern)
+                continue
+
+            node = self.root.setdefault(words[0], self.Node())
+            for word in words[1:]:
+                node = node.children.setdefault(word, self.Node())
+            node.step_patterns.append(step_pattern)
+
+    @classmethod
+    def get(cls, steps):
+        """
+        Returns the index for the given steps
+
+        The index is rebuilt if the steps or the registered custom types changed.
+        The StepRegistry replaces its steps when it's cleared and
+        every registration changes their size.
+        """
+        cache_key = (len(steps), CustomTypeRegistry().version)
+        if cls._cache is None or cls._cache[0] is not steps or cls._cache[1] != cache_key:
+            cls._cache = (steps, cache_key, cls(steps))
+        return cls._cache[2]
+
+    @staticmethod
+    def _get_index_words(literal_prefix):
+        """
+        Returns the words of the given literal prefix which can be indexed
+
+        Only words followed by a space are complete words.
+        """
+        words = []
+        for word in literal_prefix.lower().split(" ")[:-1]:
+            if not word.isascii():
+                break
+            words.append(word)
+
+        if not words or not words[0]:
+            return []
+        return words
+
+    def candidates(self, sentence):
+        """
+        Returns all step patterns which might match the given sentence.
+
+        The step patterns are returned in the order they were registered.
+        """
+        if not sentence.isascii():
+            return self.step_patterns
+
+        found = set(self.unindexed)
+        words = sentence.lower().split(" ")
+        for word_index, word in enumerate(words):
+            for start in range(len(word)):
+                node = self.root.get(word[start:])
+                next_word_index = word_index + 1
+                while node is not None:
+                    found.update(node.step_patterns)
+                    if not node.children or next_word_index >= len(words):
+                        break
+                    node = node.children.get(words[next_word_index])
+                    next_word_index += 1
+
+        return sorted(found, key=lambda p: p.position)
+
+
 def merge_steps(features, steps):
     """
     Merges steps from the given features with the given steps
@@ -44,18 +349,19 @@ def merge_steps(features, steps):
     :param dict steps: the steps
     """
     # FIXME: fix cycle-import ... Matcher -> ScenarioOutline -> Step -> Matcher
+    from .scenarioloop import ScenarioLoop
     from .scenariooutline import ScenarioOutline
 
     for feature in features:
-        for scenario in feature.all_scenarios:
-            if scenario.background:
-                for step in scenario.background.steps:
-                    merge_step(step, steps)
-
-            if isinstance(scenario, ScenarioOutline):
-                continue  # ScenarioOutline steps do not have to be merged
-
-            for step in scenario.steps:
+        for scenario in feature.scenarios:
+            if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
+                # the outlined and looped scenarios are merged when they are built
+                scenario.merge_steps(steps)
+                continue
+
+            # the steps of the preconditions are merged, too,
+            # because they are taken over by the scenario
+            for step in scenario.all_steps:
                 merge_step(step, steps)
 
 
@@ -84,37 +390,56 @@ def match_step(sentence, steps):
     :returns: the arguments and the func which were matched
     :rtype: tuple
     """
-    potentional_matches = []
-    for pattern, func in steps.items():
-        if isinstance(pattern, re.Pattern):
-            match = pattern.search(sentence)
-            argument_match = RegexStepArguments(match)
-            if match:
-                longest_group = get_longest_group(match)
-            else:
-                longest_group = 0
-        else:
-            try:
-                parser = Parser(pattern, CustomTypeRegistry().custom_types)
-            except ValueError as e:
-                raise StepPatternError(pattern, func.__name__, e)
+    index = StepPatternIndex.get(steps)
+    step_match = index.memo.get(sentence)
+    if step_match is StepMatchMemo.MISSING:
+        step_match = search_step_patterns(sentence, index.candidates(sentence))
+        index.memo.put(sentence, step_match)
+    return step_match
+
 
-            match = parser.search(sentence, evaluate_result=False)
-            argument_match = ParseStepArguments(match)
-            if match:
-                longest_group = get_longest_group(match.match)
-            else:
-                longest_group = 0
-
-        if match:
-            step_match = StepMatch(argument_match=argument_match, func=func)
-            if len(sentence) == longest_group:
-                # if perfect match can be made we return it no
-                # matter of the other potentional matches
-                return step_match
-
-            distance_to_perfect = abs(len(sentence) - longest_group)
-            potentional_matches.append((step_match, distance_to_perfect))
+def search_step_patterns(sentence, step_patterns):
+    """
+    Searches the best match for the given sentence in the given step patterns
+
+    :param string sentence: the step sentence to match
+    :param list step_patterns: the StepPatterns in the order they were registered
+
+    :returns: the arguments and the func which were matched
+    :rtype: tuple
+    """
+    found = find_step_pattern(sentence, step_patterns)
+    if found is None:
+        return None
+
+    step_pattern, argument_match = found
+    return StepMatch(argument_match=argument_match, func=step_pattern.func)
+
+
+def find_step_pattern(sentence, step_patterns):
+    """
+    Finds the step pattern which matches the given sentence best
+
+    :param string sentence: the step sentence to match
+    :param list step_patterns: the StepPatterns in the order they were registered
+
+    :returns: the best matching StepPattern and its argument match or None
+    :rtype: tuple
+    """
+    potentional_matches = []
+    for step_pattern in step_patterns:
+        result = step_pattern.search(sentence)
+        if not result:
+            continue
+
+        argument_match, longest_group = result
+        if len(sentence) == longest_group:
+            # if perfect match can be made we return it no
+            # matter of the other potentional matches
+            return step_pattern, argument_match
+
+        distance_to_perfect = abs(len(sentence) - longest_group)
+        potentional_matches.append(((step_pattern, argument_match), distance_to_perfect))
 
     if potentional_matches:
         # get best match
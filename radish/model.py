@@ -8,6 +8,10 @@ Models:
     * Step
 """
 
+from datetime import timedelta
+from time import perf_counter_ns
+
+from . import utils
 from .exceptions import RadishError
 
 
@@ -16,6 +20,8 @@ class Tag:
     Represents a tag for a model
     """
 
+    __slots__ = ("name", "arg")
+
     def __init__(self, name, arg=None):
         self.name = name
         self.arg = arg
@@ -33,12 +39,56 @@ class Tag:
         return "Tag name='{}' value='{}'".format(self.name, self.arg)
 
 
+class LazyList:
+    """
+    Descriptor for a list attribute of a model which is only created when it is first used
+
+    The list is stored in the slot with the name of the attribute prefixed with an underscore.
+    Models without any data in such a list do not hold an empty list.
+    """
+
+    def __set_name__(self, owner, name):
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = []
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
 # FIXME: make ABC
 class Model:
     """
     Represents a base model
+
+    The models use ``__slots__`` because a lot of them are created
+    for big feature files, Scenario Outlines and Scenario Loops.
+    Features, Scenarios and Steps still accept custom attributes.
     """
 
+    __slots__ = (
+        "id",
+        "keyword",
+        "sentence",
+        "path",
+        "line",
+        "parent",
+        "tags",
+        "_starttime",
+        "_endtime",
+        "_starttime_ns",
+        "_endtime_ns",
+        "_rendered_tags",
+    )
+
     class Context:
         """
         Represents a Models context.
@@ -56,8 +106,11 @@ class Model:
         self.line = line
         self.parent = parent
         self.tags = tags or []
-        self.starttime = None
-        self.endtime = None
+        self._starttime = None
+        self._endtime = None
+        self._starttime_ns = None
+        self._endtime_ns = None
+        self._rendered_tags = None
 
     @property
     def all_tags(self):
@@ -69,11 +122,73 @@ class Model:
             tags.extend(self.parent.all_tags)
         return tags + self.tags
 
+    @property
+    def rendered_tags(self):
+        """
+        Return all tags for this model and all it's parents
+        as they are written in the feature file, e.g. ``author(tuxtimo)``
+
+        The tags are rendered when they are first used
+        because they do not change once the features are parsed.
+        """
+        if self._rendered_tags is None:
+            self._rendered_tags = [t.name if t.arg is None else "{}({})".format(t.name, t.arg) for t in self.all_tags]
+        return self._rendered_tags
+
+    @property
+    def starttime(self):
+        """
+        Returns the starttime of this model
+
+        A recorded starttime is converted to a UTC datetime when it is first used.
+        """
+        if self._starttime is None and self._starttime_ns is not None:
+            self._starttime = utils.perf_counter_to_datetime(self._starttime_ns)
+        return self._starttime
+
+    @starttime.setter
+    def starttime(self, value):
+        self._starttime = value
+        self._starttime_ns = None
+
+    @property
+    def endtime(self):
+        """
+        Returns the endtime of this model
+
+        A recorded endtime is converted to a UTC datetime when it is first used.
+        """
+        if self._endtime is None and self._endtime_ns is not None:
+            self._endtime = utils.perf_counter_to_datetime(self._endtime_ns)
+        return self._endtime
+
+    @endtime.setter
+    def endtime(self, value):
+        self._endtime = value
+        self._endtime_ns = None
+
+    def record_starttime(self):
+        """
+        Records the current time as the starttime of this model
+        """
+        self._starttime = None
+        self._starttime_ns = perf_counter_ns()
+
+    def record_endtime(self):
+        """
+        Records the current time as the endtime of this model
+        """
+        self._endtime = None
+        self._endtime_ns = perf_counter_ns()
+
     @property
     def duration(self):
         """
         Returns the duration of this model
         """
+        if self._starttime_ns is not None and self._endtime_ns is not None:
+            return timedelta(microseconds=(self._endtime_ns - self._starttime_ns) // 1000)
+
         if not self.starttime or not self.endtime:
             raise RadishError(
                 "Cannot get duration of {} '{}' because either starttime or endtime is not set".format(
@@ -82,3 +197,12 @@ class Model:
             )
 
         return self.endtime - self.starttime
+
+    def reset_state(self):
+        """
+        Resets the cached state of this model and of all its parents
+
+        Models which cache their state override this method.
+        """
+        if self.parent is not None:
+            self.parent.reset_state()
@@ -0,0 +1,620 @@
+"""
+Providing runners which run features and scenarios in parallel.
+"""
+
+import asyncio
+import contextvars
+import copy
+import inspect
+import io
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from contextvars import ContextVar
+from random import shuffle
+
+from .exceptions import RadishError
+from .hookregistry import HookRegistry
+from .runner import Runner
+from .scenarioloop import ScenarioLoop
+from .scenariooutline import ScenarioOutline
+from .stepmodel import Step
+from .terrain import world
+from .utils import close_step_event_loops, get_step_event_loop
+
+#: Marks world attributes which do not exist
+_missing = object()
+
+#: Holds the features to run by id. The worker processes inherit them from the main process.
+_worker_features = {}
+
+#: Maps the unpickled step states to the Step.State constants because states are compared by identity
+_step_states = {
+    state: state
+    for state in (
+        Step.State.UNTESTED,
+        Step.State.SKIPPED,
+        Step.State.PASSED,
+        Step.State.FAILED,
+        Step.State.PENDING,
+    )
+}
+
+
+def _run_in_worker(task):
+    """
+    Runs the given task in a worker process
+
+    :param tuple task: the feature id and the absolute id of the scenario to run or None
+
+    :returns: the feature id, the return code, the console output and the results
+    :rtype: tuple
+    """
+    feature_id, scenario_id = task
+    feature = _worker_features[feature_id]
+    runner = Runner(HookRegistry(), early_exit=world.config.early_exit)
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        if scenario_id is None:
+            returncode = runner.run_feature(feature)
+        else:
+            # the each_feature hooks are called for the whole feature in the main process
+            world.config.scenarios = [scenario_id]
+            scenario = next(s for s in feature.scenarios if s.absolute_id == scenario_id)
+            returncode = runner.run_scenario(scenario)
+            if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
+                for sub_scenario in scenario.iter_scenarios():
+                    returncode |= runner.run_scenario(sub_scenario)
+
+    return feature_id, returncode, output.getvalue(), collect_results(feature)
+
+
+def collect_results(feature):
+    """
+    Collects the run results of the scenarios which had to run in the given feature
+
+    :param Feature feature: the feature to collect the results from
+
+    :returns: the feature times and the scenario times and step results by scenario id
+    :rtype: tuple
+    """
+    scenarios = {}
+    for scenario in feature.all_scenarios:
+        if not scenario.has_to_run(world.config.scenarios):
+            continue
+
+        steps = [
+            (step.state, step.failure, step.starttime, step.endtime, step.embeddings) for step in scenario.all_steps
+        ]
+        scenarios[scenario.id] = (scenario.starttime, scenario.endtime, steps)
+    return feature.starttime, feature.endtime, scenarios
+
+
+def apply_results(feature, results):
+    """
+    Applies the results collected in a worker process to the given feature
+
+    :param Feature feature: the feature to apply the results to
+    :param tuple results: the results from collect_results()
+    """
+    starttime, endtime, scenarios = results
+    if starttime and (not feature.starttime or starttime < feature.starttime):
+        feature.starttime = starttime
+    if endtime and (not feature.endtime or endtime > feature.endtime):
+        feature.endtime = endtime
+
+    for scenario in feature.all_scenarios:
+        if scenario.id not in scenarios:
+            continue
+
+        scenario.starttime, scenario.endtime, steps = scenarios[scenario.id]
+        for step, (state, failure, step_starttime, step_endtime, embeddings) in zip(scenario.all_steps, steps):
+            step.state = _step_states[state]
+            step.failure = failure
+            step.starttime = step_starttime
+            step.endtime = step_endtime
+            step.embeddings = embeddings
+
+
+class ProcessPoolRunner(Runner):
+    """
+    Represents a Runner which runs the features in a pool of worker processes.
+
+    The worker processes are forked from the main process and therefore
+    share the parsed features, the loaded step definitions and the hooks.
+    The ``all`` hooks are only called in the main process while all other
+    hooks are called in the worker processes. If single scenarios are distributed,
+    the ``each_feature`` hooks are called in the main process as well, around the
+    scenarios of the feature. The results are sent back to the
+    main process so that the ``after.all`` hooks see them as from a sequential run.
+    """
+
+    def __init__(self, hooks, workers, distribute_scenarios=False, early_exit=False):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RadishError("Running features in worker processes is not supported on this platform")
+
+        super().__init__(hooks, early_exit=early_exit)
+        self._workers = workers
+        self._distribute_scenarios = distribute_scenarios
+        self._pool = None
+
+    def get_tasks(self, features):
+        """
+        Returns the tasks for the worker processes
+
+        A task is the id of a feature and the absolute id of the scenario to run.
+        If whole features are distributed the scenario id is None.
+        """
+        tasks = []
+        for feature in features:
+            if not feature.has_to_run(world.config.scenarios):
+                continue
+
+            if not self._distribute_scenarios:
+                tasks.append((feature.id, None))
+                continue
+
+            scenarios = [s for s in feature.scenarios if s.has_to_run(world.config.scenarios)]
+            if world.config.shuffle:
+                shuffle(scenarios)
+            tasks.extend((feature.id, s.absolute_id) for s in scenarios)
+        return tasks
+
+    @Runner.handle_exit
+    @Runner.call_hooks("all")
+    def start(self, features, marker):
+        """
+        Start running features in the worker processes
+
+        :param list features: the features to run
+        :param string marker: the marker for this run
+        """
+        if world.config.shuffle:
+            shuffle(features)
+
+        _worker_features.clear()
+        _worker_features.update((f.id, f) for f in features)
+
+        with multiprocessing.get_context("fork").Pool(self._workers) as pool:
+            self._pool = pool
+            try:
+                if not self._distribute_scenarios:
+                    returncode = self._run_tasks(self.get_tasks(features))
+                else:
+                    returncode = 0  # return code is set to 1 if any feature fails
+                    for feature in features:
+                        if not feature.has_to_run(world.config.scenarios):
+                            continue
+
+                        returncode |= self.run_feature(feature)
+            finally:
+                self._pool = None
+
+        if self._required_exit:
+            return 1
+
+        if world.config.wip:
+            # swap the state from 0 to 1
+            # and the other way around
+            returncode ^= 1
+
+        return returncode
+
+    @Runner.handle_exit
+    @Runner.call_hooks("each_feature")
+    def run_feature(self, feature):
+        """
+        Runs the scenarios of the given feature in the worker processes
+
+        The each_feature hooks are only called once in the main process.
+
+        :param Feature feature: the feature to run
+        """
+        return self._run_tasks(self.get_tasks([feature]))
+
+    def _run_tasks(self, tasks):
+        """
+        Runs the given tasks in the worker processes and applies their results
+
+        :param list tasks: the tasks to run
+
+        :returns: the return code of the tasks
+        :rtype: int
+        """
+        returncode = 0
+        for feature_id, task_returncode, output, results in self._pool.imap(_run_in_worker, tasks):
+            apply_results(_worker_features[feature_id], results)
+            if output:
+                sys.stdout.write(output)
+
+            returncode |= task_returncode
+            if task_returncode and self._early_exit:
+                self._pool.terminate()
+                self.exit()
+                return 1
+        return returncode
+
+
+def run_with_world(world_attributes, func, *args):
+    """
+    Runs the given function with the given world attributes in the current thread
+
+    The attribute values are shared instead of copied, because the calling
+    thread waits for the function.
+
+    :param dict world_attributes: the world attributes of the calling thread
+    :param callable func: the function to run
+
+    :returns: the result of the function and the world attributes afterwards
+    :rtype: tuple
+    """
+    world.__dict__.clear()
+    world.__dict__.update(world_attributes)
+    try:
+        return func(*args), dict(world.__dict__)
+    finally:
+        world.__dict__.clear()
+
+
+def copy_world(world_attributes):
+    """
+    Copies the given world attributes into the world of the current thread
+
+    Every thread gets its own copy of the configuration.
+
+    :param dict world_attributes: the world attributes of the main thread
+    """
+    for name, value in world_attributes.items():
+        setattr(world, name, value)
+    world.config = copy.copy(world_attributes["config"])
+
+
+class CapturedOutput:
+    """
+    Represents a stream which writes to a buffer of the current context
+    if the context captures its output. Otherwise it writes to the wrapped stream.
+
+    Every thread and every asyncio task has its own context.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffer = ContextVar("captured_output", default=None)
+
+    def capture(self):
+        """
+        Starts capturing the output of the current context
+        """
+        self._buffer.set(io.StringIO())
+
+    def release(self):
+        """
+        Stops capturing the output of the current context
+
+        :returns: the captured output
+        :rtype: str
+        """
+        buffer = self._buffer.get()
+        self._buffer.set(None)
+        return buffer.getvalue()
+
+    def write(self, text):
+        return (self._buffer.get() or self.stream).write(text)
+
+    def flush(self):
+        (self._buffer.get() or self.stream).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class ThreadPoolRunner(Runner):
+    """
+    Represents a Runner which runs the scenarios of a feature in a pool of threads.
+
+    The features are run one after another. Every thread has its own ``world``
+    with a copy of the attributes the main thread had when the run started.
+    The console output of a scenario is captured and written once the scenario
+    and all scenarios before it are finished.
+    """
+
+    def __init__(self, hooks, threads, early_exit=False, release_scenario_steps=False):
+        super().__init__(hooks, early_exit=early_exit, release_scenario_steps=release_scenario_steps)
+        self._threads = threads
+        self._executor = None
+        self._output = None
+
+    @Runner.handle_exit
+    @Runner.call_hooks("all")
+    def start(self, features, marker):
+        """
+        Start running features with the scenarios in the threads
+
+        :param list features: the features to run
+        :param string marker: the marker for this run
+        """
+        if world.config.shuffle:
+            shuffle(features)
+
+        world_attributes = dict(world.__dict__)
+        self._output = CapturedOutput(sys.stdout)
+        sys.stdout = self._output
+        try:
+            with ThreadPoolExecutor(self._threads, initializer=copy_world, initargs=(world_attributes,)) as executor:
+                self._executor = executor
+                returncode = 0  # return code is set to 1 if any feature fails
+                for feature in features:
+                    if not feature.has_to_run(world.config.scenarios):
+                        continue
+
+                    returncode |= self.run_feature(feature)
+        finally:
+            sys.stdout = self._output.stream
+            self._executor = None
+            # the threads of the pool are gone, thus, their event loops are not used anymore
+            close_step_event_loops()
+
+        if world.config.wip:
+            # swap the state from 0 to 1
+            # and the other way around
+            returncode ^= 1
+
+        return returncode
+
+    @Runner.handle_exit
+    @Runner.call_hooks("each_feature")
+    def run_feature(self, feature):
+        """
+        Runs the scenarios of the given feature in the threads
+
+        :param Feature feature: the feature to run
+        """
+        if world.config.shuffle:
+            shuffle(feature.scenarios)
+
+        scenario_runs = [
+            self._executor.submit(self._run_scenario_in_thread, scenario)
+            for scenario in feature
+            if scenario.has_to_run(world.config.scenarios)
+        ]
+
+        returncode = 0
+        for scenario_run in scenario_runs:
+            scenario_returncode, output = scenario_run.result()
+            self._output.write(output)
+            returncode |= scenario_returncode
+        return returncode
+
+    def _run_scenario_in_thread(self, scenario):
+        """
+        Runs the given scenario and its sub scenarios in a thread
+
+        :param Scenario scenario: the scenario to run
+
+        :returns: the return code and the captured console output
+        :rtype: tuple
+        """
+        self._output.capture()
+        try:
+            returncode = self.run_scenario(scenario)
+            if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
+                for sub_scenario in scenario.iter_scenarios():
+                    returncode |= self.run_scenario(sub_scenario)
+                    self.release_steps(sub_scenario)
+        finally:
+            output = self._output.release()
+        return returncode, output
+
+
+class AsyncRunner(Runner):
+    """
+    Represents a Runner which runs the scenarios of a feature concurrently as asyncio tasks.
+
+    The features are run one after another. At most ``concurrency`` scenarios
+    of a feature run at the same time on the event loop of the run. The steps of
+    a scenario still run one after another, but while an async step definition
+    awaits, the steps of other scenarios can run.
+    Sync step definitions run one after another in a separate thread, thus,
+    they do not block the event loop and can call ``step.behave_like`` for
+    async steps, which run on the event loop of that thread.
+    All scenarios share the ``world``. The changes of a sync step definition
+    are applied to the ``world`` once it returns.
+    The console output of a scenario is written once the scenario
+    and all scenarios before it are finished.
+    """
+
+    def __init__(self, hooks, concurrency, early_exit=False, show_only=False, release_scenario_steps=False):
+        super().__init__(
+            hooks, early_exit=early_exit, show_only=show_only, release_scenario_steps=release_scenario_steps
+        )
+        self._concurrency = concurrency
+        self._output = None
+        self._step_executor = None
+
+    @Runner.handle_exit
+    @Runner.call_hooks("all")
+    def start(self, features, marker):
+        """
+        Start running features with the scenarios as asyncio tasks
+
+        :param list features: the features to run
+        :param string marker: the marker for this run
+        """
+        if world.config.shuffle:
+            shuffle(features)
+
+        self._output = CapturedOutput(sys.stdout)
+        sys.stdout = self._output
+        try:
+            with ThreadPoolExecutor(1) as self._step_executor:
+                returncode = 0  # return code is set to 1 if any feature fails
+                for feature in features:
+                    if not feature.has_to_run(world.config.scenarios):
+                        continue
+
+                    returncode |= self.run_feature(feature)
+        finally:
+            sys.stdout = self._output.stream
+            self._step_executor = None
+            close_step_event_loops()
+
+        if world.config.wip:
+            # swap the state from 0 to 1
+            # and the other way around
+            returncode ^= 1
+
+        return returncode
+
+    @Runner.handle_exit
+    @Runner.call_hooks("each_feature")
+    def run_feature(self, feature):
+        """
+        Runs the scenarios of the given feature concurrently
+
+        :param Feature feature: the feature to run
+        """
+        if world.config.shuffle:
+            shuffle(feature.scenarios)
+
+        scenarios = [s for s in feature if s.has_to_run(world.config.scenarios)]
+        return get_step_event_loop().run_until_complete(self._run_scenarios(scenarios))
+
+    async def _run_scenarios(self, scenarios):
+        """
+        Runs the given scenarios as asyncio tasks and writes their output in order
+
+        :param list scenarios: the scenarios to run
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        results = await asyncio.gather(*(self._run_scenario_in_task(s, semaphore) for s in scenarios))
+
+        returncode = 0
+        for scenario_returncode, output in results:
+            self._output.write(output)
+            returncode |= scenario_returncode
+        return returncode
+
+    async def _run_scenario_in_task(self, scenario, semaphore):
+        """
+        Runs the given scenario and its sub scenarios in an asyncio task
+
+        :param Scenario scenario: the scenario to run
+        :param asyncio.Semaphore semaphore: the semaphore limiting the concurrent scenarios
+
+        :returns: the return code and the captured console output
+        :rtype: tuple
+        """
+        async with semaphore:
+            self._output.capture()
+            try:
+                returncode = await self.run_scenario_async(scenario)
+                if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
+                    for sub_scenario in scenario.iter_scenarios():
+                        returncode |= await self.run_scenario_async(sub_scenario)
+                        self.release_steps(sub_scenario)
+            finally:
+                output = self._output.release()
+        return returncode, output
+
+    async def run_scenario_async(self, scenario):
+        """
+        Runs the given scenario on the running event loop
+
+        :param Scenario scenario: the scenario to run
+        """
+        if self._required_exit:
+            return 1
+
+        if self._hooks.has_hooks("before", "each_scenario"):
+            self._hooks.call("before", "each_scenario", True, scenario)
+
+        if not self._hooks.has_hooks("after", "each_scenario"):
+            # there are no after hooks to call for this model
+            return await self._run_steps_async(scenario)
+
+        try:
+            return await self._run_steps_async(scenario)
+        finally:
+            self._hooks.call("after", "each_scenario", False, scenario)
+
+    async def _run_steps_async(self, scenario):
+        """
+        Runs the steps of the given scenario on the running event loop
+
+        :param Scenario scenario: the scenario to run the steps of
+        """
+        returncode = 0
+        steps = scenario.all_steps if world.config.expand else scenario.steps
+        for step in steps:
+            if scenario.state == Step.State.FAILED:
+                self.skip_step(step)
+                continue
+
+            returncode |= await self.run_step_async(step)
+
+            if step.state == step.State.FAILED and self._early_exit:
+                self.exit()
+                return 1
+        return returncode
+
+    async def run_step_async(self, step):
+        """
+        Runs the given step on the running event loop
+
+        :param Step step: the step to run
+        """
+        if self._required_exit:
+            return 1
+
+        if self._hooks.has_hooks("before", "each_step"):
+            self._hooks.call("before", "each_step", True, step)
+
+        if not self._hooks.has_hooks("after", "each_step"):
+            # there are no after hooks to call for this model
+            return await self._run_step_async(step)
+
+        try:
+            return await self._run_step_async(step)
+        finally:
+            self._hooks.call("after", "each_step", False, step)
+
+    async def _run_step_async(self, step):
+        """
+        Runs the given step on the running event loop unless only the steps are shown
+
+        :param Step step: the step to run
+        """
+        if self._show_only:
+            return 0
+
+        if inspect.iscoroutinefunction(step.definition_func):
+            state = await step.run_async()
+        else:
+            state = await self._run_sync_step(step)
+        return 1 if state == Step.State.FAILED else 0
+
+    async def _run_sync_step(self, step):
+        """
+        Runs the given step with a sync step definition in the step thread
+
+        The console output is captured for the scenario of the step because
+        the step runs in a copy of the current context.
+
+        :param Step step: the step to run
+        """
+        world_attributes = dict(world.__dict__)
+        context = contextvars.copy_context()
+        state, changed_attributes = await asyncio.get_running_loop().run_in_executor(
+            self._step_executor, context.run, run_with_world, world_attributes, step.run
+        )
+
+        # only apply the changes of the step because other scenarios may have changed the world meanwhile
+        for name in world_attributes:
+            if name not in changed_attributes:
+                world.__dict__.pop(name, None)
+        for name, value in changed_attributes.items():
+            if world_attributes.get(name, _missing) is not value:
+                setattr(world, name, value)
+        return state
@@ -0,0 +1,118 @@
+"""
+This module provides an on-disk cache for parsed features
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from . import __VERSION__
+
+
+class ParseCache:
+    """
+    Represents an on-disk cache for parsed features
+
+    An entry holds all features parsed for a feature file. Every entry is
+    stored in its own file named after the path of the feature file and the
+    tag expression used to parse it. The entry is only valid as long as the
+    contents of all feature files it was parsed from are unchanged.
+    Thus, changing a feature file invalidates all entries which depend on it
+    through a ``@precondition`` tag.
+    """
+
+    DEFAULT_DIRECTORY = ".radish_cache"
+
+    def __init__(self, directory=None):
+        self.directory = directory or self.DEFAULT_DIRECTORY
+        self._digests = {}
+
+    def get_digest(self, path):
+        """
+        Returns the digest of the contents of the given file
+
+        The digest is only calculated once per file.
+
+        :param str path: the path to the file
+        """
+        path = os.path.abspath(path)
+        digest = self._digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self._digests[path] = digest
+        return digest
+
+    def get_entry_path(self, featurefile, tag_expr):
+        """
+        Returns the path to the entry for the given feature file and tag expression
+
+        :param str featurefile: the path to the feature file
+        :param tag_expr: the tag expression used to parse the feature file or None
+        """
+        key = "\0".join((__VERSION__, os.path.abspath(featurefile), str(tag_expr or "")))
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".pickle")
+
+    @staticmethod
+    def get_precondition_paths(feature):
+        """
+        Returns the paths to all feature files the given feature imports precondition scenarios from
+
+        :param Feature feature: the feature
+        """
+        paths = set()
+        # the scenarios of Scenario Outlines and Loops do not have own preconditions
+        # and must not be built before the feature is cached
+        preconditions = [p for s in feature.scenarios for p in s.preconditions]
+        while preconditions:
+            precondition = preconditions.pop()
+            paths.add(precondition.path)
+            preconditions.extend(precondition.preconditions)
+        return paths
+
+    def load(self, featurefile, tag_expr):
+        """
+        Loads the features parsed for the given feature file
+
+        :param str featurefile: the path to the feature file
+        :param tag_expr: the tag expression used to parse the feature file or None
+
+        :returns: the parsed features and the feature of the feature file or None if there is no valid entry
+        :rtype: tuple
+        """
+        try:
+            with open(self.get_entry_path(featurefile, tag_expr), "rb") as f:
+                digests = pickle.load(f)
+                if any(self.get_digest(path) != digest for path, digest in digests.items()):
+                    return None
+                return pickle.load(f)
+        except Exception:
+            # a missing, outdated or broken entry is just parsed again
+            return None
+
+    def store(self, featurefile, tag_expr, features, feature):
+        """
+        Stores the features parsed for the given feature file
+
+        :param str featurefile: the path to the feature file
+        :param tag_expr: the tag expression used to parse the feature file or None
+        :param list features: all features parsed for the feature file
+        :param Feature feature: the feature of the feature file or None
+        """
+        paths = {featurefile}
+        paths.update(f.path for f in features)
+        if feature is not None:
+            paths.update(self.get_precondition_paths(feature))
+        digests = {os.path.abspath(p): self.get_digest(p) for p in paths}
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(digests, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump((features, feature), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.get_entry_path(featurefile, tag_expr))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
@@ -3,13 +3,13 @@ Feature file parser.
 One Feature file parser instance is able to parse one feature file.
 """
 
-import copy
 import filecmp
 import io
 import json
 import os
 import re
 import string
+from threading import Lock
 
 from . import utils
 from .background import Background
@@ -46,6 +46,123 @@ class Keywords:
         self.iterations = iterations
 
 
+class LineTokenizer:
+    """
+    Sorts the lines of a feature file into tokens
+
+    Every line is sorted in a single pass with a regex
+    which is compiled once for the keywords of a language.
+    """
+
+    COMMENT = "comment"
+    TAG = "tag"
+    TABLE_ROW = "table_row"
+    STEP_TEXT = "step_text"
+    FEATURE = "feature"
+    BACKGROUND = "background"
+    SCENARIO = "scenario"
+    SCENARIO_OUTLINE = "scenario_outline"
+    SCENARIO_LOOP = "scenario_loop"
+    EXAMPLES = "examples"
+    #: any other line, e.g. a step or a feature description line
+    TEXT = "text"
+
+    #: The tokens of the keywords followed by the delimiter and a value
+    KEYWORD_TOKENS = (FEATURE, BACKGROUND, SCENARIO, SCENARIO_OUTLINE, EXAMPLES)
+
+    def __init__(self, keywords, delimiter=":"):
+        self.keyword_regex = re.compile(
+            r"^(?:{})(?P<value>.*)$".format(
+                "|".join(
+                    [
+                        r"(?P<feature>{})\s*{}".format(keywords.feature, delimiter),
+                        r"(?P<background>{})\s*{}".format(keywords.background, delimiter),
+                        r"(?P<scenario>{})\s*{}".format(keywords.scenario, delimiter),
+                        r"(?P<scenario_outline>{})\s*{}".format(keywords.scenario_outline, delimiter),
+                        r"(?P<scenario_loop>{}) (?P<iterations>\d+):".format(keywords.scenario_loop),
+                        r"(?P<examples>{})\s*{}".format(keywords.examples, delimiter),
+                    ]
+                )
+            )
+        )
+
+    def tokenize(self, line):
+        """
+        Sorts the given line into a token
+
+        :param str line: the stripped and not empty line
+
+        :returns: the token and the value of the line.
+                  The value of a Scenario Loop is its sentence and its iterations.
+        :rtype: tuple
+        """
+        first_char = line[0]
+        if first_char == "#":
+            return self.COMMENT, None
+        if first_char == "@":
+            return self.TAG, None
+        if first_char == "|":
+            return self.TABLE_ROW, None
+        if line.startswith('"""'):
+            return self.STEP_TEXT, None
+
+        match = self.keyword_regex.match(line)
+        if match is None:
+            return self.TEXT, None
+
+        value = match.group("value").strip()
+        if match.group("scenario_loop") is not None:
+            return self.SCENARIO_LOOP, (value, int(match.group("iterations")))
+
+        for token in self.KEYWORD_TOKENS:
+            if match.group(token) is not None:
+                return token, value
+
+
+class KeywordPackCache(metaclass=utils.Singleton):
+    """
+    Process wide cache of the keywords and the LineTokenizer of every loaded language
+
+    The language files are only read and the keyword regexes
+    only compiled once per process for all FeatureParsers.
+    """
+
+    def __init__(self):
+        self._packs = {}
+        self._lock = Lock()
+
+    def get(self, language_path, delimiter):
+        """
+        Returns the keywords and the LineTokenizer of the given language file
+
+        :param str language_path: the path to the language file
+        :param str delimiter: the delimiter following the keywords
+
+        :returns: the Keywords and the LineTokenizer
+        :rtype: tuple
+
+        :raises OSError: if the language file cannot be read
+        """
+        key = (language_path, delimiter)
+        pack = self._packs.get(key)
+        if pack is None:
+            with self._lock:
+                pack = self._packs.get(key)
+                if pack is None:
+                    with open(language_path, encoding="utf-8") as f:
+                        language_pkg = json.load(f)
+
+                    keywords = Keywords(**language_pkg["keywords"])
+                    pack = self._packs[key] = (keywords, LineTokenizer(keywords, delimiter))
+        return pack
+
+    def clear(self):
+        """
+        Clears all cached keyword packs
+        """
+        self._packs = {}
+
+
 class FeatureParser:
     """
     Class to parse a feature file.
@@ -54,7 +171,12 @@ class FeatureParser:
 
     LANGUAGE_LOCATION = os.path.join(os.path.dirname(__file__), "languages")
     DEFAULT_LANGUAGE = "en"
+    KEYWORDS_DELIMITER = ":"
     CONTEXT_CLASSES = ["given", "when", "then", "but"]
+    #: Matches the language comment of a feature file
+    LANGUAGE_REGEX = re.compile("^# language: (.*)")
+    #: Matches a tag with its argument in parenthesis, e.g. ``author(tuxtimo)``
+    TAG_WITH_ARGUMENT_REGEX = re.compile(r"^([^\s]+)\((.*)\)")
 
     class State:
         """
@@ -88,7 +210,7 @@ class FeatureParser:
         self._featurefile = featurefile
         self._tag_expr = tag_expr
         self.keywords = {}
-        self._keywords_delimiter = ":"
+        self._keywords_delimiter = self.KEYWORDS_DELIMITER
         self._inherited_tags = inherited_tags or []
 
         self._current_state = FeatureParser.State.FEATURE
@@ -97,6 +219,8 @@ class FeatureParser:
         self._current_preconditions = []
         self._current_constants = []
         self._current_scenario = None
+        #: Holds the sentences of all parsed scenarios to detect duplicates
+        self._scenario_sentences = set()
         #: Holds the current context class for a Step.
         #  eg. If a step is: 'And I have the number'
         #  and this step was preceeded by 'Given I have the number
@@ -106,7 +230,20 @@ class FeatureParser:
         # used to save text indention
         # - negative number indicates that there is now step text parsing
         self._in_step_text_index = -1
+        #: Holds the token and its value of the current line
+        self._current_token = None
         self.feature = None
+        self._tokenizer = None
+        self._state_handlers = {
+            FeatureParser.State.FEATURE: self._parse_feature,
+            FeatureParser.State.BACKGROUND: self._parse_background,
+            FeatureParser.State.SCENARIO: self._parse_scenario,
+            FeatureParser.State.STEP: self._parse_step,
+            FeatureParser.State.EXAMPLES: self._parse_examples,
+            FeatureParser.State.EXAMPLES_ROW: self._parse_examples_row,
+            FeatureParser.State.STEP_TEXT: self._parse_step_text,
+            FeatureParser.State.SKIP_SCENARIO: self._parse_skip_scenario,
+        }
 
         self._load_language(language)
 
@@ -127,28 +264,38 @@ class FeatureParser:
 
         language_path = os.path.join(self.LANGUAGE_LOCATION, language + ".json")
         try:
-            with open(language_path, encoding="utf-8") as f:
-                language_pkg = json.load(f)
+            self.keywords, self._tokenizer = KeywordPackCache().get(language_path, self._keywords_delimiter)
         except OSError:
             raise LanguageNotSupportedError(language)
 
-        self.keywords = Keywords(**language_pkg["keywords"])
+    @classmethod
+    def preload_language(cls, language=DEFAULT_LANGUAGE):
+        """
+        Loads the keywords of the given language into the process wide KeywordPackCache
+
+        :param string language: the language to load
+        """
+        KeywordPackCache().get(os.path.join(cls.LANGUAGE_LOCATION, language + ".json"), cls.KEYWORDS_DELIMITER)
 
     def parse(self):
         """
         Parses the feature file of this `FeatureParser` instance
 
+        The feature file is read line by line. Every line is sorted into
+        a token once and handled by the handler of the current state.
+
         :returns: if the parsing was successful or not
         :rtype: bool
         """
         with open(self._featurefile, encoding="utf-8") as f:
-            for line in f.readlines():
+            for line in f:
                 self._current_line += 1
                 line_strip = line.strip()
                 if not line_strip:  # line is empty
                     continue
 
-                if line_strip.startswith("#"):
+                self._current_token = token, value = self._tokenizer.tokenize(line_strip)
+                if token is LineTokenizer.COMMENT:
                     # try to detect feature file language
                     language = self._detect_language(line)
                     if language:
@@ -157,10 +304,10 @@ class FeatureParser:
                     continue
 
                 if self.feature:
-                    if self._detect_feature(line_strip):
+                    if token is LineTokenizer.FEATURE and value:
                         raise FeatureFileSyntaxError("radish supports only one Feature per feature file")
 
-                    if self._detect_background(line_strip):
+                    if token is LineTokenizer.BACKGROUND and value:
                         if self.feature.background:
                             raise FeatureFileSyntaxError("The Background block may only appear once in a Feature")
 
@@ -192,7 +339,7 @@ class FeatureParser:
 
         :param string line: the line to parse from
         """
-        parse_context_func = getattr(self, "_parse_" + self._current_state, None)
+        parse_context_func = self._state_handlers.get(self._current_state)
         if not parse_context_func:
             raise RadishError("FeatureParser state {} is not supported".format(self._current_state))
 
@@ -207,8 +354,8 @@ class FeatureParser:
         :param string line: the line to parse from
         """
         line = line.strip()
-        detected_feature = self._detect_feature(line)
-        if not detected_feature:
+        token, detected_feature = self._current_token
+        if token is not LineTokenizer.FEATURE or not detected_feature:
             tags = self._try_parse_tags(line)
             for tag in tags:
                 if tag.name == "constant":
@@ -237,10 +384,10 @@ class FeatureParser:
         :param str line: the line to parse the background
         """
         line = line.strip()
-        detected_background = self._detect_background(line)
-        if detected_background is None:
+        token, detected_background = self._current_token
+        if token is not LineTokenizer.BACKGROUND:
             # try to find a scenario
-            if self._detect_scenario_type(line):
+            if self._detect_scenario_type():
                 return self._parse_scenario(line)
 
             # this line is interpreted as a feature description line
@@ -265,16 +412,17 @@ class FeatureParser:
         :param string line: the line to parse from
         """
         line = line.strip()
-        detected_scenario = self._detect_scenario(line)
+        token, value = self._current_token
+        detected_scenario = value if token is LineTokenizer.SCENARIO else None
         scenario_type = Scenario
         keywords = (self.keywords.scenario,)
         if not detected_scenario:
-            detected_scenario = self._detect_scenario_outline(line)
+            detected_scenario = value if token is LineTokenizer.SCENARIO_OUTLINE else None
             scenario_type = ScenarioOutline
             keywords = (self.keywords.scenario_outline, self.keywords.examples)
 
             if not detected_scenario:
-                detected_scenario = self._detect_scenario_loop(line)
+                detected_scenario = value if token is LineTokenizer.SCENARIO_LOOP else None
                 if not detected_scenario:
                     tags = self._try_parse_tags(line)
                     for tag in tags:
@@ -296,7 +444,7 @@ class FeatureParser:
                 scenario_type = ScenarioLoop
                 keywords = (self.keywords.scenario_loop, self.keywords.iterations)
 
-        if detected_scenario in self.feature:
+        if detected_scenario in self._scenario_sentences:
             raise FeatureFileSyntaxError(
                 "Scenario with name '{}' defined twice in feature '{}'".format(detected_scenario, self.feature.path)
             )
@@ -304,8 +452,8 @@ class FeatureParser:
         scenario_id = 1
         if self.feature.scenarios:
             previous_scenario = self._current_scenario
-            if hasattr(previous_scenario, "scenarios") and previous_scenario.scenarios:
-                scenario_id = previous_scenario.scenarios[-1].id + 1
+            if getattr(previous_scenario, "amount_of_scenarios", 0):
+                scenario_id = previous_scenario.id + previous_scenario.amount_of_scenarios + 1
             else:
                 scenario_id = previous_scenario.id + 1
 
@@ -338,6 +486,7 @@ class FeatureParser:
             background=background,
         )
         self.feature.scenarios.append(scenario)
+        self._scenario_sentences.add(scenario.sentence)
         self._current_scenario = scenario
         self._current_scenario.context.constants = self._current_constants
         self._current_tags = []
@@ -371,7 +520,7 @@ class FeatureParser:
         """
         line = line.strip()
         # detect next keyword
-        if self._detect_scenario_type(line):
+        if self._detect_scenario_type():
             self._current_scenario.after_parse()
             return self._parse_scenario(line)
 
@@ -391,19 +540,20 @@ class FeatureParser:
         """
         line_strip = line.strip()
         # detect next keyword
-        if self._detect_scenario_type(line_strip):
+        if self._detect_scenario_type():
             self._current_scenario.after_parse()
             return self._parse_scenario(line_strip)
 
-        if self._detect_step_text(line_strip):
+        token = self._current_token[0]
+        if token is LineTokenizer.STEP_TEXT:
             self._current_state = self.State.STEP_TEXT
             return self._parse_step_text(line)
 
-        if self._detect_table(line_strip):
+        if token is LineTokenizer.TABLE_ROW:
             self._parse_table(line_strip)
             return True
 
-        if self._detect_examples(line_strip):
+        if token is LineTokenizer.EXAMPLES:
             self._current_state = FeatureParser.State.EXAMPLES
             return True
 
@@ -456,13 +606,12 @@ class FeatureParser:
         """
 
         def dedent(_str):
-            ret_line = ""
-            for char_index in range(len(_str)):
-                if not ret_line and char_index < self._in_step_text_index and _str[char_index] in string.whitespace:
-                    continue
-                else:
-                    ret_line += _str[char_index]
-            return ret_line.rstrip()
+            # strip the whitespace up to the indention of the step text block
+            char_index = 0
+            max_index = min(len(_str), self._in_step_text_index)
+            while char_index < max_index and _str[char_index] in string.whitespace:
+                char_index += 1
+            return _str[char_index:].rstrip()
 
         line_strip = line.strip()
         if line_strip.startswith('"""') and self._in_step_text_index == -1:
@@ -501,7 +650,7 @@ class FeatureParser:
         feature_file = os.path.join(os.path.dirname(self._featurefile), feature_file_name)
 
         # check if the precondition Scenario is in the same feature file.
-        # If this happens to be the case the current feature is just copied as is.
+        # If this happens to be the case only the precondition Scenario is copied.
         if filecmp.cmp(self._featurefile, feature_file):
             if scenario_sentence not in self.feature:
                 raise FeatureFileSyntaxError(
@@ -510,23 +659,20 @@ class FeatureParser:
                     )
                 )
 
-            feature = copy.deepcopy(self.feature)
-            self._core.features.append(feature)
-        else:
-            try:
-                current_tags = self._current_tags + self.feature.tags + self._inherited_tags
-                feature = self._core.parse_feature(feature_file, self._tag_expr, inherited_tags=current_tags)
-            except RecursionError as e:
-                if str(e).startswith("maximum recursion depth exceeded"):  # precondition cycling
-                    raise FeatureFileSyntaxError(
-                        "Your feature '{}' has cycling preconditions with '{}: {}' starting at line {}".format(
-                            self._featurefile,
-                            feature_file_name,
-                            scenario_sentence,
-                            self._current_line,
-                        )
-                    )
-                raise
+            return self.feature[scenario_sentence].create_precondition_instance()
+
+        if self._core.is_parsing(feature_file):
+            raise FeatureFileSyntaxError(
+                "Your feature '{}' has cycling preconditions with '{}: {}' starting at line {}".format(
+                    self._featurefile,
+                    feature_file_name,
+                    scenario_sentence,
+                    self._current_line,
+                )
+            )
+
+        current_tags = self._current_tags + self.feature.tags + self._inherited_tags
+        feature = self._core.parse_precondition_feature(feature_file, self._tag_expr, current_tags)
 
         if feature is None:
             return None
@@ -538,7 +684,9 @@ class FeatureParser:
                 )
             )
 
-        return feature[scenario_sentence]
+        # the precondition feature is shared, thus, the scenario is copied
+        # because its steps are taken over by the current scenario
+        return feature[scenario_sentence].create_precondition_instance()
 
     def _parse_constant(self, arguments):
         """
@@ -558,145 +706,29 @@ class FeatureParser:
         Parses the next lines until the next scenario is reached
         """
         line = line.strip()
-        if self._detect_scenario_type(line):
+        if self._detect_scenario_type():
             return self._parse_scenario(line)
 
         return True
 
-    def _detect_keyword(self, keyword, line):
-        """
-        Detects a keyword on a given line
-
-        :param keyword: the keyword to detect
-        :param line: the line in which we want to detect the keyword
-
-        :return: the line without the detected keyword
-        :rtype: string or None
-        """
-
-        pattern = r"^{keyword}\s*{delimiter}(.*)$".format(keyword=keyword, delimiter=self._keywords_delimiter)
-        match = re.match(pattern, line)
-
-        if match:
-            return match.group(1).strip()
-
-        return None
-
-    def _detect_feature(self, line):
-        """
-        Detects a feature on the given line
-
-        :param string line: the line to detect a feature
-
-        :returns: the detected feature on the given line
-        :rtype: string or None
-        """
-
-        return self._detect_keyword(self.keywords.feature, line)
-
-    def _detect_background(self, line):
+    def _detect_scenario_type(self):
         """
-        Detects a background on the given line
+        Detect a Scenario/ScenarioOutline/ScenarioLoop/Tag on the current line.
 
-        :param string line: the line to detect a background
-
-        :returns: the detected background on the given line
-        :rtype: string or None
-        """
-
-        return self._detect_keyword(self.keywords.background, line)
-
-    def _detect_scenario_type(self, line):
-        """
-        Detect a Scenario/ScenarioOutline/ScenarioLoop/Tag on the given line.
-
-        :returns: if a scenario of any type is present on the given line
+        :returns: if a scenario of any type is present on the current line
         :rtype: bool
         """
+        token, value = self._current_token
         if (
-            self._detect_scenario(line)
-            or self._detect_scenario_outline(line)
-            or self._detect_scenario_loop(line)
-            or self._detect_tag(line)
+            (token in (LineTokenizer.SCENARIO, LineTokenizer.SCENARIO_OUTLINE) and value)
+            or token is LineTokenizer.SCENARIO_LOOP
+            or token is LineTokenizer.TAG
         ):
             self._current_state = FeatureParser.State.SCENARIO
             return True
 
         return False
 
-    def _detect_scenario(self, line):
-        """
-        Detects a scenario on the given line
-
-        :param string line: the line to detect a scenario
-
-        :returns: the scenario detected on the given line
-        :rtype: string or None
-        """
-
-        return self._detect_keyword(self.keywords.scenario, line)
-
-    def _detect_scenario_outline(self, line):
-        """
-        Detects a scenario outline on the given line
-
-        :param string line: the line to detect a scenario outline
-
-        :returns: the scenario outline detected on the given line
-        :rtype: string or None
-        """
-
-        return self._detect_keyword(self.keywords.scenario_outline, line)
-
-    def _detect_examples(self, line):
-        """
-        Detects an Examples block on the given line
-
-        :param string line: the line to detect the Examples
-
-        :returns: if an Examples block was found on the given line
-        :rtype: bool
-        """
-
-        return self._detect_keyword(self.keywords.examples, line) is not None
-
-    def _detect_scenario_loop(self, line):
-        """
-        Detects a scenario loop on the given line
-
-        :param string line: the line to detect a scenario loop
-
-        :returns: if a scenario loop was found on the given line
-        :rtype: string
-        """
-        match = re.search(r"^{} (\d+):(.*)".format(self.keywords.scenario_loop), line)
-        if match:
-            return match.group(2).strip(), int(match.group(1))
-
-        return None
-
-    def _detect_table(self, line):
-        """
-        Detects a step table row on the given line
-
-        :param string line: the line to detect the table row
-
-        :returns: if an step table row was found or not
-        :rtype: bool
-        """
-        return line.startswith("|")
-
-    def _detect_step_text(self, line):
-        """
-        Detects the beginning of an additional step text block
-
-        :param str line: the line to detect the step text block
-
-        :returns: if a step text block was found or not
-        :rtype: bool
-        """
-        return line.startswith('"""')
-
     def _detect_language(self, line):
         """
         Detects a language on the given line
@@ -706,7 +738,7 @@ class FeatureParser:
         :returns: the language or None
         :rtype: str or None
         """
-        match = re.search("^# language: (.*)", line)
+        match = self.LANGUAGE_REGEX.search(line)
         if match:
             return match.group(1)
 
@@ -750,7 +782,7 @@ class FeatureParser:
             # each part as tag (also for constant)
             # this is required for @foo @bar @baz
             for line in [li.strip() for li in line.split("@") if li]:
-                match = re.search(r"^([^\s]+)\((.*)\)", line)
+                match = self.TAG_WITH_ARGUMENT_REGEX.search(line)
                 if match:
                     tag = Tag(match.group(1), match.group(2))
                 else:
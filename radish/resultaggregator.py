@@ -0,0 +1,224 @@
+"""
+This module provides an aggregator for the results of a run shared by all reporters
+"""
+
+from datetime import timedelta
+from threading import Lock
+
+from .scenarioloop import ScenarioLoop
+from .scenariooutline import ScenarioOutline
+from .stepmodel import Step
+from .terrain import world
+from .utils import Singleton
+
+#: Holds the states counted in the results
+STATES = (
+    Step.State.PASSED,
+    Step.State.FAILED,
+    Step.State.SKIPPED,
+    Step.State.UNTESTED,
+    Step.State.PENDING,
+)
+
+
+def create_counts():
+    """
+    Returns new counts for the amount of models and the models in every state
+    """
+    counts = dict.fromkeys(STATES, 0)
+    counts["amount"] = 0
+    return counts
+
+
+def get_model_duration(model):
+    """
+    Returns the duration of the given model or None if it has not run completely
+    """
+    if model.starttime and model.endtime:
+        return model.duration
+    return None
+
+
+class ScenarioResult:
+    """
+    Represents the result of a Scenario
+
+    The steps of the Background and the preconditions are not counted
+    in the step counts of the Scenario.
+    """
+
+    __slots__ = ("state", "duration", "steps", "pending_steps")
+
+    def __init__(self, scenario):
+        self.state = scenario.state
+        self.duration = get_model_duration(scenario)
+        self.steps = create_counts()
+        self.pending_steps = []
+        for step in scenario.steps:
+            self.steps["amount"] += 1
+            self.steps[step.state] += 1
+            if step.state is Step.State.PENDING:
+                self.pending_steps.append(step)
+
+
+class FeatureResult:
+    """
+    Represents the result of a Feature
+
+    Only the Scenarios which have to run are part of the result.
+    The Scenario Outlines and Scenario Loops are represented by their Scenarios.
+    """
+
+    __slots__ = ("state", "duration", "scenario_results", "scenarios", "steps", "pending_steps")
+
+    def __init__(self, feature, aggregator):
+        self.state = Step.State.PASSED
+        self.duration = get_model_duration(feature)
+        self.scenario_results = []
+        self.scenarios = create_counts()
+        self.steps = create_counts()
+        self.pending_steps = []
+        for scenario in feature.all_scenarios:
+            if isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
+                continue
+
+            if not scenario.has_to_run(world.config.scenarios):
+                continue
+
+            result = aggregator.get_scenario_result(scenario)
+            self.scenario_results.append((scenario, result))
+            if self.state is Step.State.PASSED:
+                self.state = result.state
+
+            self.scenarios["amount"] += 1
+            self.scenarios[result.state] += 1
+            for state, count in result.steps.items():
+                self.steps[state] += count
+            self.pending_steps.extend(result.pending_steps)
+
+
+class RunResult:
+    """
+    Represents the result of all Features of a run which have to run
+
+    The duration of the run is the sum of the durations
+    of all Features which have passed or failed.
+    """
+
+    __slots__ = ("feature_results", "features", "scenarios", "steps", "pending_steps", "duration")
+
+    def __init__(self, features, aggregator):
+        self.feature_results = []
+        self.features = create_counts()
+        self.scenarios = create_counts()
+        self.steps = create_counts()
+        self.pending_steps = []
+        self.duration = timedelta()
+        for feature in features:
+            if not feature.has_to_run(world.config.scenarios):
+                continue
+
+            result = aggregator.get_feature_result(feature)
+            self.feature_results.append((feature, result))
+
+            self.features["amount"] += 1
+            self.features[result.state] += 1
+            if result.state in [Step.State.PASSED, Step.State.FAILED] and result.duration is not None:
+                self.duration += result.duration
+
+            for state in self.scenarios:
+                self.scenarios[state] += result.scenarios[state]
+                self.steps[state] += result.steps[state]
+            self.pending_steps.extend(result.pending_steps)
+
+
+class ResultAggregator(metaclass=Singleton):
+    """
+    Aggregates the results of the Scenarios and Features of a run
+
+    The results of a Scenario and a Feature are recorded once they have run.
+    Thus, all reporters share the results instead of walking through
+    all Scenarios and Steps again and again.
+    The results of models which are not recorded, because they did not
+    run or ran in a worker process, are created when they are requested.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._scenario_results = {}
+        self._feature_results = {}
+        self._run_result = None
+
+    def reset(self):
+        """
+        Resets all recorded results
+        """
+        with self._lock:
+            self._scenario_results = {}
+            self._feature_results = {}
+            self._run_result = None
+
+    def record_scenario(self, scenario):
+        """
+        Records the result of the given Scenario which has run
+
+        :param Scenario scenario: the scenario which has run
+        """
+        result = ScenarioResult(scenario)
+        with self._lock:
+            self._scenario_results[scenario] = result
+            self._run_result = None
+        return result
+
+    def record_feature(self, feature):
+        """
+        Records the result of the given Feature which has run
+
+        :param Feature feature: the feature which has run
+        """
+        result = FeatureResult(feature, self)
+        with self._lock:
+            self._feature_results[feature] = result
+            self._run_result = None
+        return result
+
+    def get_scenario_result(self, scenario):
+        """
+        Returns the result of the given Scenario
+
+        :param Scenario scenario: the scenario
+        """
+        result = self._scenario_results.get(scenario)
+        if result is None:
+            result = ScenarioResult(scenario)
+        return result
+
+    def get_feature_result(self, feature):
+        """
+        Returns the result of the given Feature
+
+        :param Feature feature: the feature
+        """
+        result = self._feature_results.get(feature)
+        if result is None:
+            result = FeatureResult(feature, self)
+        return result
+
+    def get_run_result(self, features):
+        """
+        Returns the result of the given Features
+
+        The result is only created once for all reporters
+        as long as no other result is recorded.
+
+        :param list features: all features of the run
+        """
+        with self._lock:
+            run_result = self._run_result
+        if run_result is not None and run_result[0] is features:
+            return run_result[1]
+
+        result = RunResult(features, self)
+        with self._lock:
+            self._run_result = (features, result)
+        return result
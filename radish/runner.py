@@ -45,7 +45,13 @@ class Runner:
                 """
                 Decorator wrapper
                 """
-                self._hooks.call("before", model, True, model_instance, *args, **kwargs)
+                if self._hooks.has_hooks("before", model):
+                    self._hooks.call("before", model, True, model_instance, *args, **kwargs)
+
+                if not self._hooks.has_hooks("after", model):
+                    # there are no after hooks to call for this model
+                    return func(self, model_instance, *args, **kwargs)
+
                 try:
                     return func(self, model_instance, *args, **kwargs)
                 finally:
@@ -55,11 +61,12 @@ class Runner:
 
         return _decorator
 
-    def __init__(self, hooks, early_exit=False, show_only=False):
+    def __init__(self, hooks, early_exit=False, show_only=False, release_scenario_steps=False):
         self._hooks = hooks
         self._early_exit = early_exit
         self._required_exit = False
         self._show_only = show_only
+        self._release_scenario_steps = release_scenario_steps
 
     @handle_exit
     @call_hooks("all")
@@ -107,8 +114,9 @@ class Runner:
             if not isinstance(scenario, (ScenarioOutline, ScenarioLoop)):
                 continue
 
-            for sub_scenario in scenario.scenarios:
+            for sub_scenario in scenario.iter_scenarios():
                 returncode |= self.run_scenario(sub_scenario)
+                self.release_steps(sub_scenario)
         return returncode
 
     @handle_exit
@@ -151,6 +159,18 @@ class Runner:
 
         return 1 if state == Step.State.FAILED else 0
 
+    def release_steps(self, scenario):
+        """
+        Releases the steps of the given Scenario of a Scenario Outline or Loop if they are not used anymore
+
+        The results of the scenario are already recorded by its after hooks.
+        The scenarios which are not run because the runner exits keep their steps.
+
+        :param Scenario scenario: the scenario which has run
+        """
+        if self._release_scenario_steps and not self._required_exit:
+            scenario.release_steps()
+
     def skip_step(self, step):
         """
         Skips the given step
@@ -2,6 +2,8 @@
 This module provides a class to represent a Scenario
 """
 
+import copy
+
 from .model import Model
 from .stepmodel import Step
 
@@ -11,6 +13,19 @@ class Scenario(Model):
     Represents a Scenario
     """
 
+    # the __dict__ keeps custom attributes possible, e.g. set by the hooks
+    __slots__ = (
+        "absolute_id",
+        "preconditions",
+        "_background",
+        "_steps",
+        "context",
+        "complete",
+        "_state_index",
+        "_released_state",
+        "__dict__",
+    )
+
     def __init__(
         self,
         id,
@@ -26,26 +41,71 @@ class Scenario(Model):
         super().__init__(id, keyword, sentence, path, line, parent, tags)
         self.absolute_id = None
         self.preconditions = preconditions or []
-        self.background = background
-        self.steps = []
+        self._background = background
+        self._steps = []
         self.context = self.Context()
         self.complete = False
+        self._state_index = 0
+        self._released_state = None
+
+    @property
+    def background(self):
+        """
+        Returns the Background of the scenario
+        """
+        return self._background
+
+    @background.setter
+    def background(self, background):
+        self._background = background
+        self.reset_state()
+
+    @property
+    def steps(self):
+        """
+        Returns the steps of the scenario
+        """
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps):
+        self._steps = steps
+        self.reset_state()
 
     @property
     def state(self):
         """
         Returns the state of the scenario
-        """
-        steps = []
-        if self.background:
-            steps.extend(self.background.steps)
 
-        steps.extend(self.steps)
-        for step in steps:
-            if step.state is not Step.State.PASSED:
-                return step.state
+        The state is the state of the first step of the Background or the
+        scenario which has not passed. The position of this step is cached,
+        thus, the steps before it are not checked again until a passed
+        step changes its state or the steps are replaced.
+        The state of a scenario whose steps are released is kept as it was.
+        """
+        if self._released_state is not None:
+            return self._released_state
+
+        index = self._state_index
+        offset = 0
+        for steps in (self._background.steps if self._background else (), self._steps):
+            while index - offset < len(steps):
+                state = steps[index - offset].state
+                if state is not Step.State.PASSED:
+                    self._state_index = index
+                    return state
+                index += 1
+            offset += len(steps)
+        self._state_index = index
         return Step.State.PASSED
 
+    def reset_state(self):
+        """
+        Resets the cached position of the first step which has not passed
+        """
+        self._state_index = 0
+        super().reset_state()
+
     @property
     def constants(self):
         """
@@ -91,6 +151,36 @@ class Scenario(Model):
                 return step
         return None
 
+    def release_steps(self):
+        """
+        Releases the Background and the steps of this scenario once they are not used anymore
+
+        The state of the scenario is kept.
+        """
+        self._released_state = self.state
+        self._background = None
+        self._steps = []
+
+    def create_precondition_instance(self, copies=None):
+        """
+        Return a copy of this Scenario to use it as precondition of another Scenario.
+
+        The other Scenario takes over the steps of the copy, thus, the steps
+        of the Background, the preconditions and this Scenario are copied.
+        The copied steps share their sentence, table and text with the original steps.
+
+        :param dict copies: the copied models by the id of their originals
+        """
+        copies = {} if copies is None else copies
+        precondition = copy.copy(self)
+        copies[id(self)] = precondition
+
+        if self.background:
+            precondition.background = self.background.create_precondition_instance(copies)
+        precondition.preconditions = [p.create_precondition_instance(copies) for p in self.preconditions]
+        precondition.steps = [step.create_precondition_instance(copies) for step in self.steps]
+        return precondition
+
     def has_to_run(self, scenario_choice):
         """
         Returns wheiter the scenario has to run or not
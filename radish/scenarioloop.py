@@ -5,6 +5,7 @@ This module provides a Scenario type which represents a Scenario loop
 import copy
 
 from .iterationscenario import IterationScenario
+from .matcher import merge_step
 from .scenario import Scenario
 from .stepmodel import Step
 
@@ -14,6 +15,8 @@ class ScenarioLoop(Scenario):
     Represents a scenario loop
     """
 
+    __slots__ = ("iterations_keyword", "iterations", "_scenarios", "_merged_steps")
+
     def __init__(
         self,
         id,
@@ -40,14 +43,63 @@ class ScenarioLoop(Scenario):
         )
         self.iterations_keyword = iterations_keyword
         self.iterations = 0
-        self.scenarios = []
+        self._scenarios = None
+        self._merged_steps = None
+
+    @property
+    def scenarios(self):
+        """
+        Returns the scenarios of the iterations
+
+        The scenarios are built when they are first used.
+        While they are built one by one to run them, only the
+        scenarios built so far are returned.
+        """
+        if self._scenarios is None:
+            self.build_scenarios()
+        return self._scenarios
+
+    @scenarios.setter
+    def scenarios(self, value):
+        self._scenarios = value
+        self.reset_state()
+
+    @property
+    def amount_of_scenarios(self):
+        """
+        Returns the amount of scenarios of the iterations without building them
+        """
+        return self.iterations
 
     def build_scenarios(self):
         """
         Builds the scenarios for every iteration
+        """
+        self._scenarios = list(self.create_scenarios())
 
-        Note: This must be done before merging the steps
-              from the feature file with the step definitions
+    def iter_scenarios(self):
+        """
+        Returns the scenarios of the iterations one by one to run them
+
+        The scenarios which are not built yet are built and merged when they are reached.
+        """
+        if self._scenarios is not None:
+            yield from self._scenarios
+            return
+
+        scenarios = self._scenarios = []
+        for scenario in self.create_scenarios():
+            scenarios.append(scenario)
+            # the cached states of the parents do not know the new scenario yet
+            self.reset_state()
+            yield scenario
+
+    def create_scenarios(self):
+        """
+        Creates the scenarios for every iteration one by one
+
+        The steps of the created scenarios are merged if
+        the steps of this Scenario Loop are already merged.
         """
         for i in range(self.iterations):
             scenario_id = self.id + i + 1
@@ -75,17 +127,43 @@ class ScenarioLoop(Scenario):
                     True,
                     context_class=iteration_step.context_class,
                 )
-                step.table_header = copy.copy(iteration_step.table_header)
-                step.table_data = copy.copy(iteration_step.table_data)
-                step.table = copy.copy(iteration_step.table)
-                step.raw_text = copy.copy(iteration_step.raw_text)
+                if iteration_step.table_header is not None:
+                    step.table_header = copy.copy(iteration_step.table_header)
+                    step.table_data = copy.copy(iteration_step.table_data)
+                    step.table = copy.copy(iteration_step.table)
+                if iteration_step.raw_text:
+                    step.raw_text = copy.copy(iteration_step.raw_text)
                 scenario.steps.append(step)
-            self.scenarios.append(scenario)
+
+            if self._merged_steps is not None:
+                for step in scenario.all_steps:
+                    merge_step(step, self._merged_steps)
+            yield scenario
+
+    def merge_steps(self, steps):
+        """
+        Merges the steps of this Scenario Loop and the scenarios of the iterations with the given steps
+
+        Scenarios which are not built yet are merged when they are built.
+        Their steps have the same sentences as the steps of this Scenario Loop,
+        thus, they are already checked by merging the steps of this Scenario Loop.
+
+        :param dict steps: the registered steps
+        """
+        for step in self.all_steps:
+            merge_step(step, steps)
+
+        self._merged_steps = steps
+        if self._scenarios is not None:
+            for scenario in self._scenarios:
+                for step in scenario.all_steps:
+                    merge_step(step, steps)
 
     def after_parse(self):
         """
-        Build looped scenarios
+        Completes the Scenario Loop
+
+        The looped scenarios are built when they are first used.
         """
         Scenario.after_parse(self)
-        self.build_scenarios()
         self.complete = True
@@ -3,11 +3,14 @@ This module provides a class to represent a Scenario Outline
 """
 
 import copy
+import re
 
 from .examplescenario import ExampleScenario
 from .exceptions import RadishError
+from .matcher import merge_step
 from .scenario import Scenario
 from .stepmodel import Step
+from .utils import PlaceholderTemplate
 
 
 class ScenarioOutline(Scenario):
@@ -15,11 +18,15 @@ class ScenarioOutline(Scenario):
     Represents a Scenario
     """
 
+    __slots__ = ("example_keyword", "_scenarios", "examples_header", "examples", "_merged_steps")
+
     class Example:
         """
         Represents the ScenarioOutline examples
         """
 
+        __slots__ = ("data", "path", "line")
+
         def __init__(self, data, path, line):
             self.data = data
             self.path = path
@@ -40,19 +47,68 @@ class ScenarioOutline(Scenario):
     ):
         super().__init__(id, keyword, sentence, path, line, parent, tags, preconditions, background)
         self.example_keyword = example_keyword
-        self.scenarios = []
+        self._scenarios = None
         self.examples_header = []
         self.examples = []
+        self._merged_steps = None
+
+    @property
+    def scenarios(self):
+        """
+        Returns the scenarios of the Examples
+
+        The scenarios are built when they are first used.
+        While they are built one by one to run them, only the
+        scenarios built so far are returned.
+        """
+        if self._scenarios is None:
+            self.build_scenarios()
+        return self._scenarios
+
+    @scenarios.setter
+    def scenarios(self, value):
+        self._scenarios = value
+        self.reset_state()
+
+    @property
+    def amount_of_scenarios(self):
+        """
+        Returns the amount of scenarios of the Examples without building them
+        """
+        return len(self.examples)
 
     def build_scenarios(self):
         """
         Builds the scenarios with the parsed Examples
+        """
+        self._scenarios = list(self.create_scenarios())
 
-        Note: This must be done before merging the steps
-              from the feature file with the step definitions
+    def iter_scenarios(self):
         """
+        Returns the scenarios of the Examples one by one to run them
+
+        The scenarios which are not built yet are built and merged when they are reached.
+        """
+        if self._scenarios is not None:
+            yield from self._scenarios
+            return
+
+        scenarios = self._scenarios = []
+        for scenario in self.create_scenarios():
+            scenarios.append(scenario)
+            # the cached states of the parents do not know the new scenario yet
+            self.reset_state()
+            yield scenario
+
+    def create_scenarios(self):
+        """
+        Creates the scenarios with the parsed Examples one by one
+
+        The steps of the created scenarios are merged if
+        the steps of this Scenario Outline are already merged.
+        """
+        sentence_templates, raw_text_templates = self._get_step_templates()
         for row_id, example in enumerate(self.examples):
-            examples = dict(zip(self.examples_header, example.data))
             scenario_id = self.id + row_id + 1
             background = None
             scenario = ExampleScenario(
@@ -68,60 +124,90 @@ class ScenarioOutline(Scenario):
                 background = self.background.create_instance(parent=scenario, steps_runable=True)
                 scenario.background = background
 
-            for step_id, outlined_step in enumerate(self.steps):
-                sentence = self._replace_examples_in_sentence(outlined_step.sentence, examples)
-                raw_text = self._replace_examples_in_raw_text(outlined_step.raw_text, examples)
-                step = Step(
-                    step_id + 1,
-                    sentence,
-                    outlined_step.path,
-                    example.line,
-                    scenario,
-                    True,
-                    context_class=outlined_step.context_class,
-                )
-                # copy extended attributes
-                step.table_header = copy.copy(outlined_step.table_header)
-                step.table_data = copy.copy(outlined_step.table_data)
-                step.table = copy.copy(outlined_step.table)
-                step.raw_text = raw_text
+            scenario.steps.extend(self._create_steps(scenario, example, sentence_templates, raw_text_templates))
 
-                # add step to scenario
-                scenario.steps.append(step)
-            self.scenarios.append(scenario)
+            if self._merged_steps is not None:
+                for step in scenario.all_steps:
+                    merge_step(step, self._merged_steps)
+            yield scenario
 
-    @staticmethod
-    def _replace_examples_in_sentence(sentence, examples):
+    def _get_step_templates(self):
         """
-        Replaces the given examples in the given sentence
+        Returns the templates of the sentences and the texts of the outlined steps
+        """
+        placeholder_regex = self._get_placeholder_regex()
+        sentence_templates = [PlaceholderTemplate(s.sentence, placeholder_regex) for s in self.steps]
+        raw_text_templates = [[PlaceholderTemplate(line, placeholder_regex) for line in s.raw_text] for s in self.steps]
+        return sentence_templates, raw_text_templates
 
-        :param string sentence: the step sentence in which to replace the examples
-        :param dict examples: the examples
+    def _create_steps(self, parent, example, sentence_templates, raw_text_templates):
+        """
+        Creates the steps of the given Example one by one
 
-        :returns: the new step sentence
-        :rtype: string
+        :param Model parent: the parent of the created steps
+        :param Example example: the Example to create the steps for
+        :param list sentence_templates: the templates of the sentences of the outlined steps
+        :param list raw_text_templates: the templates of the texts of the outlined steps
         """
-        for key, value in examples.items():
-            sentence = sentence.replace("<{}>".format(key), value)
-        return sentence
+        examples = {"<{}>".format(key): value for key, value in zip(self.examples_header, example.data)}
+        for step_id, outlined_step in enumerate(self.steps):
+            sentence = sentence_templates[step_id].render(examples)
+            step = Step(
+                step_id + 1,
+                sentence,
+                outlined_step.path,
+                example.line,
+                parent,
+                True,
+                context_class=outlined_step.context_class,
+            )
+            # copy extended attributes
+            if outlined_step.table_header is not None:
+                step.table_header = copy.copy(outlined_step.table_header)
+                step.table_data = copy.copy(outlined_step.table_data)
+                step.table = copy.copy(outlined_step.table)
+            if raw_text_templates[step_id]:
+                step.raw_text = [template.render(examples) for template in raw_text_templates[step_id]]
+            yield step
 
-    @staticmethod
-    def _replace_examples_in_raw_text(raw_text, examples):
+    def merge_steps(self, steps):
         """
-        Replaces the given examples in the given raw_text, which is
-        a list of strings
+        Merges the steps of the scenarios of the Examples with the given steps
 
-        :param list raw_text: list of strings in which to replace the examples
-        :param dict examples: the examples
+        Scenarios which are not built yet are merged when they are built.
+        Their steps are checked now without building the scenarios.
+        The steps are created with this Scenario Outline as parent because
+        it has the same constants as the scenarios of the Examples.
 
-        :returns: the new list raw_text
-        :rtype: list
+        :param dict steps: the registered steps
+        """
+        # the outlined steps themselves do not have to be merged
+        if self.background:
+            for step in self.background.steps:
+                merge_step(step, steps)
+
+        self._merged_steps = steps
+        if self._scenarios is not None:
+            for scenario in self._scenarios:
+                for step in scenario.all_steps:
+                    merge_step(step, steps)
+            return
+
+        sentence_templates, raw_text_templates = self._get_step_templates()
+        for example in self.examples:
+            for step in self._create_steps(self, example, sentence_templates, raw_text_templates):
+                merge_step(step, steps)
+
+    def _get_placeholder_regex(self):
         """
-        raw_text_list = []
-        for raw_text_item in raw_text:
-            raw_text_item = ScenarioOutline._replace_examples_in_sentence(raw_text_item, examples)
-            raw_text_list.append(raw_text_item)
-        return raw_text_list
+        Returns the regex matching the placeholders of the Examples header or None if there is no header
+        """
+        if not self.examples_header:
+            return None
+
+        # longer placeholders first in case a header contains the end of another placeholder
+        placeholders = sorted({"<{}>".format(key) for key in self.examples_header}, key=len, reverse=True)
+        return re.compile("({})".format("|".join(re.escape(p) for p in placeholders)))
 
     def get_column_width(self, column_index):
         """
@@ -139,8 +225,9 @@ class ScenarioOutline(Scenario):
 
     def after_parse(self):
         """
-        Build outlined scenarios
+        Completes the Scenario Outline
+
+        The outlined scenarios are built when they are first used.
         """
         Scenario.after_parse(self)
-        self.build_scenarios()
         self.complete = True
@@ -2,16 +2,25 @@
 This module provides a class to represent a Step
 """
 
+import asyncio
 import base64
+import copy
+import inspect
 import re
 
 from . import utils
 from .exceptions import RadishError
 from .matcher import merge_step
-from .model import Model
+from .model import LazyList, Model
 from .stepregistry import StepRegistry
 from .terrain import world
 
+#: Matches the placeholders of the constants in a step sentence, e.g. ``${foo}``
+CONSTANT_PLACEHOLDER_REGEX = re.compile(r"(\$\{[^}]*\})")
+
+#: Matches the ``And`` keyword at the beginning of a step sentence
+AND_KEYWORD_REGEX = re.compile(r"^and ", flags=re.IGNORECASE)
+
 
 class Step(Model):
     """
@@ -31,21 +40,81 @@ class Step(Model):
         FAILED = "failed"
         PENDING = "pending"
 
+    # the __dict__ keeps custom attributes possible, e.g. set by the hooks
+    __slots__ = (
+        "context_class",
+        "table_header",
+        "_table_data",
+        "_table",
+        "_raw_text",
+        "definition_func",
+        "argument_match",
+        "_state",
+        "failure",
+        "runable",
+        "as_precondition",
+        "as_background",
+        "_embeddings",
+        "_expanded_sentence",
+        "_context_sensitive_sentence",
+        "__dict__",
+    )
+
+    #: the rows of the table of this step
+    table_data = LazyList()
+    #: the rows of the table of this step as dicts by the table header
+    table = LazyList()
+    #: the lines of the additional text of this step
+    raw_text = LazyList()
+    #: the data embedded into this step
+    embeddings = LazyList()
+
     def __init__(self, id, sentence, path, line, parent, runable, context_class=None):
         super().__init__(id, None, sentence, path, line, parent)
         self.context_class = context_class
         self.table_header = None
-        self.table_data = []
-        self.table = []
-        self.raw_text = []
+        self._table_data = None
+        self._table = None
+        self._raw_text = None
         self.definition_func = None
         self.argument_match = None
-        self.state = Step.State.UNTESTED
+        self._state = Step.State.UNTESTED
         self.failure = None
         self.runable = runable
         self.as_precondition = None
         self.as_background = None
-        self.embeddings = []
+        self._embeddings = None
+        self._expanded_sentence = None
+        self._context_sensitive_sentence = None
+
+    def __setstate__(self, state):
+        """
+        Restores the pickled step
+
+        The step states are compared by identity, thus,
+        the unpickled state is replaced by its Step.State constant.
+
+        :param tuple state: the state of the ``__dict__`` and the ``__slots__`` of the step
+        """
+        dict_state, slots_state = state
+        for name, value in {**(dict_state or {}), **(slots_state or {})}.items():
+            setattr(self, name, value)
+        self._state = getattr(Step.State, self._state.upper())
+
+    @property
+    def state(self):
+        """
+        Returns the state of this step
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        # the parents cache the position of their first step which has not passed,
+        # thus, they only have to reset it if a passed step changes its state
+        if self._state is Step.State.PASSED and state is not Step.State.PASSED and self.parent is not None:
+            self.parent.reset_state()
+        self._state = state
 
     @property
     def context(self):
@@ -60,35 +129,54 @@ class Step(Model):
         Returns the expanded sentence of this step
 
             * Expand constants
+
+        The expanded sentence is only calculated again if the sentence
+        or the parent of this step changes. The constants of the parent
+        do not change once the feature is parsed.
+        """
+        cache = self._expanded_sentence
+        if cache is None or cache[0] is not self.sentence or cache[1] is not self.parent:
+            cache = self._expanded_sentence = (self.sentence, self.parent, self._expand_sentence())
+        return cache[2]
+
+    def _expand_sentence(self):
+        """
+        Expands the constants in the sentence of this step
         """
-        sentence = self.sentence
+        if "${" not in self.sentence:
+            return self.sentence
+
+        constants = {}
         for name, value in self.parent.constants:
-            sentence = sentence.replace("${{{0}}}".format(name), value)
-        return sentence
+            # the first constant with a name wins
+            constants.setdefault("${{{0}}}".format(name), value)
+        return utils.PlaceholderTemplate(self.sentence, CONSTANT_PLACEHOLDER_REGEX).render(constants)
 
     @property
     def context_sensitive_sentence(self):
         """
         Return the context class sensitive
         step sentence.
+
+        It's only calculated again if the expanded sentence or the context class changes.
         """
         sentence = self.expanded_sentence
-        if self.context_class:
-            return utils.str_lreplace(
-                "and ",
-                self.context_class.capitalize() + " ",
-                sentence,
-                flags=re.IGNORECASE,
-            )
-
-        return sentence
+        cache = self._context_sensitive_sentence
+        if cache is None or cache[0] is not sentence or cache[1] != self.context_class:
+            context_sensitive_sentence = sentence
+            if self.context_class:
+                context_sensitive_sentence = AND_KEYWORD_REGEX.sub(
+                    self.context_class.capitalize() + " ", sentence, count=1
+                )
+            cache = self._context_sensitive_sentence = (sentence, self.context_class, context_sensitive_sentence)
+        return cache[2]
 
     @property
     def text(self):
         """
         Returns the additional text of this step as string
         """
-        return "\n".join(self.raw_text)
+        return "\n".join(self._raw_text or ())
 
     def _validate(self):
         """
@@ -101,6 +189,8 @@ class Step(Model):
     def run(self):
         """
         Runs the step.
+
+        Async step definitions are run on the event loop of the current thread.
         """
         if not self.runable:
             self.state = Step.State.UNTESTED
@@ -110,18 +200,36 @@ class Step(Model):
         args, kwargs = self.argument_match.evaluate()
 
         try:
-            if kwargs:
-                self.definition_func(self, **kwargs)
-            else:
-                self.definition_func(self, *args)
+            result = self._call_definition_func(args, kwargs)
+            if inspect.isawaitable(result):
+                self._run_until_complete(result)
         except Exception as e:
-            self.state = Step.State.FAILED
-            self.failure = utils.Failure(e)
+            self._fail(e)
         else:
-            if self.state is Step.State.SKIPPED:
-                self.skip()
-            elif self.state is not Step.State.PENDING:
-                self.state = Step.State.PASSED
+            self._succeed()
+        return self.state
+
+    async def run_async(self):
+        """
+        Runs the step on the running event loop.
+
+        Async step definitions are awaited, all others are called as usual.
+        """
+        if not self.runable:
+            self.state = Step.State.UNTESTED
+            return self.state
+
+        self._validate()
+        args, kwargs = self.argument_match.evaluate()
+
+        try:
+            result = self._call_definition_func(args, kwargs)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self._fail(e)
+        else:
+            self._succeed()
         return self.state
 
     def debug(self):
@@ -138,17 +246,59 @@ class Step(Model):
         pdb = utils.get_debugger()
 
         try:
-            pdb.runcall(self.definition_func, self, *args, **kwargs)
+            result = pdb.runcall(self.definition_func, self, *args, **kwargs)
+            if inspect.isawaitable(result):
+                self._run_until_complete(result)
         except Exception as e:
-            self.state = Step.State.FAILED
-            self.failure = utils.Failure(e)
+            self._fail(e)
         else:
-            if self.state is Step.State.SKIPPED:
-                self.skip()
-            elif self.state is not Step.State.PENDING:
-                self.state = Step.State.PASSED
+            self._succeed()
         return self.state
 
+    def _run_until_complete(self, awaitable):
+        """
+        Runs the given awaitable of an async step definition on the event loop of the current thread
+
+        The awaitable cannot be run if an event loop is already running,
+        e.g. if the step is called with behave_like() from another async step definition.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            utils.get_step_event_loop().run_until_complete(awaitable)
+            return
+
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RadishError(
+            "The async step '{}' cannot be run while an event loop is running. "
+            "Use 'await step.behave_like_async(...)' in async step definitions".format(self.sentence)
+        )
+
+    def _call_definition_func(self, args, kwargs):
+        """
+        Calls the step definition function with the matched arguments
+        """
+        if kwargs:
+            return self.definition_func(self, **kwargs)
+        return self.definition_func(self, *args)
+
+    def _fail(self, exception):
+        """
+        Marks the step as failed because of the given exception
+        """
+        self.state = Step.State.FAILED
+        self.failure = utils.Failure(exception)
+
+    def _succeed(self):
+        """
+        Marks the step as passed unless it was skipped or marked as pending
+        """
+        if self.state is Step.State.SKIPPED:
+            self.skip()
+        elif self.state is not Step.State.PENDING:
+            self.state = Step.State.PASSED
+
     def skip(self):
         """
         Skips the step
@@ -164,6 +314,27 @@ class Step(Model):
         """
         self.state = Step.State.PENDING
 
+    def create_precondition_instance(self, copies):
+        """
+        Return a copy of this step to use it in a copied precondition Scenario.
+
+        The copy shares its sentence, table and text with this step
+        but has its own run state.
+
+        :param dict copies: the copied models by the id of their originals
+        """
+        step = copy.copy(self)
+        step.parent = copies.get(id(self.parent), self.parent)
+        step.as_precondition = copies.get(id(self.as_precondition), self.as_precondition)
+        step.as_background = copies.get(id(self.as_background), self.as_background)
+        step._rendered_tags = None
+        step.state = Step.State.UNTESTED
+        step.failure = None
+        step.starttime = None
+        step.endtime = None
+        step._embeddings = None
+        return step
+
     def behave_like(self, sentence):
         """
         Make step behave like another one
@@ -174,9 +345,7 @@ class Step(Model):
         if self.state is Step.State.FAILED:
             return
 
-        # create step according to given sentence
-        new_step = Step(None, sentence, self.path, self.line, self.parent, True)
-        merge_step(new_step, StepRegistry().steps)
+        new_step = self._create_behave_like_step(sentence)
 
         # run or debug step
         if world.config.debug_steps:
@@ -184,7 +353,37 @@ class Step(Model):
         else:
             new_step.run()
 
-        # re-raise exception if the failed
+        self._raise_behave_like_failure(new_step, sentence)
+
+    async def behave_like_async(self, sentence):
+        """
+        Make step behave like another one from within an async step definition
+
+        Async step definitions of the other step are awaited on the running event loop.
+
+        :param string sentence: the sentence of the step to behave like
+        """
+        # check if this step has already failed from a previous behave_like call
+        if self.state is Step.State.FAILED:
+            return
+
+        new_step = self._create_behave_like_step(sentence)
+        await new_step.run_async()
+
+        self._raise_behave_like_failure(new_step, sentence)
+
+    def _create_behave_like_step(self, sentence):
+        """
+        Creates the step with the given sentence to behave like
+        """
+        new_step = Step(None, sentence, self.path, self.line, self.parent, True)
+        merge_step(new_step, StepRegistry().steps)
+        return new_step
+
+    def _raise_behave_like_failure(self, new_step, sentence):
+        """
+        Re-raises the exception of the given step to behave like if it has failed
+        """
         if new_step.state is Step.State.FAILED:
             new_step.failure.exception.args = ("Step '{}' failed: '{}'".format(sentence, new_step.failure.reason),)
             raise new_step.failure.exception
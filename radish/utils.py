@@ -2,17 +2,20 @@
 This module provides several utility functions
 """
 
+import asyncio
 import calendar
 import fnmatch
 import itertools
 import os
+import pickle
 import pydoc
 import re
 import sys
+import time
 import traceback
 import warnings
 from datetime import datetime, timedelta, timezone
-from threading import Lock
+from threading import Lock, local
 
 
 class Failure:
@@ -34,6 +37,20 @@ class Failure:
         self.filename = traceback_info[0]
         self.line = int(traceback_info[1])
 
+    def __getstate__(self):
+        """
+        Returns the state to pickle the failure
+
+        Not every exception can be restored from its pickled state.
+        Those are replaced with a generic Exception with the same reason.
+        """
+        state = self.__dict__.copy()
+        try:
+            pickle.loads(pickle.dumps(self.exception))
+        except Exception:
+            state["exception"] = Exception(self.reason)
+        return state
+
 
 def console_write(text):
     """
@@ -44,6 +61,47 @@ def console_write(text):
     print(str(text))
 
 
+_event_loops = local()
+#: Holds the event loops created in all threads to close them once they are not needed anymore
+_created_event_loops = []
+_created_event_loops_lock = Lock()
+
+
+def get_step_event_loop():
+    """
+    Returns the event loop of the current thread to run async step definitions
+
+    The event loop is created once and used until it is closed with close_step_event_loops().
+    """
+    loop = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _event_loops.loop = loop
+        with _created_event_loops_lock:
+            _created_event_loops.append(loop)
+    return loop
+
+
+def close_step_event_loops():
+    """
+    Closes the event loops of all threads which are not running
+
+    A thread creates a new event loop if it runs async step definitions afterwards.
+    """
+    with _created_event_loops_lock:
+        loops = [loop for loop in _created_event_loops if not loop.is_running()]
+        _created_event_loops[:] = [loop for loop in _created_event_loops if loop.is_running()]
+
+    for loop in loops:
+        if loop.is_closed():
+            continue
+
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
 def expandpath(path):
     """
     Expands a path
@@ -95,6 +153,21 @@ def get_debugger():
     return pdb
 
 
+#: The wall clock time and the performance counter taken at the same moment.
+#: It is used to convert the performance counter values recorded during the run to UTC datetimes.
+_CLOCK_ANCHOR = (datetime.now(timezone.utc), time.perf_counter_ns())
+
+
+def perf_counter_to_datetime(counter_ns):
+    """
+    Converts the given value of ``time.perf_counter_ns()`` to a UTC datetime
+
+    :param int counter_ns: the performance counter in nanoseconds
+    """
+    anchor_dt, anchor_ns = _CLOCK_ANCHOR
+    return anchor_dt + timedelta(microseconds=(counter_ns - anchor_ns) // 1000)
+
+
 def format_utc_to_local_tz(utc_dt, fmt="%Y-%m-%dT%H:%M:%S"):
     """
     Formats the given UTC datetime as a string converted to the local timezone.
@@ -117,6 +190,45 @@ def format_utc_to_local_tz(utc_dt, fmt="%Y-%m-%dT%H:%M:%S"):
     return utc_to_local(utc_dt).strftime(fmt)
 
 
+class PlaceholderTemplate:
+    """
+    Represents a text compiled into literal and placeholder segments
+
+    The placeholders are replaced by their values in a single pass when
+    the template is rendered, no matter how many values are given.
+    """
+
+    def __init__(self, text, placeholder_regex):
+        """
+        :param str text: the text with the placeholders
+        :param placeholder_regex: the compiled regex with a single group matching a whole placeholder
+        """
+        # the odd indices hold the placeholders
+        self.segments = placeholder_regex.split(text) if placeholder_regex else [text]
+
+    @property
+    def has_placeholders(self):
+        """
+        Returns whether the text has any placeholders
+        """
+        return len(self.segments) > 1
+
+    def render(self, values):
+        """
+        Renders the text with the given values
+
+        :param dict values: the values by placeholder, e.g. ``{"<foo>": "42"}``.
+                            Placeholders without a value are kept.
+        """
+        if len(self.segments) == 1:
+            return self.segments[0]
+
+        segments = self.segments[:]
+        for index in range(1, len(segments), 2):
+            segments[index] = values.get(segments[index], segments[index])
+        return "".join(segments)
+
+
 def make_unique_obj_list(somelist, attr):
     """
     Make list with objects unique
@@ -210,6 +322,9 @@ def split_unescape(s, delim, escape="\\", unescape=True):
     >>> split_unescape('foo\\', '|', unescape=True)
     ['foo\\']
     """
+    if escape not in s:
+        return s.split(delim)
+
     ret = []
     current = []
     itr = iter(s)
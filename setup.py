@@ -48,6 +48,8 @@ requirements = [
 # disabled by default
 extra_requirements = {
     "bddxml": ["lxml"],
+    # the JUnit XML writer indents the testsuites with etree.indent
+    "junitxml": ["lxml>=4.5"],
     "ipython-debugger": ["ipython"],
     "coverage": ["coverage"],
     "testing": ["PyYAML"],
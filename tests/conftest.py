@@ -33,6 +33,7 @@ def mock_world_config():
     """
     # default command line arguments
     arguments = {
+        "--async-concurrency": None,
         "--basedir": ["$PWD/radish"],
         "--bdd-xml": None,
         "--cover-append": False,
@@ -46,6 +47,7 @@ def mock_world_config():
         "--cucumber-json": None,
         "--debug-after-failure": False,
         "--debug-steps": False,
+        "--distribute-scenarios": False,
         "--dry-run": False,
         "--early-exit": False,
         "--expand": False,
@@ -56,14 +58,17 @@ def mock_world_config():
         "--marker": "str(uuid.uuid4())",
         "--no-ansi": False,
         "--no-line-jump": False,
+        "--parse-cache": False,
         "--scenarios": None,
         "--shuffle": False,
         "--syslog": False,
         "--tags": None,
+        "--threads": None,
         "--user-data": [],
         "--version": False,
         "--with-coverage": False,
         "--with-traceback": False,
+        "--workers": None,
         "--write-ids": False,
         "--write-steps-once": False,
         "<features>": ["features/"],
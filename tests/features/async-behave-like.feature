@@ -0,0 +1,21 @@
+Feature: Async Step definitions behaving like other Steps
+    Radish shall support async Step definitions
+    which behave like other async Steps
+
+    Scenario: Add numbers asynchronously like another Step
+        Given I have the number 5
+        And I have the number 3
+        When I add them up asynchronously like another Step
+        Then I expect the sum to be 8
+
+    Scenario: Add other numbers asynchronously like another Step
+        Given I have the number 2
+        And I have the number 4
+        When I add them up asynchronously like another Step
+        Then I expect the sum to be 6
+
+    Scenario: Add numbers like another asynchronous Step
+        Given I have the number 1
+        And I have the number 7
+        When I add them up like another asynchronous Step
+        Then I expect the sum to be 8
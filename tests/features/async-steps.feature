@@ -0,0 +1,15 @@
+Feature: Async Step definitions
+    Radish shall support running
+    Step definitions which are coroutine functions
+
+    Scenario: Add numbers asynchronously
+        Given I have the number 5
+        And I have the number 3
+        When I add them up asynchronously
+        Then I expect the sum to be 8
+
+    Scenario: Add other numbers asynchronously
+        Given I have the number 2
+        And I have the number 4
+        When I add them up asynchronously
+        Then I expect the sum to be 6
@@ -7,13 +7,15 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import json
+
 import pytest
 import tagexpressions
 
 import radish.exceptions as errors
 from radish.background import Background
 from radish.model import Tag
-from radish.parser import FeatureParser
+from radish.parser import FeatureParser, KeywordPackCache, LineTokenizer
 from radish.scenarioloop import ScenarioLoop
 from radish.scenariooutline import ScenarioOutline
 
@@ -757,3 +759,52 @@ def test_parse_scenario_precondition_errors(parser, expected_error_msg):
 
     # then
     assert str(exc.value).startswith(expected_error_msg)
+
+
+@pytest.mark.parametrize(
+    "line, expected_token, expected_value",
+    [
+        ("Feature: Some feature", LineTokenizer.FEATURE, "Some feature"),
+        ("Background:", LineTokenizer.BACKGROUND, ""),
+        ("Scenario:  Some scenario ", LineTokenizer.SCENARIO, "Some scenario"),
+        ("Scenario Outline: Some outline", LineTokenizer.SCENARIO_OUTLINE, "Some outline"),
+        ("Scenario Loop 5: Some loop", LineTokenizer.SCENARIO_LOOP, ("Some loop", 5)),
+        ("Examples:", LineTokenizer.EXAMPLES, ""),
+        ("@foo @bar", LineTokenizer.TAG, None),
+        ("# comment", LineTokenizer.COMMENT, None),
+        ("| foo | bar |", LineTokenizer.TABLE_ROW, None),
+        ('"""', LineTokenizer.STEP_TEXT, None),
+        ("Given I have a Scenario: foo", LineTokenizer.TEXT, None),
+    ],
+)
+def test_tokenize_line(line, expected_token, expected_value, core):
+    """
+    Test sorting a line of a Feature File into a token
+    """
+    # given
+    parser = FeatureParser(core, "/", 1)
+
+    # when
+    token, value = parser._tokenizer.tokenize(line)
+
+    # then
+    assert token == expected_token
+    assert value == expected_value
+
+
+def test_keyword_pack_is_loaded_once(core, mocker):
+    """
+    Test that the keywords of a language are only loaded once for all parsers
+    """
+    # given
+    KeywordPackCache().clear()
+    json_load_spy = mocker.spy(json, "load")
+    first_parser = FeatureParser(core, "/", 1, language="de")
+
+    # when
+    second_parser = FeatureParser(core, "/", 2, language="de")
+
+    # then
+    assert json_load_spy.call_count == 1
+    assert second_parser.keywords is first_parser.keywords
+    assert second_parser._tokenizer is first_parser._tokenizer
@@ -14,6 +14,7 @@ import tempfile
 
 import pytest
 
+from radish.hookregistry import HookRegistry
 from radish.main import main
 
 
@@ -30,6 +31,66 @@ from radish.main import main
         ),
         pytest.param(["feature-scenarios"], [], 0, "feature-scenarios", id="Feature with multiple Scenarios"),
         pytest.param(["comments"], [], 0, "comments", id="Comments in Feature"),
+        pytest.param(
+            ["feature-scenarios"],
+            ["--workers", "2"],
+            0,
+            "feature-scenarios",
+            id="Feature with multiple Scenarios in worker processes",
+        ),
+        pytest.param(
+            ["scenario-outline", "feature-scenario-steps"],
+            ["--workers", "2", "--distribute-scenarios"],
+            0,
+            "scenario-outline-and-feature-scenario-steps",
+            id="Multiple Features with Scenarios distributed to worker processes",
+        ),
+        pytest.param(
+            ["feature-scenarios"],
+            ["--workers", "2", "--distribute-scenarios"],
+            0,
+            "feature-scenarios",
+            id="Feature with multiple Scenarios distributed to worker processes",
+        ),
+        pytest.param(
+            ["feature-scenarios"],
+            ["--distribute-scenarios"],
+            1,
+            "distribute-scenarios-without-workers",
+            id="Distribute Scenarios without worker processes",
+        ),
+        pytest.param(
+            ["scenario-outline", "feature-scenario-steps"],
+            ["--threads", "2"],
+            0,
+            "scenario-outline-and-feature-scenario-steps",
+            id="Multiple Features with Scenarios in threads",
+        ),
+        pytest.param(["async-steps"], [], 0, "async-steps", id="Feature with async Step definitions"),
+        pytest.param(
+            ["async-steps"],
+            ["--async-concurrency", "2"],
+            0,
+            "async-steps",
+            id="Feature with async Step definitions run concurrently",
+        ),
+        pytest.param(
+            ["async-behave-like"], [], 0, "async-behave-like", id="Async Step definitions behaving like other Steps"
+        ),
+        pytest.param(
+            ["async-behave-like"],
+            ["--threads", "2"],
+            0,
+            "async-behave-like",
+            id="Async Step definitions behaving like other Steps in threads",
+        ),
+        pytest.param(
+            ["async-behave-like"],
+            ["--async-concurrency", "2"],
+            0,
+            "async-behave-like",
+            id="Async Step definitions behaving like other Steps run concurrently",
+        ),
         pytest.param(["german"], [], 0, "german", id="German Keywords"),
         pytest.param(["unicode"], [], 0, "unicode", id="Unicode Characters in Feature File"),
         pytest.param(["multi-features"], [], 1, "multi-features", id="Multiple Features in single Feature File"),
@@ -387,10 +448,104 @@ def test_main_cli_calls(
         expected_output_string = output_file.read()
 
     # when
+    actual_exitcode, actual_output = call_main(cli_args, featurefiledir, featurefiles, terminal=True)
+
+    # then
+    assert actual_output == expected_output_string
+    assert actual_exitcode == expected_exitcode
+
+
+@pytest.mark.parametrize(
+    "given_featurefiles, given_cli_args, expected_exitcode, expected_output",
+    [
+        pytest.param(
+            ["feature-scenario-steps"],
+            ["--no-ansi"],
+            0,
+            "feature-scenario-steps-no-ansi-write-once",
+            id="Feature with one Scenario and Steps without terminal",
+        ),
+        pytest.param(
+            ["scenario-outline"],
+            ["--no-ansi"],
+            0,
+            "scenario-outline-no-ansi-write-once",
+            id="Scenario Outline without terminal",
+        ),
+        pytest.param(
+            ["scenario-loop"],
+            ["--no-ansi"],
+            0,
+            "scenario-loop-no-ansi-write-once",
+            id="Scenario Loop without terminal",
+        ),
+        pytest.param(
+            ["background"],
+            ["--no-ansi"],
+            0,
+            "background-no-terminal",
+            id="Feature with Background without terminal",
+        ),
+    ],
+)
+def test_main_cli_calls_without_terminal(
+    given_featurefiles,
+    given_cli_args,
+    expected_exitcode,
+    expected_output,
+    featurefiledir,
+    radishdir,
+    outputdir,
+):
+    """
+    Test calling main CLI with an output which is not a terminal
+    """
+    # given
+    featurefiles = [os.path.join(featurefiledir, x + ".feature") for x in given_featurefiles]
+    cli_args = featurefiles + given_cli_args + ["--marker", "test-marker", "-b", radishdir]
+
+    expected_output_file = os.path.join(outputdir, "unix", expected_output + ".txt")
+    with open(expected_output_file, encoding="utf-8") as output_file:
+        expected_output_string = output_file.read()
+
+    # when
+    actual_exitcode, actual_output = call_main(cli_args, featurefiledir, featurefiles, terminal=False)
+
+    # then
+    assert actual_output == expected_output_string
+    assert actual_exitcode == expected_exitcode
+
+
+def test_main_skips_empty_hook_slots(featurefiledir, mocker):
+    """
+    Test that a run with the default extensions does not dispatch the hooks of empty slots
+    """
+    # given
+    featurefiles = [os.path.join(featurefiledir, "feature-scenario-steps.feature")]
+    cli_args = ["show"] + featurefiles
+    call_spy = mocker.spy(HookRegistry(), "call")
+
+    # when
+    actual_exitcode, _ = call_main(cli_args, featurefiledir, featurefiles, terminal=True)
+
+    # then
+    dispatched_slots = {(call.args[0], call.args[1]) for call in call_spy.call_args_list}
+    assert actual_exitcode == 0
+    assert ("before", "all") not in dispatched_slots
+    assert ("after", "all") not in dispatched_slots
+    assert ("before", "each_step") in dispatched_slots
+    assert ("after", "each_step") in dispatched_slots
+
+
+def call_main(cli_args, featurefiledir, featurefiles, terminal):
+    """
+    Calls the main CLI with a patched stdout and returns the exit code and the output
+    """
     original_stdout = sys.stdout
 
     with tempfile.TemporaryFile() as tmp:
         tmp_stdout = open(tmp.fileno(), mode="w+", encoding="utf-8", closefd=False)
+        tmp_stdout.isatty = lambda: terminal
         # patch sys.stdout
         sys.stdout = tmp_stdout
 
@@ -409,6 +564,4 @@ def test_main_cli_calls(
     for featurefile in featurefiles:
         rel_featurefile = os.path.relpath(featurefile, feature_parent_dir)
         actual_output = actual_output.replace(featurefile, rel_featurefile)
-    # then
-    assert actual_output == expected_output_string
-    assert actual_exitcode == expected_exitcode
+    return actual_exitcode, actual_output
@@ -7,6 +7,8 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import asyncio
+import io
 import json
 import os
 
@@ -47,6 +49,25 @@ def sum_numbers(step):
     step.context.sum = sum(step.context.numbers)
 
 
+@when("I add them up asynchronously")
+async def sum_numbers_async(step):
+    "When I add them up asynchronously"
+    await asyncio.sleep(0.01)
+    step.context.sum = sum(step.context.numbers)
+
+
+@when("I add them up asynchronously like another Step")
+async def sum_numbers_async_like_another_step(step):
+    "When I add them up asynchronously like another Step"
+    await step.behave_like_async("When I add them up asynchronously")
+
+
+@when("I add them up like another asynchronous Step")
+def sum_numbers_like_another_async_step(step):
+    "When I add them up like another asynchronous Step"
+    step.behave_like("When I add them up asynchronously")
+
+
 @when("I add them up with failure")
 def sum_numbers_failure(step):
     "When I add them up with failure"
@@ -153,8 +174,9 @@ def embed_a_text_data(step):
 
 @when("generate cucumber report")
 def generate_cucumber_report(step):
+    step.context.cucumber_json = io.StringIO()
     cjw = CucumberJSONWriter()
-    cjw.generate_ccjson([step.parent.parent], None)
+    cjw.generate_ccjson([step.parent.parent], step.context.cucumber_json)
 
 
 @then("genreated cucumber json equals to {expected_json_file:QuotedString}")
@@ -162,8 +184,7 @@ def proper_cucumber_json_is_generated(step, expected_json_file):
     def remove_changing(d):
         return {k: v for k, v in d.items() if k not in ["duration", "uri", "endtime", "starttime"]}
 
-    with open(world.config.cucumber_json) as f_cucumber_json:
-        cucumber_json = json.load(f_cucumber_json, object_hook=remove_changing)
+    cucumber_json = json.loads(step.context.cucumber_json.getvalue(), object_hook=remove_changing)
     json_file_path = os.path.join(os.path.dirname(step.path), "..", "output", expected_json_file)
     with open(json_file_path) as f_expected_cucumber_json:
         expected_cucumber_json = json.load(f_expected_cucumber_json, object_hook=remove_changing)
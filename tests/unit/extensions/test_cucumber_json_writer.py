@@ -0,0 +1,109 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from radish.exceptions import RadishError
+from radish.extensions.cucumber_json_writer import CucumberJSONWriter
+from radish.feature import Feature
+from radish.scenario import Scenario
+from radish.stepmodel import Step
+from radish.terrain import world
+
+
+def create_feature(feature_id, sentence):
+    """
+    Creates a feature with a single scenario and step which has embedded data
+    """
+    feature = Feature(feature_id, "Feature", sentence, "foo.feature", 1, tags=None)
+    scenario = Scenario(1, "Scenario", "I am a Scenario", "foo.feature", 2, parent=feature, tags=None)
+    step = Step(1, "Given I have a step", "foo.feature", 3, parent=scenario, runable=True)
+    step.state = Step.State.PASSED
+    step.starttime = datetime.now(timezone.utc)
+    step.endtime = datetime.now(timezone.utc)
+    step.embed("data")
+    scenario.steps.append(step)
+    feature.scenarios.append(scenario)
+    return feature
+
+
+@pytest.fixture()
+def ccjson_path(tmp_path):
+    """
+    Fixture to configure the path of the cucumber json result file
+    """
+    world.config.cucumber_json = str(tmp_path / "ccjson.json")
+    world.config.scenarios = None
+    return world.config.cucumber_json
+
+
+def test_empty_feature_list(ccjson_path):
+    writer = CucumberJSONWriter()
+    no_features = []
+
+    with pytest.raises(RadishError):
+        writer.generate_ccjson(no_features, io.StringIO())
+
+
+def test_write_features_incrementally(ccjson_path):
+    """
+    Test that the features are written to the cucumber json result file as soon as they have run
+    """
+    # given
+    features = [create_feature(1, "I am the first feature"), create_feature(2, "I am the second feature")]
+    writer = CucumberJSONWriter()
+    writer.open_ccjson(features, "marker-is-ignored")
+
+    # when
+    writer.write_feature(features[0])
+
+    # then
+    with open(ccjson_path) as f:
+        partial_ccjson = f.read()
+    assert "I am the first feature" in partial_ccjson
+    assert "I am the second feature" not in partial_ccjson
+    assert features[0].scenarios[0].steps[0].embeddings == []
+
+    # when
+    writer.close_ccjson(features, "marker-is-ignored")
+
+    # then
+    with open(ccjson_path) as f:
+        ccjson = json.load(f)
+    assert [f["name"] for f in ccjson] == ["I am the first feature", "I am the second feature"]
+    assert ccjson[0]["elements"][0]["steps"][0]["embeddings"] == [{"data": "ZGF0YQ==", "mime_type": "text/plain"}]
+
+
+def test_streamed_ccjson_equals_generated_ccjson(ccjson_path):
+    """
+    Test that the incrementally written cucumber json equals the cucumber json dumped at once
+    """
+    # given
+    features = [create_feature(1, "I am the first feature"), create_feature(2, "I am the second feature")]
+    writer = CucumberJSONWriter()
+    expected_ccjson = json.dumps(
+        [writer._get_feature_json(f) for f in features], indent=CucumberJSONWriter.INDENT, sort_keys=True
+    )
+
+    generated_ccjson = io.StringIO()
+
+    # when
+    writer.generate_ccjson(features, generated_ccjson)
+    writer.open_ccjson(features, "marker-is-ignored")
+    writer.write_feature(features[0])
+    writer.close_ccjson(features, "marker-is-ignored")
+
+    # then
+    with open(ccjson_path) as f:
+        assert f.read() == expected_ccjson
+    assert generated_ccjson.getvalue() == expected_ccjson
@@ -21,100 +21,117 @@ from radish.stepmodel import Step
 from radish.terrain import world
 
 
-def test_empty_feature_list():
-    writer = JUnitXMLWriter()
-    no_features = []
-
-    with pytest.raises(RadishError):
-        writer.generate_junit_xml(no_features, "marker-is-ignored")
-
-
-def test_single_feature_list(mocker):
-    stub = mocker.patch("radish.extensions.junit_xml_writer.JUnitXMLWriter._write_xml_to_disk")
-
-    first_feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
-    first_feature.starttime = datetime.now(timezone.utc)
-    first_feature.endtime = datetime.now(timezone.utc)
-
-    features = [first_feature]
+def write_junit_xml(features, ran_features):
+    """
+    Writes the JUnit XML of the given features like the hooks of a run
 
+    :param list features: all features of the run
+    :param list ran_features: the features which have run
+    """
     writer = JUnitXMLWriter()
-    writer.generate_junit_xml(features, "marker-is-ignored")
+    writer.open_junit_xml(features, "marker-is-ignored")
+    for feature in ran_features:
+        writer.write_feature(feature)
+    writer.close_junit_xml(features, "marker-is-ignored")
 
-    assert "I am a feature" in str(stub.call_args[0])
-
-
-def test_normal_feature_list(mocker):
-    world.config.junit_relaxed = False
-    stub = mocker.patch("radish.extensions.junit_xml_writer.JUnitXMLWriter._write_xml_to_disk")
+    with open(world.config.junit_xml) as f:
+        return f.read()
 
-    tags = [Tag("author", "batman")]
 
-    first_scenario = Scenario(
-        1,
-        "Scenario",
-        "I am a Scenario",
-        "foo.feature",
-        1,
-        parent=None,
-        tags=tags,
-        preconditions=None,
-        background=None,
-    )
-    first_scenario.starttime = datetime.now(timezone.utc)
-    first_scenario.endtime = datetime.now(timezone.utc)
-
-    first_feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
-    first_feature.starttime = datetime.now(timezone.utc)
-    first_feature.endtime = datetime.now(timezone.utc)
-    first_feature.scenarios.append(first_scenario)
-
-    features = [first_feature]
-
-    writer = JUnitXMLWriter()
-    writer.generate_junit_xml(features, "marker-is-ignored")
-
-    assert "I am a Scenario" in str(stub.call_args[0])
-    assert "properties" not in str(stub.call_args[0])
-
-
-def test_relaxed_mode_adding_tags_to_junit(mocker):
-    world.config.junit_relaxed = True
-    stub = mocker.patch("radish.extensions.junit_xml_writer.JUnitXMLWriter._write_xml_to_disk")
-
-    tags = [Tag("author", "batman")]
-
-    first_scenario = Scenario(
+def create_feature_with_scenario():
+    """
+    Creates a Feature which has run with a Scenario tagged with an author
+    """
+    scenario = Scenario(
         1,
         "Scenario",
         "I am a Scenario",
         "foo.feature",
         1,
         parent=None,
-        tags=tags,
+        tags=[Tag("author", "batman")],
         preconditions=None,
         background=None,
     )
-    first_scenario.starttime = datetime.now(timezone.utc)
-    first_scenario.endtime = datetime.now(timezone.utc)
-
-    first_feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
-    first_feature.starttime = datetime.now(timezone.utc)
-    first_feature.endtime = datetime.now(timezone.utc)
-    first_feature.scenarios.append(first_scenario)
-
-    features = [first_feature]
+    scenario.starttime = datetime.now(timezone.utc)
+    scenario.endtime = datetime.now(timezone.utc)
 
-    writer = JUnitXMLWriter()
-    writer.generate_junit_xml(features, "marker-is-ignored")
-
-    assert "author" in str(stub.call_args[0])
-    assert "batman" in str(stub.call_args[0])
+    feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
+    feature.starttime = datetime.now(timezone.utc)
+    feature.endtime = datetime.now(timezone.utc)
+    feature.scenarios.append(scenario)
+    return feature
 
 
-def test_early_exit_feature_list(mocker):
-    stub = mocker.patch("radish.extensions.junit_xml_writer.JUnitXMLWriter._write_xml_to_disk")
+def test_empty_feature_list(world_config, tmp_path):
+    """
+    Test that the JUnit XML cannot be written without any features
+    """
+    # given
+    world_config.junit_xml = str(tmp_path / "junit.xml")
 
+    # then
+    with pytest.raises(RadishError):
+        # when
+        write_junit_xml([], [])
+
+
+def test_single_feature_list(world_config, tmp_path):
+    """
+    Test writing the JUnit XML for a single Feature without Scenarios
+    """
+    # given
+    world_config.junit_xml = str(tmp_path / "junit.xml")
+    feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
+    feature.starttime = datetime.now(timezone.utc)
+    feature.endtime = datetime.now(timezone.utc)
+
+    # when
+    result = write_junit_xml([feature], [feature])
+
+    # then
+    assert "I am a feature" in result
+
+
+def test_normal_feature_list(world_config, tmp_path):
+    """
+    Test writing the JUnit XML for a Feature with a Scenario
+    """
+    # given
+    world_config.junit_xml = str(tmp_path / "junit.xml")
+    feature = create_feature_with_scenario()
+
+    # when
+    result = write_junit_xml([feature], [feature])
+
+    # then
+    assert "I am a Scenario" in result
+    assert "properties" not in result
+
+
+def test_relaxed_mode_adding_tags_to_junit(world_config, tmp_path):
+    """
+    Test that the Scenario tags are written as properties in the relaxed mode
+    """
+    # given
+    world_config.junit_xml = str(tmp_path / "junit.xml")
+    world_config.junit_relaxed = True
+    feature = create_feature_with_scenario()
+
+    # when
+    result = write_junit_xml([feature], [feature])
+
+    # then
+    assert "author" in result
+    assert "batman" in result
+
+
+def test_early_exit_feature_list(world_config, tmp_path):
+    """
+    Test that the Features which did not run are written at the end of the run
+    """
+    # given
+    world_config.junit_xml = str(tmp_path / "junit.xml")
     first_feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
     first_feature.starttime = datetime.now(timezone.utc)
     first_feature.endtime = datetime.now(timezone.utc)
@@ -126,12 +143,10 @@ def test_early_exit_feature_list(mocker):
     second_feature.scenarios = [scenario]
     assert second_feature.state not in [Step.State.PASSED, Step.State.FAILED]
 
-    features = [first_feature, second_feature]
+    # when
+    result = write_junit_xml([first_feature, second_feature], [first_feature])
 
-    writer = JUnitXMLWriter()
-    writer.generate_junit_xml(features, "marker-is-ignored")
-
-    result = str(stub.call_args[0])
+    # then
     feature_regex = re.compile(r"<testsuite[^>]*name=\"([^\"]+)\"([^>]*)>")
     matches = feature_regex.findall(result)
     assert len(matches) == 2
@@ -140,3 +155,33 @@ def test_early_exit_feature_list(mocker):
     assert 'tests="0"' in f1_match[1]  # f1 contains no scenarios
     assert 'skipped="1"' in f2_match[1]  # f2 contains one untested scenario (it was skipped)
     assert "<skipped" in result  # there is a skipped testcase element
+
+
+def test_write_features_incrementally(tmp_path):
+    """
+    Test that the testsuites are serialized as soon as their feature has run
+    """
+    # given
+    world.config.junit_xml = str(tmp_path / "junit.xml")
+    world.config.junit_relaxed = False
+    world.config.scenarios = None
+    features = [
+        Feature(1, "Feature", "I am the first feature", "foo.feature", 1, tags=None),
+        Feature(2, "Feature", "I am the second feature", "foo.feature", 1, tags=None),
+    ]
+    for feature in features:
+        feature.starttime = datetime.now(timezone.utc)
+        feature.endtime = datetime.now(timezone.utc)
+    writer = JUnitXMLWriter()
+    writer.open_junit_xml(features, "marker-is-ignored")
+
+    # when
+    writer.write_feature(features[0])
+    writer.close_junit_xml(features, "marker-is-ignored")
+
+    # then
+    with open(world.config.junit_xml) as f:
+        result = f.read()
+    assert result.startswith("<?xml version='1.0' encoding='utf-8'?>\n<testsuites time=")
+    assert re.findall(r"<testsuite name=\"([^\"]+)\"", result) == ["I am the first feature", "I am the second feature"]
+    assert result.endswith("</testsuites>\n")
@@ -0,0 +1,106 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import io
+import sys
+import time
+
+import pytest
+
+from radish.console import ConsoleSink, NullSink, redirect_console
+
+
+class TerminalStream(io.StringIO):
+    """
+    StringIO which pretends to write to a terminal
+    """
+
+    def isatty(self):
+        return True
+
+
+def test_sink_buffers_until_buffer_is_full():
+    """
+    Test that the ConsoleSink writes the output once its buffer is full
+    """
+    # given
+    stream = io.StringIO()
+    sink = ConsoleSink(stream, buffer_size=10, flush_interval=60)
+
+    # when
+    sink.write("12345\n")
+    before_full = stream.getvalue()
+    sink.write("67890\n")
+
+    # then
+    assert before_full == ""
+    assert stream.getvalue() == "12345\n67890\n"
+
+
+def test_sink_flushes_after_interval():
+    """
+    Test that the ConsoleSink writes the output after the flush interval without any further write
+    """
+    # given
+    stream = io.StringIO()
+    sink = ConsoleSink(stream, buffer_size=1024, flush_interval=0.01)
+
+    # when
+    sink.write("foo\n")
+    deadline = time.monotonic() + 5
+    while not stream.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # then
+    assert stream.getvalue() == "foo\n"
+
+
+def test_sink_is_line_buffered_for_terminals():
+    """
+    Test that the ConsoleSink writes every line immediately to a terminal
+    """
+    # given
+    stream = TerminalStream()
+    sink = ConsoleSink(stream, buffer_size=1024, flush_interval=60)
+
+    # when
+    sink.write("foo")
+    before_line_break = stream.getvalue()
+    sink.write("\n")
+
+    # then
+    assert sink.isatty() is True
+    assert before_line_break == ""
+    assert stream.getvalue() == "foo\n"
+
+
+@pytest.mark.parametrize(
+    "given_sink, expected_output",
+    [
+        (ConsoleSink(io.StringIO(), flush_interval=60), "foo\nbar\n"),
+        (NullSink(), ""),
+    ],
+    ids=["console sink", "null sink"],
+)
+def test_redirect_console(given_sink, expected_output):
+    """
+    Test redirecting the console output to a sink
+    """
+    # given
+    original_stdout = sys.stdout
+
+    # when
+    with redirect_console(given_sink):
+        print("foo")
+        print("bar")
+
+    # then
+    assert sys.stdout is original_stdout
+    output = given_sink.stream.getvalue() if isinstance(given_sink, ConsoleSink) else ""
+    assert output == expected_output
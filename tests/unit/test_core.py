@@ -0,0 +1,83 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import os
+
+import pytest
+
+from radish.core import Core
+from radish.exceptions import FeatureFileSyntaxError
+from radish.parser import FeatureParser
+
+
+def test_parse_features_in_workers(featurefiledir):
+    """
+    Test that parsing Feature files in worker processes results in the same Features as parsing them sequentially
+    """
+    # given
+    featurefiles = [
+        os.path.join(featurefiledir, name + ".feature")
+        for name in ("feature-scenarios", "precondition-level-2", "scenario-outline", "precondition-same-feature")
+    ]
+    sequential_core = Core()
+    sequential_core.parse_features(featurefiles, None)
+    core = Core(parse_workers=2)
+
+    # when
+    core.parse_features(featurefiles, None)
+
+    # then
+    assert [(f.id, f.path) for f in core.features] == [(f.id, f.path) for f in sequential_core.features]
+    assert [(s.absolute_id, s.sentence) for f in core.features_to_run for s in f.scenarios] == [
+        (s.absolute_id, s.sentence) for f in sequential_core.features_to_run for s in f.scenarios
+    ]
+
+
+def test_parse_invalid_feature_in_workers(featurefiledir):
+    """
+    Test that the syntax error of a Feature file parsed in a worker process is raised
+    """
+    # given
+    featurefiles = [
+        os.path.join(featurefiledir, "feature-scenarios.feature"),
+        os.path.join(featurefiledir, "syntax-error-unknown-keyword.feature"),
+    ]
+    core = Core(parse_workers=2)
+
+    # then
+    with pytest.raises(FeatureFileSyntaxError):
+        # when
+        core.parse_features(featurefiles, None)
+
+
+def test_parse_precondition_features_once(featurefiledir, mocker):
+    """
+    Test that a Feature file used for preconditions by multiple Features is only parsed once
+    """
+    # given
+    featurefiles = [
+        os.path.join(featurefiledir, "precondition-level-1.feature"),
+        os.path.join(featurefiledir, "precondition-level-2.feature"),
+    ]
+    core = Core()
+    parse_spy = mocker.spy(FeatureParser, "parse")
+
+    # when
+    core.parse_features(featurefiles, None)
+
+    # then
+    # level-1, level-0 as precondition, level-2 and level-1 as precondition
+    assert parse_spy.call_count == 4
+    assert [f.path for f in core.features] == featurefiles
+    level_1_steps = core.features[0].scenarios[0].all_steps
+    level_2_steps = core.features[1].scenarios[0].all_steps
+    assert level_1_steps[0].sentence == level_2_steps[0].sentence
+    assert level_1_steps[0] is not level_2_steps[0]
+    assert level_1_steps[0].parent is core.features[0].scenarios[0]
+    assert level_2_steps[0].parent is core.features[1].scenarios[0]
@@ -9,7 +9,7 @@ Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 
 import pytest
 
-from radish.customtyperegistry import boolean_type
+from radish.customtyperegistry import CustomTypeRegistry, boolean_type
 
 
 @pytest.mark.parametrize(
@@ -47,3 +47,20 @@ from radish.customtyperegistry import boolean_type
 )
 def test_boolean_type_parsing(input_str, expected_bool):
     assert boolean_type(input_str) is expected_bool
+
+
+def test_registering_custom_type_increments_version(mocker):
+    """
+    Test that registering a custom type increments the registry version
+    """
+    # given
+    registry = CustomTypeRegistry()
+    mocker.patch.object(registry, "custom_types", {})
+    mocker.patch.object(registry, "version", 0)
+
+    # when
+    registry.register("Number", int)
+
+    # then
+    assert registry.version == 1
+    assert registry.custom_types == {"Number": int}
@@ -199,3 +199,29 @@ def test_getting_extension_options(extensionregistry, mocker):
     --bar                                       enable bar power
     --bar-pow                                   enable magnitude of bar power"""
     )
+
+
+@pytest.mark.parametrize(
+    "keep_scenario_steps, expected_keep_scenario_steps",
+    [(True, True), (None, False)],
+    ids=["Extension keeping the Scenario Steps", "Extension not keeping the Scenario Steps"],
+)
+def test_keep_scenario_steps(keep_scenario_steps, expected_keep_scenario_steps, extensionregistry, mocker):
+    """
+    Test that the Steps of the Scenarios are kept if any loaded extension uses them after they have run
+    """
+
+    # given
+    @extension
+    class SimpleExtension:
+        LOAD_IF = staticmethod(lambda config: True)
+
+    if keep_scenario_steps is not None:
+        SimpleExtension.KEEP_SCENARIO_STEPS = keep_scenario_steps
+    extensionregistry.load(mocker.MagicMock())
+
+    # when
+    actual_keep_scenario_steps = extensionregistry.keep_scenario_steps()
+
+    # then
+    assert actual_keep_scenario_steps is expected_keep_scenario_steps
@@ -186,6 +186,17 @@ def test_feature_constants(mocker):
     assert constants[1].value == 2
 
 
+def set_state(feature, scenario, state):
+    """
+    Sets the state of the given mocked Scenario
+
+    The Steps of a Scenario reset the cached state of the Feature
+    if they change their state, thus, the cached state is reset, too.
+    """
+    scenario.state = state
+    feature.reset_state()
+
+
 def test_feature_state(mocker):
     """
     Test the state of a Feature according to the Scenario states
@@ -216,41 +227,42 @@ def test_feature_state(mocker):
     assert feature.state == Step.State.PASSED
 
     # when one Scenario is pending then the Feature is pending
-    regular_scenario.state = Step.State.PENDING
+    set_state(feature, regular_scenario, Step.State.PENDING)
     assert feature.state == Step.State.PENDING
 
     # when one Scenario is skipped then the Feature is skipped
-    regular_scenario.state = Step.State.SKIPPED
+    set_state(feature, regular_scenario, Step.State.SKIPPED)
     assert feature.state == Step.State.SKIPPED
 
     # when one Scenario is failed then the Feature is failed
-    regular_scenario.state = Step.State.FAILED
+    set_state(feature, regular_scenario, Step.State.FAILED)
     assert feature.state == Step.State.FAILED
 
     # when one Scenario is failed then the Feature is failed
-    regular_scenario.state = Step.State.UNTESTED
+    set_state(feature, regular_scenario, Step.State.UNTESTED)
     assert feature.state == Step.State.UNTESTED
-    regular_scenario.state = Step.State.PASSED
+    set_state(feature, regular_scenario, Step.State.PASSED)
 
     # Scenario Outline and Scenario Loop states are ignored
-    scenario_outline.state = Step.State.FAILED
+    set_state(feature, scenario_outline, Step.State.FAILED)
     assert feature.state == Step.State.PASSED
-    scenario_loop.state = Step.State.FAILED
+    set_state(feature, scenario_loop, Step.State.FAILED)
     assert feature.state == Step.State.PASSED
 
     # when a Scenario Outline Example is not passed the Feature is not passed
-    scenario_outline_example.state = Step.State.FAILED
+    set_state(feature, scenario_outline_example, Step.State.FAILED)
     assert feature.state == Step.State.FAILED
-    scenario_outline_example.state = Step.State.PASSED
+    set_state(feature, scenario_outline_example, Step.State.PASSED)
 
     # when a Scenario Loop Iteration is not passed the Feature is not passed
-    scenario_loop_iteration.state = Step.State.FAILED
+    set_state(feature, scenario_loop_iteration, Step.State.FAILED)
     assert feature.state == Step.State.FAILED
-    scenario_loop_iteration.state = Step.State.PASSED
+    set_state(feature, scenario_loop_iteration, Step.State.PASSED)
 
     # when a Scenario is untested which does not have to be run then the Feature is passed
-    regular_scenario.state = Step.State.UNTESTED
+    set_state(feature, regular_scenario, Step.State.UNTESTED)
     regular_scenario.has_to_run.return_value = False
+    feature.reset_state()
     assert feature.state == Step.State.PASSED
 
 
@@ -11,7 +11,6 @@ import pytest
 
 import radish.exceptions as errors
 from radish.hookregistry import after, before
-from radish.model import Tag
 
 
 def test_available_hooks():
@@ -111,11 +110,11 @@ def test_call_hooks_filtered_by_tags(hookregistry, mocker):
         stub()
 
     hook_call_stub = mocker.stub()
-    model = mocker.MagicMock(all_tags=[])
+    model = mocker.MagicMock(rendered_tags=[])
 
     models = [
-        mocker.MagicMock(all_tags=[Tag(name="good_case")]),
-        mocker.MagicMock(all_tags=[Tag(name="bad_case")]),
+        mocker.MagicMock(rendered_tags=["good_case"]),
+        mocker.MagicMock(rendered_tags=["bad_case"]),
     ]
 
     # when & then
@@ -124,12 +123,12 @@ def test_call_hooks_filtered_by_tags(hookregistry, mocker):
     assert hook_call_stub.call_count == 1
 
     # only generic & good case
-    model.all_tags = [Tag(name="good_case")]
+    model.rendered_tags = ["good_case"]
     hookregistry.call("after", "all", True, model, hook_call_stub)
     assert hook_call_stub.call_count == 3
 
     # only generic & bad case
-    model.all_tags = [Tag(name="bad_case")]
+    model.rendered_tags = ["bad_case"]
     hookregistry.call("after", "all", True, model, hook_call_stub)
     assert hook_call_stub.call_count == 5
 
@@ -180,3 +179,36 @@ def test_call_after_hooks_in_correct_order(hookregistry, mocker):
 
     # then
     assert data == [2, 1]
+
+
+def test_call_hooks_in_registered_order(hookregistry):
+    """
+    Test that hooks with the same order are called in the order they were registered
+    """
+    # given
+    data = []
+    hookregistry.register("after", "each_step", lambda step: data.append("first"))
+    hookregistry.register("after", "each_step", lambda step: data.append("second"))
+    hookregistry.register("after", "each_step", lambda step: data.append("early"), order=1)
+
+    # when
+    hookregistry.call("after", "each_step", True, None)
+    hookregistry.call("after", "each_step", False, None)
+
+    # then
+    assert data == ["early", "first", "second", "first", "second", "early"]
+
+
+def test_has_hooks(hookregistry):
+    """
+    Test that the HookRegistry knows for which slots hooks are registered
+    """
+    # when
+    hookregistry.register("after", "each_step", lambda step: None)
+
+    # then
+    assert hookregistry.has_hooks("after", "each_step")
+    assert not hookregistry.has_hooks("before", "each_step")
+    assert not hookregistry.has_hooks("after", "each_scenario")
+    hookregistry.reset()
+    assert not hookregistry.has_hooks("after", "each_step")
@@ -14,6 +14,7 @@ from parse_type.cfparse import Parser
 
 import radish.exceptions as errors
 from radish import matcher
+from radish.customtyperegistry import CustomTypeRegistry
 
 
 @pytest.mark.parametrize(
@@ -338,3 +339,202 @@ def test_no_step_definition_merge(given_sentence, given_steps, mocker):
 
     # then
     assert str(exc.value).startswith("Cannot find step definition for step")
+
+
+@pytest.mark.parametrize(
+    "given_pattern, expected_literal_prefix",
+    [
+        (re.compile(r"Given I have the number (\d+)"), "Given I have the number "),
+        (re.compile(r"^Given I have a number"), "Given I have a number"),
+        (re.compile(r"Given I have numbers? (\d+)"), "Given I have number"),
+        (re.compile(r"Given I have a (.*) number"), "Given I have a "),
+        (re.compile(r"Given I have|When I have"), ""),
+        (re.compile(r"Given I have", re.VERBOSE), ""),
+        ("Given I have the number {:d}", "Given I have the number "),
+        ("Given I have {{braces}} {:d}", "Given I have {braces} "),
+        ("{:d} is the number", ""),
+    ],
+    ids=[
+        "Regex: literal prefix before group",
+        "Regex: anchored pattern without groups",
+        "Regex: quantified char is not part of the prefix",
+        "Regex: literal prefix before wildcard group",
+        "Regex: alternation has no prefix",
+        "Regex: verbose pattern has no prefix",
+        "Parse: literal prefix before field",
+        "Parse: escaped braces are part of the prefix",
+        "Parse: leading field has no prefix",
+    ],
+)
+def test_step_pattern_literal_prefix(given_pattern, expected_literal_prefix):
+    """
+    Test extracting the literal prefix from Step patterns
+    """
+    # given
+    step_pattern = matcher.StepPattern(0, given_pattern, None)
+
+    # when
+    literal_prefix = step_pattern.literal_prefix
+
+    # then
+    assert literal_prefix == expected_literal_prefix
+
+
+@pytest.mark.parametrize(
+    "given_sentence, given_steps, expected_candidates",
+    [
+        (
+            "Given I have the number 5",
+            {
+                "Given I have the number {:d}": 1,
+                "When I add the number {:d}": 2,
+                re.compile(r"Then the result is (\d+)"): 3,
+            },
+            [1],
+        ),
+        (
+            "Given I have the number 5",
+            {
+                "I have the number {:d}": 1,
+                "ven I have the number {:d}": 2,
+                "I have a number {:d}": 3,
+            },
+            [1, 2],
+        ),
+        (
+            "GIVEN I HAVE THE NUMBER 5",
+            {"Given I have the number {:d}": 1, "When I have the number {:d}": 2},
+            [1],
+        ),
+        (
+            "Given I have the number 5",
+            {"When I add {:d}": 1, "{:d}": 2, re.compile(r"(.*) number"): 3},
+            [2, 3],
+        ),
+        (
+            "Given I häve the number 5",
+            {"Given I have the number {:d}": 1, "When I add {:d}": 2},
+            [1, 2],
+        ),
+    ],
+    ids=[
+        "only patterns with matching literal prefix",
+        "literal prefix may start within a word",
+        "literal prefix is case insensitive",
+        "patterns without literal prefix are always candidates",
+        "non-ASCII sentence with all patterns",
+    ],
+)
+def test_step_pattern_index_candidates(given_sentence, given_steps, expected_candidates):
+    """
+    Test finding the candidate Step patterns for a sentence
+    """
+    # given
+    index = matcher.StepPatternIndex(given_steps)
+
+    # when
+    candidates = index.candidates(given_sentence)
+
+    # then
+    assert [c.func for c in candidates] == expected_candidates
+
+
+def test_step_pattern_index_is_rebuilt_for_new_steps():
+    """
+    Test that the Step pattern index is rebuilt if Steps are registered
+    """
+    # given
+    steps = {"Given I have the number {:d}": 1}
+    index = matcher.StepPatternIndex.get(steps)
+
+    # when
+    steps["When I add the number {:d}"] = 2
+
+    # then
+    assert matcher.StepPatternIndex.get(steps) is not index
+    assert matcher.match_step("When I add the number 5", steps).func == 2
+
+
+def test_step_parser_cache_reuses_parser():
+    """
+    Test that the Parser of a parse Step pattern is only compiled once
+    """
+    # given
+    cache = matcher.StepParserCache()
+
+    # when
+    parser = cache.get("Given I have the number {:d}", int)
+
+    # then
+    assert cache.get("Given I have the number {:d}", int) is parser
+
+
+def test_step_parser_cache_invalidated_by_custom_type(mocker):
+    """
+    Test that the cached Parsers are invalidated if a custom type is registered
+    """
+    # given
+    cache = matcher.StepParserCache()
+    parser = cache.get("Given I have the number {:d}", int)
+
+    # when
+    mocker.patch.object(CustomTypeRegistry(), "custom_types", {})
+    mocker.patch.object(CustomTypeRegistry(), "version", CustomTypeRegistry().version)
+    CustomTypeRegistry().register("Number", int)
+
+    # then
+    assert cache.get("Given I have the number {:d}", int) is not parser
+
+
+def test_step_match_is_memoized():
+    """
+    Test that matching the same sentence again uses the memoized match
+    """
+    # given
+    steps = {"Given I have the number {:d}": 1}
+    first_match = matcher.match_step("Given I have the number 5", steps)
+
+    # when
+    second_match = matcher.match_step("Given I have the number 5", steps)
+
+    # then
+    memo = matcher.StepPatternIndex.get(steps).memo
+    assert second_match is first_match
+    assert memo.hits == 1
+    assert memo.misses == 1
+
+
+def test_step_match_memo_evicts_least_recently_used():
+    """
+    Test that the memo evicts the least recently used match if it's full
+    """
+    # given
+    memo = matcher.StepMatchMemo(maxsize=2)
+    memo.put("Given a", 1)
+    memo.put("Given b", 2)
+    memo.get("Given a")
+
+    # when
+    memo.put("Given c", 3)
+
+    # then
+    assert len(memo) == 2
+    assert memo.get("Given a") == 1
+    assert memo.get("Given b") is matcher.StepMatchMemo.MISSING
+    assert memo.get("Given c") == 3
+
+
+def test_step_match_memo_cleared_by_step_registration(stepregistry):
+    """
+    Test that a new Step registration does not use previously memoized matches
+    """
+    # given
+    stepregistry.register("Given I have the number", 1)
+    matcher.match_step("Given I have the number 5", stepregistry.steps)
+
+    # when
+    stepregistry.register("Given I have the number {:d}", 2)
+
+    # then
+    assert matcher.match_step("Given I have the number 5", stepregistry.steps).func == 2
+    assert matcher.StepPatternIndex.get(stepregistry.steps).memo.hits == 0
@@ -8,6 +8,7 @@ Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
 import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -78,6 +79,22 @@ def test_getting_tags_from_model():
     assert tags[2].name == "bar"
 
 
+def test_getting_model_rendered_tags():
+    """
+    Test getting the rendered Tags of a Model and it's parents
+    """
+    # given
+    parent_model = Model(1, "Model", "I am a Model", "foo.feature", 1, parent=None, tags=[Tag("author", "tuxtimo")])
+    model = Model(1, "Model", "I am a Model", "foo.feature", 1, parent=parent_model, tags=[Tag("foo")])
+
+    # when
+    tags = model.rendered_tags
+
+    # then
+    assert tags == ["author(tuxtimo)", "foo"]
+    assert model.rendered_tags is tags
+
+
 def test_getting_model_duration():
     """
     Test getting duration of a Model
@@ -118,3 +135,36 @@ def test_getting_model_duration_with_missing_time():
     assert (
         str(exc.value) == "Cannot get duration of Model 'I am a Model' because either starttime or endtime is not set"
     )
+
+
+def test_getting_recorded_model_times():
+    """
+    Test getting the recorded start- and endtime and the duration of a Model
+    """
+    # given
+    model = Model(1, "Model", "I am a Model", "foo.feature", 1, parent=None, tags=None)
+    before = datetime.now(timezone.utc)
+
+    # when
+    model.record_starttime()
+    model.record_endtime()
+
+    # then
+    after = datetime.now(timezone.utc)
+    assert before - timedelta(seconds=1) <= model.starttime <= model.endtime <= after + timedelta(seconds=1)
+    assert timedelta(0) <= model.duration <= after - before + timedelta(milliseconds=1)
+
+
+def test_setting_recorded_model_time():
+    """
+    Test that setting the starttime of a Model replaces the recorded starttime
+    """
+    # given
+    model = Model(1, "Model", "I am a Model", "foo.feature", 1, parent=None, tags=None)
+    model.record_starttime()
+
+    # when
+    model.starttime = None
+
+    # then
+    assert model.starttime is None
@@ -0,0 +1,220 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import asyncio
+import io
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from radish.parallelrunner import (
+    AsyncRunner,
+    CapturedOutput,
+    ProcessPoolRunner,
+    apply_results,
+    collect_results,
+    copy_world,
+)
+from radish.stepmodel import Step
+from radish.terrain import world
+
+
+@pytest.mark.parametrize(
+    "distribute_scenarios, scenario_choice, expected_tasks",
+    [
+        (False, None, [(1, None), (2, None)]),
+        (True, None, [(1, 1), (1, 2), (2, 3), (2, 4)]),
+        (True, [2, 3], [(1, 2), (2, 3)]),
+    ],
+    ids=[
+        "Distribute Features",
+        "Distribute Scenarios",
+        "Distribute chosen Scenarios",
+    ],
+)
+def test_process_pool_runner_tasks(
+    distribute_scenarios, scenario_choice, expected_tasks, world_config, hookregistry, core, featurefiledir
+):
+    """
+    Test distributing Features or Scenarios to the worker processes
+    """
+    # given
+    featurefiles = [
+        os.path.join(featurefiledir, "feature-scenarios.feature"),
+        os.path.join(featurefiledir, "constants.feature"),
+    ]
+    core.parse_features(featurefiles, None)
+    world_config.scenarios = scenario_choice
+    runner = ProcessPoolRunner(hookregistry, 2, distribute_scenarios=distribute_scenarios)
+
+    # when
+    tasks = runner.get_tasks(core.features_to_run)
+
+    # then
+    assert tasks == expected_tasks
+
+
+def test_applying_results_from_worker(core, featurefiledir):
+    """
+    Test applying the pickled run results of a worker process to a Feature
+    """
+    # given
+    featurefile = os.path.join(featurefiledir, "feature-scenarios.feature")
+    worker_feature = core.parse_feature(featurefile, None)
+    feature = core.parse_feature(featurefile, None)
+    now = datetime.now(timezone.utc)
+    worker_feature.starttime = worker_feature.endtime = now
+    for scenario in worker_feature.scenarios:
+        scenario.starttime = scenario.endtime = now
+        for step in scenario.all_steps:
+            step.state = Step.State.PASSED
+            step.starttime = step.endtime = now
+    worker_feature.scenarios[-1].steps[-1].state = Step.State.FAILED
+
+    # when
+    apply_results(feature, pickle.loads(pickle.dumps(collect_results(worker_feature))))
+
+    # then
+    assert feature.starttime == now
+    assert feature.endtime == now
+    assert feature.scenarios[0].state is Step.State.PASSED
+    assert feature.scenarios[-1].state is Step.State.FAILED
+    assert all(step.starttime == now for scenario in feature.scenarios for step in scenario.all_steps)
+
+
+def test_captured_output():
+    """
+    Test capturing the output of the current thread
+    """
+    # given
+    stream = io.StringIO()
+    output = CapturedOutput(stream)
+    thread_outputs = []
+
+    def write_in_thread():
+        output.capture()
+        output.write("thread")
+        thread_outputs.append(output.release())
+
+    # when
+    output.capture()
+    thread = threading.Thread(target=write_in_thread)
+    thread.start()
+    thread.join()
+    output.write("main")
+    main_output = output.release()
+    output.write("stream")
+
+    # then
+    assert thread_outputs == ["thread"]
+    assert main_output == "main"
+    assert stream.getvalue() == "stream"
+
+
+def test_copy_world_to_thread(world_config):
+    """
+    Test that every thread gets a copy of the world and its configuration
+    """
+    # given
+    world.some_value = 42
+    world_attributes = dict(world.__dict__)
+    thread_world = {}
+
+    def run_in_thread():
+        copy_world(world_attributes)
+        world.config.scenarios = [1]
+        thread_world.update(world.__dict__)
+
+    # when
+    thread = threading.Thread(target=run_in_thread)
+    thread.start()
+    thread.join()
+
+    # then
+    assert thread_world["some_value"] == 42
+    assert thread_world["config"] is not world_config
+    assert thread_world["config"].scenarios == [1]
+    assert world_config.scenarios != [1]
+
+
+def test_async_runner_run_step_show_only(hookregistry, mocker):
+    """
+    Test that the AsyncRunner does not run the Step when show only mode is on
+    """
+    # given
+    before_step_stub = mocker.stub()
+    after_step_stub = mocker.stub()
+    hookregistry.register("before", "each_step", before_step_stub)
+    hookregistry.register("after", "each_step", after_step_stub)
+    runner = AsyncRunner(hookregistry, 2, show_only=True)
+    step = mocker.MagicMock(rendered_tags=[])
+
+    # when
+    returncode = asyncio.run(runner.run_step_async(step))
+
+    # then
+    assert returncode == 0
+    assert step.run_async.call_count == 0
+    assert before_step_stub.call_count == 1
+    assert after_step_stub.call_count == 1
+
+
+def test_async_runner_skips_hook_dispatch_without_hooks(hookregistry, mocker):
+    """
+    Test that the AsyncRunner does not dispatch the hooks for a model without any registered hooks
+    """
+    # given
+    hookregistry.register("before", "each_feature", mocker.stub())
+    runner = AsyncRunner(hookregistry, 2, show_only=True)
+    call_spy = mocker.spy(hookregistry, "call")
+    scenario = mocker.MagicMock(rendered_tags=[], steps=[mocker.MagicMock(rendered_tags=[])], state=None)
+    scenario.all_steps = scenario.steps
+
+    # when
+    returncode = asyncio.run(runner.run_scenario_async(scenario))
+
+    # then
+    assert returncode == 0
+    assert call_spy.call_count == 0
+
+
+def test_async_runner_runs_sync_step_in_thread(hookregistry, mocker):
+    """
+    Test that the AsyncRunner runs sync Step definitions in another thread with the world of the run
+    """
+    # given
+    world.some_value = 42
+    world.removed_value = 1
+    step_world = {}
+
+    def run_step():
+        step_world["thread"] = threading.current_thread()
+        step_world["some_value"] = world.some_value
+        world.changed_value = 42
+        del world.removed_value
+        return Step.State.PASSED
+
+    runner = AsyncRunner(hookregistry, 2)
+    step = mocker.MagicMock(rendered_tags=[], definition_func=lambda step: None)
+    step.run.side_effect = run_step
+
+    # when
+    with ThreadPoolExecutor(1) as runner._step_executor:
+        returncode = asyncio.run(runner.run_step_async(step))
+
+    # then
+    assert returncode == 0
+    assert step_world["thread"] is not threading.current_thread()
+    assert step_world["some_value"] == 42
+    assert world.changed_value == 42
+    assert not hasattr(world, "removed_value")
@@ -0,0 +1,135 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import os
+import shutil
+
+import pytest
+import tagexpressions
+
+from radish.core import Core
+from radish.parsecache import ParseCache
+from radish.parser import FeatureParser
+from radish.stepmodel import Step
+
+
+@pytest.fixture()
+def precondition_featurefiles(tmp_path, featurefiledir):
+    """
+    Fixture to copies of feature files depending on each other through a precondition
+    """
+    for name in ("precondition-level-0.feature", "precondition-level-1.feature"):
+        shutil.copy(os.path.join(featurefiledir, name), str(tmp_path))
+    return str(tmp_path / "precondition-level-0.feature"), str(tmp_path / "precondition-level-1.feature")
+
+
+def parse_cached(cache_dir, featurefile, tag_expr=None):
+    """
+    Parses the given feature file with a new Core using the parse cache in the given directory
+    """
+    core = Core(parse_cache=ParseCache(cache_dir))
+    core.parse_features([featurefile], tag_expr)
+    return core
+
+
+def test_load_cached_feature(tmp_path, precondition_featurefiles, mocker):
+    """
+    Test loading a feature with preconditions from the parse cache
+    """
+    # given
+    cache_dir = str(tmp_path / "cache")
+    featurefile = precondition_featurefiles[1]
+    parse_cached(cache_dir, featurefile)
+    parse_spy = mocker.spy(FeatureParser, "parse")
+
+    # when
+    core = parse_cached(cache_dir, featurefile)
+
+    # then
+    assert parse_spy.call_count == 0
+    assert [f.path for f in core.features] == [featurefile]
+    feature = core.features_to_run[0]
+    assert feature.id == 1
+    assert feature.scenarios[0].absolute_id == 1
+    assert feature.scenarios[0].preconditions[0].path == precondition_featurefiles[0]
+    assert feature.scenarios[0].steps[0].state is Step.State.UNTESTED
+
+
+@pytest.mark.parametrize("changed_featurefile", [0, 1], ids=["precondition feature file", "feature file"])
+def test_changed_feature_file_invalidates_cache(changed_featurefile, tmp_path, precondition_featurefiles, mocker):
+    """
+    Test that changing a feature file or a feature file it depends on invalidates the cached feature
+    """
+    # given
+    cache_dir = str(tmp_path / "cache")
+    featurefile = precondition_featurefiles[1]
+    parse_cached(cache_dir, featurefile)
+    with open(precondition_featurefiles[changed_featurefile], "a", encoding="utf-8") as f:
+        f.write("\n    # changed\n")
+    parse_spy = mocker.spy(FeatureParser, "parse")
+
+    # when
+    parse_cached(cache_dir, featurefile)
+
+    # then
+    assert parse_spy.call_count == 2
+
+
+def test_cache_entries_by_tag_expression(tmp_path, precondition_featurefiles):
+    """
+    Test that features parsed with different tag expressions are cached separately
+    """
+    # given
+    cache = ParseCache(str(tmp_path / "cache"))
+    featurefile = precondition_featurefiles[0]
+
+    # when
+    untagged_path = cache.get_entry_path(featurefile, None)
+    tagged_path = cache.get_entry_path(featurefile, tagexpressions.parse("foo"))
+
+    # then
+    assert untagged_path != tagged_path
+
+
+def test_broken_cache_entry_is_ignored(tmp_path, precondition_featurefiles):
+    """
+    Test that a broken cache entry is treated as not cached
+    """
+    # given
+    cache = ParseCache(str(tmp_path / "cache"))
+    featurefile = precondition_featurefiles[0]
+    os.makedirs(cache.directory)
+    with open(cache.get_entry_path(featurefile, None), "wb") as f:
+        f.write(b"broken")
+
+    # when
+    cached = cache.load(featurefile, None)
+
+    # then
+    assert cached is None
+
+
+def test_outlined_scenarios_are_not_cached(tmp_path, featurefiledir):
+    """
+    Test that the Scenarios of Scenario Outlines and Scenario Loops are not built before they are cached
+    """
+    # given
+    cache_dir = str(tmp_path / "cache")
+    featurefiles = [
+        os.path.join(featurefiledir, "scenario-outline.feature"),
+        os.path.join(featurefiledir, "scenario-loop.feature"),
+    ]
+    for featurefile in featurefiles:
+        parse_cached(cache_dir, featurefile)
+
+    # when
+    cached_features = [ParseCache(cache_dir).load(featurefile, None)[1] for featurefile in featurefiles]
+
+    # then
+    assert all(feature.scenarios[0]._scenarios is None for feature in cached_features)
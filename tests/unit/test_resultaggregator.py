@@ -0,0 +1,106 @@
+"""
+radish
+~~~~~~
+
+Behavior Driven Development tool for Python - the root from red to green
+
+Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
+"""
+
+import pytest
+
+from radish.feature import Feature
+from radish.resultaggregator import ResultAggregator
+from radish.scenario import Scenario
+from radish.stepmodel import Step
+
+
+@pytest.fixture()
+def aggregator(world_config):
+    """
+    Fixture to get a reset ResultAggregator
+    """
+    world_config.scenarios = None
+    aggregator = ResultAggregator()
+    aggregator.reset()
+    yield aggregator
+    aggregator.reset()
+
+
+def create_scenario(scenario_id, feature, *states):
+    """
+    Creates a scenario in the given feature with steps in the given states
+    """
+    scenario = Scenario(scenario_id, "Scenario", "Scenario {}".format(scenario_id), "foo.feature", 1, feature)
+    scenario.absolute_id = scenario_id
+    for step_id, state in enumerate(states, start=1):
+        step = Step(step_id, "Given I have a step", "foo.feature", 2, scenario, True)
+        step.state = state
+        scenario.steps.append(step)
+    feature.scenarios.append(scenario)
+    return scenario
+
+
+def test_aggregate_run_result(aggregator):
+    """
+    Test aggregating the results of all features of a run
+    """
+    # given
+    passed_feature = Feature(1, "Feature", "Passed Feature", "foo.feature", 1)
+    create_scenario(1, passed_feature, Step.State.PASSED, Step.State.PASSED)
+    failed_feature = Feature(2, "Feature", "Failed Feature", "foo.feature", 1)
+    create_scenario(2, failed_feature, Step.State.PASSED, Step.State.PENDING)
+    create_scenario(3, failed_feature, Step.State.FAILED, Step.State.SKIPPED)
+
+    # when
+    result = aggregator.get_run_result([passed_feature, failed_feature])
+
+    # then
+    assert result.features["amount"] == 2
+    assert result.features[Step.State.PASSED] == 1
+    assert result.features[Step.State.PENDING] == 1
+    assert result.scenarios["amount"] == 3
+    assert result.scenarios[Step.State.FAILED] == 1
+    assert result.steps["amount"] == 6
+    assert result.steps[Step.State.PASSED] == 3
+    assert result.pending_steps == [failed_feature.scenarios[0].steps[1]]
+    assert [r.state for _, r in result.feature_results] == [passed_feature.state, failed_feature.state]
+
+
+def test_recorded_results_are_shared(aggregator):
+    """
+    Test that the recorded results are used instead of walking through the steps again
+    """
+    # given
+    feature = Feature(1, "Feature", "Feature", "foo.feature", 1)
+    scenario = create_scenario(1, feature, Step.State.PASSED)
+    aggregator.record_scenario(scenario)
+    aggregator.record_feature(feature)
+    # the recorded results do not see later changes of the steps
+    scenario.steps[0].state = Step.State.FAILED
+    features = [feature]
+
+    # when
+    first_result = aggregator.get_run_result(features)
+    second_result = aggregator.get_run_result(features)
+
+    # then
+    assert first_result is second_result
+    assert first_result.scenarios[Step.State.PASSED] == 1
+
+
+def test_unrecorded_results_are_created(aggregator):
+    """
+    Test that the results of not recorded models are created from the models
+    """
+    # given
+    feature = Feature(1, "Feature", "Feature", "foo.feature", 1)
+    scenario = create_scenario(1, feature, Step.State.PASSED, Step.State.UNTESTED)
+
+    # when
+    result = aggregator.get_scenario_result(scenario)
+
+    # then
+    assert result.state is Step.State.UNTESTED
+    assert result.steps[Step.State.UNTESTED] == 1
+    assert result.duration is None
@@ -7,9 +7,13 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import re
+
 import pytest
 
+from radish.feature import Feature
 from radish.runner import Runner
+from radish.scenarioloop import ScenarioLoop
 from radish.stepmodel import Step
 
 
@@ -131,7 +135,7 @@ def test_run_skip_step_hooks(run_or_skip, hookregistry, mocker):
     # create runner
     runner = Runner(hookregistry, show_only=True)
 
-    step = mocker.MagicMock(all_tags=[])
+    step = mocker.MagicMock(rendered_tags=[])
 
     # when
     method = getattr(runner, run_or_skip)
@@ -142,6 +146,42 @@ def test_run_skip_step_hooks(run_or_skip, hookregistry, mocker):
     assert after_step_stub.call_count == 1
 
 
+def test_skip_hook_dispatch_without_hooks(hookregistry, mocker):
+    """
+    Test that the hooks are not dispatched for a model without any registered hooks
+    """
+    # given
+    hookregistry.register("before", "each_scenario", mocker.stub())
+    runner = Runner(hookregistry, show_only=True)
+    call_spy = mocker.spy(hookregistry, "call")
+    step = mocker.MagicMock(rendered_tags=[])
+
+    # when
+    runner.run_step(step)
+
+    # then
+    assert call_spy.call_count == 0
+
+
+def test_skip_hook_dispatch_for_empty_slot(hookregistry, mocker):
+    """
+    Test that the hooks of an empty slot are not dispatched even if the other slot of the model has hooks
+    """
+    # given
+    before_step_stub = mocker.stub()
+    hookregistry.register("before", "each_step", before_step_stub)
+    runner = Runner(hookregistry, show_only=True)
+    call_spy = mocker.spy(hookregistry, "call")
+    step = mocker.MagicMock(rendered_tags=[])
+
+    # when
+    runner.run_step(step)
+
+    # then
+    assert before_step_stub.call_count == 1
+    call_spy.assert_called_once_with("before", "each_step", True, step)
+
+
 def test_should_call_hooks_in_correct_order(hookregistry, mocker):
     """
     Test that hooks are called in correct order.
@@ -181,3 +221,34 @@ def test_should_call_hooks_in_correct_order(hookregistry, mocker):
 
     # then
     assert data == [1, 2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "release_scenario_steps, expected_amount_of_steps",
+    [(True, 0), (False, 1)],
+    ids=["Release the Steps", "Keep the Steps"],
+)
+def test_release_scenario_loop_steps(release_scenario_steps, expected_amount_of_steps, world_config, hookregistry):
+    """
+    Test that the Steps of the Scenarios of a Scenario Loop are released once they have run
+    """
+    # given
+    feature = Feature(1, "Feature", "I am a Feature", "foo.feature", 1)
+    scenario_loop = ScenarioLoop(
+        1, "Scenario Loop", "Iterations", "I am a Scenario Loop", "foo.feature", 2, parent=feature
+    )
+    scenario_loop.steps.append(Step(1, "Given I have 1", "foo.feature", 3, scenario_loop, False))
+    scenario_loop.iterations = 2
+    scenario_loop.after_parse()
+    feature.scenarios.append(scenario_loop)
+    scenario_loop.merge_steps({re.compile(r"I have (\d+)"): lambda step, number: None})
+    runner = Runner(hookregistry, release_scenario_steps=release_scenario_steps)
+
+    # when
+    returncode = runner.run_feature(feature)
+
+    # then
+    assert returncode == 0
+    assert [len(s.steps) for s in scenario_loop.scenarios] == [expected_amount_of_steps] * 2
+    assert all(s.state is Step.State.PASSED for s in scenario_loop.scenarios)
+    assert feature.state is Step.State.PASSED
@@ -15,6 +15,16 @@ from radish.scenario import Scenario
 from radish.stepmodel import Step
 
 
+def create_passed_steps(scenario, amount):
+    """
+    Creates the given amount of passed Steps of the given Scenario
+    """
+    steps = [Step(i, "Given I have a step", "foo.feature", i, parent=scenario, runable=True) for i in range(amount)]
+    for step in steps:
+        step.state = Step.State.PASSED
+    return steps
+
+
 def test_creating_simple_scenario():
     """
     Test creating a simple Scenario
@@ -61,13 +71,7 @@ def test_scenario_state(mocker):
         background=None,
     )
     # add Steps to this Scenario
-    scenario.steps.extend(
-        [
-            mocker.MagicMock(state=Step.State.PASSED),
-            mocker.MagicMock(state=Step.State.PASSED),
-            mocker.MagicMock(state=Step.State.PASSED),
-        ]
-    )
+    scenario.steps.extend(create_passed_steps(scenario, 3))
     # get the step to modify
     step = scenario.steps[1]
 
@@ -109,15 +113,9 @@ def test_scenario_state_with_background(mocker):
         background=background,
     )
     # add Steps to this Scenario
-    scenario.steps.extend([mocker.MagicMock(state=Step.State.PASSED)])
+    scenario.steps.extend(create_passed_steps(scenario, 1))
     # add Steps to the background
-    background.steps.extend(
-        [
-            mocker.MagicMock(state=Step.State.PASSED),
-            mocker.MagicMock(state=Step.State.PASSED),
-            mocker.MagicMock(state=Step.State.PASSED),
-        ]
-    )
+    background.steps.extend(create_passed_steps(scenario, 3))
     # get the step to modify
     step = background.steps[1]
 
@@ -355,3 +353,113 @@ def test_scenario_after_parse_logic(mocker):
     assert all(step.as_background for step in background.steps)
     # then - check as_precondition flags
     assert all(step.as_precondition for step in precondition_scenario.steps)
+
+
+def test_scenario_create_precondition_instance():
+    """
+    Test copying a Scenario to use it as precondition
+    """
+    # given
+    nested_precondition = Scenario(1, "Scenario", "I am a nested precondition", "foo.feature", 1, parent=None)
+    nested_precondition.steps.append(Step(1, "I am a nested Step", "foo.feature", 2, nested_precondition, True))
+    nested_precondition.after_parse()
+    scenario = Scenario(
+        2,
+        "Scenario",
+        "I am a Scenario",
+        "foo.feature",
+        3,
+        parent=None,
+        preconditions=[nested_precondition],
+    )
+    scenario.steps.append(Step(2, "I am a Step", "foo.feature", 4, scenario, True))
+    scenario.steps[0].table = [{"foo": "bar"}]
+    scenario.after_parse()
+    scenario.steps[0].state = Step.State.PASSED
+
+    # when
+    precondition = scenario.create_precondition_instance()
+
+    # then
+    assert precondition is not scenario
+    assert [s.sentence for s in precondition.all_steps] == [s.sentence for s in scenario.all_steps]
+    assert all(copied is not s for copied, s in zip(precondition.all_steps, scenario.all_steps))
+    assert all(step.parent is precondition for step in precondition.all_steps)
+    assert precondition.all_steps[0].as_precondition is precondition.preconditions[0]
+    assert precondition.steps[0].table is scenario.steps[0].table
+    assert precondition.steps[0].state is Step.State.UNTESTED
+
+
+def test_step_state_change_resets_cached_states():
+    """
+    Test that a passed Step which changes its state resets the cached states of its Scenario and Feature
+    """
+    # given
+    feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
+    scenario = Scenario(1, "Scenario", "I am a Scenario", "foo.feature", 2, parent=feature, tags=None)
+    feature.scenarios.append(scenario)
+    scenario.steps.extend(create_passed_steps(scenario, 3))
+    assert scenario.state == Step.State.PASSED
+    assert feature.state == Step.State.PASSED
+
+    # when
+    scenario.steps[0].state = Step.State.FAILED
+
+    # then
+    assert scenario.state == Step.State.FAILED
+    assert feature.state == Step.State.FAILED
+
+
+def test_replacing_steps_resets_cached_state():
+    """
+    Test that replacing the Steps of a Scenario resets its cached state
+    """
+    # given
+    scenario = Scenario(1, "Scenario", "I am a Scenario", "foo.feature", 2, parent=None, tags=None)
+    scenario.steps.extend(create_passed_steps(scenario, 3))
+    assert scenario.state == Step.State.PASSED
+
+    # when
+    scenario.steps = [Step(1, "Given I have a step", "foo.feature", 3, parent=scenario, runable=True)]
+
+    # then
+    assert scenario.state == Step.State.UNTESTED
+
+
+def test_release_steps_keeps_state():
+    """
+    Test that a Scenario keeps its state when its Background and Steps are released
+    """
+    # given
+    scenario = Scenario(1, "Scenario", "I am a Scenario", "foo.feature", 2, parent=None, tags=None)
+    scenario.background = Background("Background", "I am a Background", "foo.feature", 1, parent=None)
+    scenario.steps.extend(create_passed_steps(scenario, 3))
+    scenario.steps[1].state = Step.State.FAILED
+
+    # when
+    scenario.release_steps()
+
+    # then
+    assert scenario.state == Step.State.FAILED
+    assert scenario.steps == []
+    assert scenario.background is None
+
+
+def test_custom_attributes_on_models():
+    """
+    Test that custom attributes can be set on Features, Scenarios and Steps
+    """
+    # given
+    feature = Feature(1, "Feature", "I am a feature", "foo.feature", 1, tags=None)
+    scenario = Scenario(1, "Scenario", "I am a Scenario", "foo.feature", 2, parent=feature, tags=None)
+    step = Step(1, "Given I have a step", "foo.feature", 3, parent=scenario, runable=True)
+
+    # when
+    feature.custom = "feature"
+    scenario.custom = "scenario"
+    step.custom = "step"
+
+    # then
+    assert feature.custom == "feature"
+    assert scenario.custom == "scenario"
+    assert step.custom == "step"
@@ -7,6 +7,9 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import re
+
+import radish.scenarioloop
 from radish.background import Background
 from radish.iterationscenario import IterationScenario
 from radish.scenarioloop import ScenarioLoop
@@ -169,3 +172,58 @@ def test_scenarioloop_afterparse_logic(mocker):
     # then - expect 2 built Scenarios
     assert len(scenario_loop.scenarios) == 2
     assert scenario_loop.complete is True
+
+
+def test_merge_scenarioloop_steps(mocker):
+    """
+    Test that the Scenarios of a Scenario Loop are not built when their steps are merged
+    """
+    # given
+    scenario_loop = ScenarioLoop(
+        1, "Scenario Loop", "Iterations", "I am a Scenario Loop", "foo.feature", 1, parent=None
+    )
+    scenario_loop.steps.append(Step(1, "Given I have 1", "foo.feature", 2, scenario_loop, False))
+    scenario_loop.iterations = 2
+    scenario_loop.after_parse()
+
+    def step_func(step, number):
+        pass
+
+    steps = {re.compile(r"I have (\d+)"): step_func}
+    merge_spy = mocker.spy(radish.scenarioloop, "merge_step")
+
+    # when
+    scenario_loop.merge_steps(steps)
+
+    # then
+    assert scenario_loop._scenarios is None
+    # the steps of the iterations have the same sentence as the step of the Scenario Loop itself
+    assert merge_spy.call_count == 1
+
+
+def test_iter_scenarioloop_scenarios():
+    """
+    Test that the Scenarios of a Scenario Loop are built and merged one by one when they are reached
+    """
+    # given
+    scenario_loop = ScenarioLoop(
+        1, "Scenario Loop", "Iterations", "I am a Scenario Loop", "foo.feature", 1, parent=None
+    )
+    scenario_loop.steps.append(Step(1, "Given I have 1", "foo.feature", 2, scenario_loop, False))
+    scenario_loop.iterations = 2
+    scenario_loop.after_parse()
+
+    def step_func(step, number):
+        pass
+
+    scenario_loop.merge_steps({re.compile(r"I have (\d+)"): step_func})
+
+    # when
+    scenarios = scenario_loop.iter_scenarios()
+    first_scenario = next(scenarios)
+
+    # then
+    assert scenario_loop.scenarios == [first_scenario]
+    assert first_scenario.steps[0].definition_func is step_func
+    assert [s.iteration for s in scenarios] == [1]
+    assert list(scenario_loop.iter_scenarios()) == scenario_loop.scenarios
@@ -7,11 +7,15 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import re
+
 import pytest
 
+import radish.scenariooutline
 from radish.background import Background
 from radish.examplescenario import ExampleScenario
-from radish.exceptions import RadishError
+from radish.exceptions import RadishError, StepDefinitionNotFoundError
+from radish.feature import Feature
 from radish.scenariooutline import ScenarioOutline
 from radish.stepmodel import Step
 
@@ -261,3 +265,95 @@ def test_scenariooutline_afterparse_logic(mocker):
     # then - expect 2 built Scenarios
     assert len(scenario_outline.scenarios) == 2
     assert scenario_outline.complete is True
+
+
+def create_scenario_outline_with_examples(rows):
+    """
+    Creates a Scenario Outline in a Feature with a Step and the given amount of Example rows
+    """
+    feature = Feature(1, "Feature", "I am a Feature", "foo.feature", 1)
+    scenario_outline = ScenarioOutline(
+        1, "Scenario Outline", "Examples", "I am a Scenario Outline", "foo.feature", 2, parent=feature
+    )
+    scenario_outline.steps.append(Step(1, "Given I have <foo>", "foo.feature", 3, scenario_outline, False))
+    scenario_outline.examples_header = ["foo"]
+    scenario_outline.examples = [ScenarioOutline.Example([str(x)], "foo.feature", 5 + x) for x in range(rows)]
+    scenario_outline.after_parse()
+    return scenario_outline
+
+
+def test_scenariooutline_scenarios_are_built_lazily():
+    """
+    Test that the Scenarios of a Scenario Outline are built when they are first used
+    """
+    # given
+    scenario_outline = create_scenario_outline_with_examples(3)
+
+    # then - expect the Scenarios not to be built after parsing
+    assert scenario_outline._scenarios is None
+    assert scenario_outline.amount_of_scenarios == 3
+
+    # when
+    scenarios = scenario_outline.scenarios
+
+    # then
+    assert [s.id for s in scenarios] == [2, 3, 4]
+    assert scenario_outline.scenarios is scenarios
+
+
+def test_merge_scenariooutline_steps(mocker):
+    """
+    Test that the Steps of all Example rows are checked without building the Scenarios when their steps are merged
+    """
+    # given
+    scenario_outline = create_scenario_outline_with_examples(2)
+
+    def step_func(step, foo):
+        pass
+
+    steps = {re.compile(r"I have (\d+)"): step_func}
+    merge_spy = mocker.spy(radish.scenariooutline, "merge_step")
+
+    # when
+    scenario_outline.merge_steps(steps)
+
+    # then
+    assert scenario_outline._scenarios is None
+    assert merge_spy.call_count == 2
+
+
+def test_iter_scenariooutline_scenarios():
+    """
+    Test that the Scenarios of a Scenario Outline are built and merged one by one when they are reached
+    """
+    # given
+    scenario_outline = create_scenario_outline_with_examples(2)
+
+    def step_func(step, foo):
+        pass
+
+    scenario_outline.merge_steps({re.compile(r"I have (\d+)"): step_func})
+
+    # when
+    scenarios = scenario_outline.iter_scenarios()
+    first_scenario = next(scenarios)
+
+    # then
+    assert scenario_outline.scenarios == [first_scenario]
+    assert first_scenario.steps[0].definition_func is step_func
+    assert first_scenario.steps[0].argument_match.evaluate() == (("0",), {})
+    assert [s.example.data for s in scenarios] == [["1"]]
+    assert list(scenario_outline.iter_scenarios()) == scenario_outline.scenarios
+
+
+def test_merge_scenariooutline_steps_without_definition():
+    """
+    Test that merging a Scenario Outline fails if the Step of any Example row does not match
+    """
+    # given
+    scenario_outline = create_scenario_outline_with_examples(12)
+
+    # then
+    with pytest.raises(StepDefinitionNotFoundError):
+        # when
+        scenario_outline.merge_steps({re.compile(r"I have (\d)$"): lambda step, foo: None})
@@ -7,6 +7,9 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import asyncio
+import pickle
+
 import pytest
 
 from radish.exceptions import RadishError
@@ -87,6 +90,26 @@ def test_getting_expanded_sentence(mocker):
     assert step.sentence == "I am ${foo} and ${bar} bla"
 
 
+def test_expanded_sentence_is_cached(mocker):
+    """
+    Test that the expanded Step sentence is only calculated again if the sentence changes
+    """
+    # given
+    scenario = mocker.MagicMock(constants=[("foo", "42")])
+    step = Step(1, "I am ${foo}", "foo.feature", 1, parent=scenario, runable=True)
+    sentence = step.expanded_sentence
+    scenario.constants = [("foo", "21")]
+
+    # when
+    cached_sentence = step.expanded_sentence
+    step.sentence = "I am ${foo} again"
+
+    # then
+    assert cached_sentence is sentence
+    assert step.expanded_sentence == "I am 21 again"
+    assert step.context_sensitive_sentence == "I am 21 again"
+
+
 def test_getting_context_sensitive_sentence(mocker):
     """
     Test getting the context sensitive Step sentence
@@ -240,6 +263,22 @@ class StepHelper:
         """
         step.skip()
 
+    @staticmethod
+    async def step_async_func(step, *args, **kwargs):
+        """
+        Helper Step Definition Function which awaits
+        """
+        await asyncio.sleep(0)
+        step.context.awaited = True
+
+    @staticmethod
+    async def step_async_fail_func(step):
+        """
+        Helper Step Definition Function which fails after awaiting
+        """
+        await asyncio.sleep(0)
+        assert False, "failing async step"
+
 
 @pytest.mark.parametrize("debug_or_run", [("run"), ("debug")])
 def test_run_debug_step_function_with_kwargs(debug_or_run, mocker, mock_utils_debugger):
@@ -387,6 +426,94 @@ def test_run_debug_step_function_with_exception(debug_or_run, mocker, mock_utils
     assert step.failure.name == "AssertionError"
 
 
+@pytest.mark.parametrize("debug_or_run", [("run"), ("debug")])
+def test_run_debug_async_step_function(debug_or_run, mocker, mock_utils_debugger):
+    """
+    Test running/debugging a Step with an async function
+    """
+    # given
+    step = Step(
+        1,
+        "I am a Step",
+        "foo.feature",
+        1,
+        parent=mocker.MagicMock(),
+        runable=True,
+        context_class=None,
+    )
+    step.definition_func = StepHelper.step_async_func
+    step.argument_match = mocker.MagicMock()
+    step.argument_match.evaluate.return_value = ((), {})
+
+    # when
+    method = getattr(step, debug_or_run)
+    state = method()
+
+    # then
+    assert state == Step.State.PASSED
+    assert step.context.awaited is True
+
+
+@pytest.mark.parametrize(
+    "definition_func, expected_state",
+    [(StepHelper.step_async_func, Step.State.PASSED), (StepHelper.step_async_fail_func, Step.State.FAILED)],
+    ids=["Async Step passing", "Async Step failing"],
+)
+def test_run_step_on_running_event_loop(definition_func, expected_state, mocker):
+    """
+    Test running a Step with an async function on the running event loop
+    """
+    # given
+    step = Step(
+        1,
+        "I am a Step",
+        "foo.feature",
+        1,
+        parent=mocker.MagicMock(),
+        runable=True,
+        context_class=None,
+    )
+    step.definition_func = definition_func
+    step.argument_match = mocker.MagicMock()
+    step.argument_match.evaluate.return_value = ((), {})
+
+    # when
+    state = asyncio.run(step.run_async())
+
+    # then
+    assert state == step.state == expected_state
+
+
+def test_run_async_step_within_running_event_loop(mocker):
+    """
+    Test that running an async Step within a running event loop fails with a clear error
+    """
+    # given
+    step = Step(
+        1,
+        "I am a Step",
+        "foo.feature",
+        1,
+        parent=mocker.MagicMock(),
+        runable=True,
+        context_class=None,
+    )
+    step.definition_func = StepHelper.step_async_func
+    step.argument_match = mocker.MagicMock()
+    step.argument_match.evaluate.return_value = ((), {})
+
+    async def run_step():
+        return step.run()
+
+    # when
+    state = asyncio.run(run_step())
+
+    # then
+    assert state == Step.State.FAILED
+    assert step.failure.name == "RadishError"
+    assert "await step.behave_like_async(...)" in step.failure.reason
+
+
 def test_skip_a_step():
     """
     Test skipping a Step
@@ -407,3 +534,42 @@ def test_skip_a_step():
 
     # then
     assert step.state == Step.State.SKIPPED
+
+
+def test_step_lists_are_created_lazily():
+    """
+    Test that the optional lists of a Step are only created when they are used
+    """
+    # given
+    step = Step(1, "I am a Step", "foo.feature", 1, parent=None, runable=True)
+
+    # when
+    text = step.text
+    step.raw_text.append("foo")
+
+    # then
+    assert text == ""
+    assert step._table_data is None
+    assert step._table is None
+    assert step._embeddings is None
+    assert step.raw_text == ["foo"]
+
+
+def test_pickle_step():
+    """
+    Test that a pickled Step is restored with its Step.State constant
+    """
+    # given
+    step = Step(1, "I am a Step", "foo.feature", 1, parent=None, runable=True)
+    step.skip()
+    step.embed("foo")
+    step.custom = "bar"
+
+    # when
+    restored = pickle.loads(pickle.dumps(step))
+
+    # then
+    assert restored.sentence == "I am a Step"
+    assert restored.state is Step.State.SKIPPED
+    assert restored.embeddings == step.embeddings
+    assert restored.custom == "bar"
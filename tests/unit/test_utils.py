@@ -7,6 +7,8 @@ Behavior Driven Development tool for Python - the root from red to green
 Copyright: MIT, Timo Furrer <tuxtimo@gmail.com>
 """
 
+import pickle
+import re
 from datetime import datetime, timezone
 from threading import Lock, Thread
 
@@ -111,3 +113,111 @@ def test_singleton_thread_safety():
     first_instance = instances[0]
     for instance in instances:
         assert instance is first_instance
+
+
+def test_close_step_event_loops():
+    """
+    Test that the event loops of all threads are closed and new ones created afterwards
+    """
+    # given
+    loops = []
+    thread = Thread(target=lambda: loops.append(utils.get_step_event_loop()))
+    thread.start()
+    thread.join()
+
+    # when
+    utils.close_step_event_loops()
+
+    # then
+    assert loops[0].is_closed()
+    assert not utils.get_step_event_loop().is_closed()
+
+
+def test_pickling_failure_with_unpicklable_exception():
+    """
+    Test pickling a Failure whose exception cannot be restored from its pickled state
+    """
+
+    # given
+    class CustomError(Exception):
+        def __init__(self, first, second):
+            super().__init__("{} and {}".format(first, second))
+
+    try:
+        raise CustomError("foo", "bar")
+    except CustomError as e:
+        failure = utils.Failure(e)
+
+    # when
+    unpickled_failure = pickle.loads(pickle.dumps(failure))
+
+    # then
+    assert unpickled_failure.reason == "foo and bar"
+    assert unpickled_failure.name == "CustomError"
+    assert str(unpickled_failure.exception) == "foo and bar"
+
+
+def test_perf_counter_to_datetime(mocker):
+    """
+    Test converting a performance counter value to a UTC datetime
+    """
+    # given
+    anchor = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    mocker.patch.object(utils, "_CLOCK_ANCHOR", (anchor, 1000))
+
+    # when
+    converted = utils.perf_counter_to_datetime(1500 + 2 * 10**9)
+
+    # then
+    assert converted == datetime(2020, 1, 1, 0, 0, 2, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "text, values, expected_text",
+    [
+        ("I have no placeholders", {"<foo>": "1"}, "I have no placeholders"),
+        ("I have <foo> and <bar>", {"<foo>": "1", "<bar>": "2"}, "I have 1 and 2"),
+        ("I have <foo> and <foo>", {"<foo>": "1"}, "I have 1 and 1"),
+        ("I have <foo> and <bar>", {"<foo>": "<bar>", "<bar>": "2"}, "I have <bar> and 2"),
+        ("I have <foo> and <baz>", {"<foo>": "1"}, "I have 1 and <baz>"),
+    ],
+    ids=[
+        "Text without placeholders",
+        "Text with placeholders",
+        "Text with repeated placeholder",
+        "Value with placeholder is not replaced",
+        "Placeholder without value is kept",
+    ],
+)
+def test_render_placeholder_template(text, values, expected_text):
+    """
+    Test rendering a text with placeholders
+    """
+    # given
+    template = utils.PlaceholderTemplate(text, re.compile("(<[^>]*>)"))
+
+    # when
+    rendered_text = template.render(values)
+
+    # then
+    assert rendered_text == expected_text
+
+
+@pytest.mark.parametrize(
+    "string, expected_parts",
+    [
+        ("| foo | bar |", ["", " foo ", " bar ", ""]),
+        (r"| foo \| bar | baz |", ["", " foo | bar ", " baz ", ""]),
+        ("foo", ["foo"]),
+    ],
+    ids=["Without escaped delimiter", "With escaped delimiter", "Without delimiter"],
+)
+def test_split_unescape(string, expected_parts):
+    """
+    Test splitting a string by a delimiter which can be escaped
+    """
+    # when
+    parts = utils.split_unescape(string, "|")
+
+    # then
+    assert parts == expected_parts